@@ -0,0 +1,92 @@
+"""
+Benchmark de contenção de escrita no SQLite.
+
+Simula várias instâncias do dashboard escrevendo no mesmo arquivo
+(um processo por instância) e mede a vazão total de escritas.
+
+Uso:
+    python benchmarks/bench_concorrencia.py [--escritas 100] [--processos 1 4 16]
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, SRC_DIR)
+
+import database as db
+
+
+def _escritor(caminho_db: str, escritas: int, inicio, fila) -> None:
+    """Processo escritor: cria projetos e etapas e reporta as falhas."""
+    db.configurar_banco(db.ALVO_ARQUIVO, caminho_db)
+    falhas = 0
+    inicio.wait()
+    for i in range(escritas):
+        try:
+            projeto_id = db.adicionar_projeto(f"Projeto {os.getpid()}-{i}", cliente="Bench")
+            db.adicionar_etapa(projeto_id, f"Etapa {i}", status="em andamento")
+        except Exception:
+            falhas += 1
+    fila.put(falhas)
+
+
+def medir(processos: int, escritas: int) -> dict:
+    """
+    Executa uma rodada com N processos escritores.
+
+    Args:
+        processos: Número de processos escrevendo ao mesmo tempo
+        escritas: Projetos criados por processo (2 transações cada)
+
+    Returns:
+        Dicionário com tempo, vazão e falhas da rodada
+    """
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        caminho_db = os.path.join(tmp, "bench.db")
+        db.configurar_banco(db.ALVO_ARQUIVO, caminho_db)
+        db.inicializar_database()
+
+        inicio = ctx.Event()
+        fila = ctx.Queue()
+        workers = [
+            ctx.Process(target=_escritor, args=(caminho_db, escritas, inicio, fila))
+            for _ in range(processos)
+        ]
+        for w in workers:
+            w.start()
+
+        t0 = time.perf_counter()
+        inicio.set()
+        falhas = sum(fila.get() for _ in workers)
+        for w in workers:
+            w.join()
+        tempo = time.perf_counter() - t0
+
+    transacoes = processos * escritas * 2 - falhas
+    return {
+        "processos": processos,
+        "tempo_s": tempo,
+        "transacoes_s": transacoes / tempo if tempo else 0.0,
+        "falhas": falhas,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de contenção de escrita")
+    parser.add_argument("--escritas", type=int, default=100, help="projetos por processo")
+    parser.add_argument("--processos", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+
+    print(f"{'Processos':>10} {'Tempo (s)':>10} {'Transações/s':>14} {'Falhas':>8}")
+    for n in args.processos:
+        r = medir(n, args.escritas)
+        print(f"{r['processos']:>10} {r['tempo_s']:>10.2f} {r['transacoes_s']:>14.1f} {r['falhas']:>8}")
+
+
+if __name__ == "__main__":
+    main()
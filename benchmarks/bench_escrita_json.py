@@ -0,0 +1,73 @@
+"""
+Benchmark da gravação do dados_projetos.json.
+
+Compara, para um arquivo de ~50 MB, a gravação antiga (open "w" +
+json.dump indentado) com a gravação atômica (temporário + fsync + rename)
+indentada e compacta.
+
+Uso:
+    python benchmarks/bench_escrita_json.py [--projetos 24000] [--repeticoes 3]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), 'src'))
+sys.path.insert(0, BENCH_DIR)
+
+import gerador_dados
+from journal_json import gravar_json_atomico
+
+# ~24 mil projetos sintéticos geram um arquivo de ~50 MB
+PROJETOS_PADRAO = 24_000
+
+
+def gravacao_antiga(caminho: str, dados: dict) -> None:
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(dados, f, indent=4, ensure_ascii=False)
+
+
+def gravacao_atomica_indentada(caminho: str, dados: dict) -> None:
+    gravar_json_atomico(caminho, dados, compacto=False)
+
+
+def gravacao_atomica_compacta(caminho: str, dados: dict) -> None:
+    gravar_json_atomico(caminho, dados, compacto=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de gravação do JSON de projetos")
+    parser.add_argument("--projetos", type=int, default=PROJETOS_PADRAO)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        origem = os.path.join(tmp, "origem.json")
+        gerador_dados.escrever_json(origem, args.projetos)
+        with open(origem, "r", encoding="utf-8") as f:
+            dados = json.load(f)
+
+        print(f"{'Método':<28} {'Mediana (ms)':>14} {'Tamanho (MB)':>14}")
+        for nome, funcao in [
+            ("open('w') + indent=4", gravacao_antiga),
+            ("atômica, indent=4", gravacao_atomica_indentada),
+            ("atômica, compacta", gravacao_atomica_compacta),
+        ]:
+            destino = os.path.join(tmp, "dados_projetos.json")
+            tempos = []
+            for _ in range(args.repeticoes):
+                inicio = time.perf_counter()
+                funcao(destino, dados)
+                tempos.append((time.perf_counter() - inicio) * 1000)
+            tamanho = os.path.getsize(destino) / (1024 * 1024)
+            print(f"{nome:<28} {statistics.median(tempos):>14.1f} {tamanho:>14.1f}")
+            os.remove(destino)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Benchmark de memória dos gráficos do dashboard.
+
+Simula N visitas ao dashboard (os 4 gráficos da tela inicial) e mede o
+RSS do processo ao longo delas, comparando:
+- pyplot: plt.subplots a cada visita, sem plt.close (como era antes)
+- gerenciador: GerenciadorGraficos com os mesmos dados a cada visita
+- gerenciador-edicoes: GerenciadorGraficos com um projeto alterado entre
+  as visitas (redesenho no lugar, sem cache)
+
+Cada modo roda em um processo separado, para que um não afete o RSS do
+outro.
+
+Uso:
+    python benchmarks/bench_graficos.py [--visitas 100] [--projetos 1000]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), 'src'))
+sys.path.insert(0, BENCH_DIR)
+
+MODOS = ["pyplot", "gerenciador", "gerenciador-edicoes"]
+PONTOS = [1, 10, 25, 50, 100]
+
+
+def rss_mb() -> float:
+    """RSS atual do processo (Linux: /proc; nos demais, o pico do getrusage)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except OSError:
+        import resource
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return pico / (1024 * 1024) if sys.platform == "darwin" else pico / 1024
+
+
+def dados_dashboard(catalogo):
+    import graficos
+    metricas = catalogo.metricas()
+    return {
+        "evolucao": graficos.dados_evolucao(metricas),
+        "clientes": graficos.dados_clientes(metricas),
+        "orcamento": graficos.dados_orcamento(metricas),
+        "progresso": graficos.dados_progresso(metricas),
+    }
+
+
+def visita_pyplot(dados) -> None:
+    """Reproduz o código antigo: uma figura nova do pyplot por gráfico."""
+    import matplotlib.pyplot as plt
+    import graficos
+    for chave, valores in dados.items():
+        tamanho, desenhar = graficos.GRAFICOS[chave]
+        fig, ax = plt.subplots(figsize=tamanho, facecolor=graficos.FUNDO)
+        desenhar(ax, {}, valores)
+        plt.tight_layout()
+        fig.canvas.draw()
+
+
+def executar_modo(modo: str, visitas: int, total: int) -> None:
+    import matplotlib
+    matplotlib.use("Agg")
+    import warnings
+    warnings.simplefilter("ignore")  # "More than 20 figures have been opened"
+
+    import gerador_dados
+    import graficos
+    from catalogo_projetos import CatalogoProjetos
+
+    projetos = list(gerador_dados.GeradorDados().projetos(total))
+    catalogo = CatalogoProjetos(projetos)
+    gerenciador = graficos.GerenciadorGraficos()
+
+    inicio = time.perf_counter()
+    for visita in range(1, visitas + 1):
+        if modo == "gerenciador-edicoes":
+            # Uma edição entre as visitas: o maior orçamento muda e o
+            # gráfico de orçamento é redesenhado (no lugar)
+            projeto = dict(projetos[0], orcamento=10_000_000.0 + visita)
+            projetos[0] = projeto
+            catalogo.atualizar(projeto)
+        dados = dados_dashboard(catalogo)
+        if modo == "pyplot":
+            visita_pyplot(dados)
+        else:
+            for chave, valores in dados.items():
+                gerenciador.renderizar(chave, valores)
+        if visita in PONTOS or visita == visitas:
+            print(f"{visita} {rss_mb():.1f}", flush=True)
+    print(f"tempo {(time.perf_counter() - inicio) * 1000 / visitas:.1f}", flush=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de memória dos gráficos do dashboard")
+    parser.add_argument("--visitas", type=int, default=100)
+    parser.add_argument("--projetos", type=int, default=1000)
+    parser.add_argument("--modo", choices=MODOS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.modo:
+        executar_modo(args.modo, args.visitas, args.projetos)
+        return
+
+    print(f"{args.visitas} visitas ao dashboard, {args.projetos} projetos\n")
+    print(f"{'Modo':<22}" + "".join(f"{f'RSS@{p}':>10}" for p in PONTOS if p <= args.visitas)
+          + f"{'ms/visita':>11}")
+    for modo in MODOS:
+        saida = subprocess.run(
+            [sys.executable, __file__, "--modo", modo, "--visitas", str(args.visitas),
+             "--projetos", str(args.projetos)],
+            capture_output=True, text=True, check=True
+        ).stdout.split("\n")
+        rss = {}
+        tempo = 0.0
+        for linha in filter(None, saida):
+            chave, valor = linha.split()
+            if chave == "tempo":
+                tempo = float(valor)
+            else:
+                rss[int(chave)] = float(valor)
+        colunas = "".join(f"{rss[p]:>10.1f}" for p in PONTOS if p in rss)
+        print(f"{modo:<22}{colunas}{tempo:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
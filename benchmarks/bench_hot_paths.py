@@ -0,0 +1,309 @@
+"""
+Benchmark dos caminhos críticos de database, armazenamento e relatorio.
+
+Mede cada caso em vários tamanhos de base (gerados por gerador_dados.py
+em um banco em memória), grava os resultados em JSON e compara com uma
+baseline armazenada, falhando quando a regressão passa do limite.
+
+Uso:
+    python benchmarks/bench_hot_paths.py                      # mede e compara
+    python benchmarks/bench_hot_paths.py --atualizar-baseline # grava a baseline
+    python benchmarks/bench_hot_paths.py --casos database --tamanhos 1000
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), 'src'))
+sys.path.insert(0, BENCH_DIR)
+
+import database as db
+import gerador_dados
+from armazenamento import (TIPO_JSON, TIPO_MEMORIA, TIPO_SQLITE, ArmazenamentoJSON,
+                           ArmazenamentoMemoria, ArmazenamentoSQLite)
+
+BASELINE_PADRAO = os.path.join(BENCH_DIR, 'baseline.json')
+TAMANHOS_PADRAO = [1_000, 10_000]
+REPETICOES_PADRAO = 5
+LIMITE_REGRESSAO = 0.25    # 25% mais lento que a baseline
+OPERACOES_POR_RODADA = 100
+
+
+class Contexto:
+    """Estado compartilhado pelos casos de um mesmo tamanho de base."""
+
+    def __init__(self, tamanho: int, tmp: str):
+        self.tamanho = tamanho
+        self.tmp = tmp
+        self.rng = random.Random(tamanho)
+        self.arquivo_json = os.path.join(tmp, f'dados_projetos_{tamanho}.json')
+        self.projeto_exemplo: Optional[Dict] = None
+        self._armazenamentos: Dict[str, object] = {}
+        self._ids_tabela: Dict[str, List[int]] = {}
+
+    def armazenamento(self, tipo: str):
+        """Armazenamento do tipo pedido com a mesma base (criado na primeira vez)."""
+        if tipo not in self._armazenamentos:
+            if tipo == TIPO_SQLITE:
+                self._armazenamentos[tipo] = ArmazenamentoSQLite()
+            elif tipo == TIPO_JSON:
+                gerador_dados.escrever_json(self.arquivo_json, self.tamanho)
+                self._armazenamentos[tipo] = ArmazenamentoJSON(self.arquivo_json)
+            else:
+                self._armazenamentos[tipo] = ArmazenamentoMemoria(gerador_dados.GeradorDados().projetos(self.tamanho))
+        return self._armazenamentos[tipo]
+
+    def ids_aleatorios(self, quantidade: int) -> List[int]:
+        return [self.rng.randint(1, self.tamanho) for _ in range(quantidade)]
+
+    def ids_existentes(self, tabela: str, quantidade: int) -> List[int]:
+        """IDs sorteados entre as linhas da tabela (lidos na primeira vez)."""
+        if tabela not in self._ids_tabela:
+            with db.get_connection() as conn:
+                self._ids_tabela[tabela] = [row[0] for row in conn.execute(f"SELECT id FROM {tabela}")]
+        return self.rng.choices(self._ids_tabela[tabela], k=quantidade)
+
+
+# -----------------------
+# Casos
+# -----------------------
+
+def caso_listar_projetos(ctx: Contexto) -> None:
+    db.listar_projetos()
+
+
+def caso_buscar_projeto_completo(ctx: Contexto) -> None:
+    for projeto_id in ctx.ids_aleatorios(OPERACOES_POR_RODADA):
+        db.buscar_projeto_completo(projeto_id)
+
+
+def caso_listar_sqlite(ctx: Contexto) -> None:
+    ctx.armazenamento(TIPO_SQLITE).listar_projetos()
+
+
+def caso_listar_json(ctx: Contexto) -> None:
+    # Sem cache: mede a leitura do arquivo, não a consulta ao índice
+    armazenamento = ctx.armazenamento(TIPO_JSON)
+    armazenamento.journal.invalidar_cache()
+    armazenamento.listar_projetos()
+
+
+def caso_listar_memoria(ctx: Contexto) -> None:
+    ctx.armazenamento(TIPO_MEMORIA).listar_projetos()
+
+
+def caso_adicionar(ctx: Contexto) -> None:
+    for i in range(OPERACOES_POR_RODADA):
+        projeto_id = db.adicionar_projeto(f"Bench {i}", cliente="Bench", orcamento=1000.0)
+        db.adicionar_etapa(projeto_id, f"Etapa {i}")
+        db.adicionar_participante(projeto_id, f"Pessoa {i}", cargo="analista")
+
+
+def caso_atualizar(ctx: Contexto) -> None:
+    operacoes = zip(ctx.ids_aleatorios(OPERACOES_POR_RODADA),
+                    ctx.ids_existentes("etapas", OPERACOES_POR_RODADA),
+                    ctx.ids_existentes("participantes", OPERACOES_POR_RODADA))
+    for projeto_id, etapa_id, participante_id in operacoes:
+        db.atualizar_projeto(projeto_id, status="pausado", orcamento=2000.0)
+        db.atualizar_etapa(etapa_id, status="concluído")
+        db.atualizar_participante(participante_id, cargo="gerente")
+
+
+def _projeto_relatorio(ctx: Contexto) -> Dict:
+    """Projeto com mais etapas da base, no formato esperado pelo relatorio."""
+    if ctx.projeto_exemplo is None:
+        with db.get_connection() as conn:
+            projeto_id = conn.execute("""
+                SELECT projeto_id FROM etapas
+                GROUP BY projeto_id ORDER BY COUNT(*) DESC LIMIT 1
+            """).fetchone()[0]
+        projeto = db.buscar_projeto_completo(projeto_id)
+        projeto['pessoas'] = projeto['participantes']
+        ctx.projeto_exemplo = projeto
+    return ctx.projeto_exemplo
+
+
+def _no_diretorio_temporario(ctx: Contexto, funcao: Callable) -> None:
+    """
+    Gera o relatório em um diretório vazio. As funções de relatorio só
+    imprimem os erros: sem arquivo gerado, o caso falha.
+    """
+    saida = os.path.join(ctx.tmp, 'relatorios')
+    shutil.rmtree(saida, ignore_errors=True)
+    os.makedirs(saida)
+    anterior = os.getcwd()
+    os.chdir(saida)
+    try:
+        funcao(_projeto_relatorio(ctx), abrir=False)
+    finally:
+        os.chdir(anterior)
+    if not any(os.path.getsize(os.path.join(saida, nome)) for nome in os.listdir(saida)):
+        raise RuntimeError(f"{funcao.__name__} não gerou nenhum arquivo")
+
+
+def caso_exportar_csv(ctx: Contexto) -> None:
+    import relatorio
+    _no_diretorio_temporario(ctx, relatorio.exportar_csv_projeto)
+
+
+def caso_gerar_pdf(ctx: Contexto) -> None:
+    import relatorio
+    _no_diretorio_temporario(ctx, relatorio.gerar_pdf_projeto)
+
+
+def caso_gerar_grafico(ctx: Contexto) -> None:
+    import relatorio
+    _no_diretorio_temporario(ctx, relatorio.gerar_grafico_barras)
+
+
+# (nome, função) - os casos que alteram a base ficam por último
+CASOS = [
+    ("database.listar_projetos", caso_listar_projetos),
+    ("database.buscar_projeto_completo", caso_buscar_projeto_completo),
+    ("armazenamento.listar_projetos[sqlite]", caso_listar_sqlite),
+    ("armazenamento.listar_projetos[json]", caso_listar_json),
+    ("armazenamento.listar_projetos[memoria]", caso_listar_memoria),
+    ("relatorio.exportar_csv_projeto", caso_exportar_csv),
+    ("relatorio.gerar_pdf_projeto", caso_gerar_pdf),
+    ("relatorio.gerar_grafico_barras", caso_gerar_grafico),
+    ("database.adicionar", caso_adicionar),
+    ("database.atualizar", caso_atualizar),
+]
+
+
+# -----------------------
+# Execução
+# -----------------------
+
+def medir(funcao: Callable, ctx: Contexto, repeticoes: int) -> Dict:
+    """Executa o caso uma vez para aquecer e depois `repeticoes` vezes."""
+    funcao(ctx)
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao(ctx)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return {
+        "mediana_ms": statistics.median(tempos),
+        "min_ms": min(tempos),
+        "max_ms": max(tempos),
+    }
+
+
+def executar(tamanhos: List[int], filtros: List[str], repeticoes: int) -> Dict:
+    """
+    Executa os casos selecionados em cada tamanho de base.
+
+    Returns:
+        Dicionário "caso@tamanho" -> métricas (ou {"erro": mensagem})
+    """
+    resultados = {}
+    casos = [c for c in CASOS if not filtros or any(c[0].startswith(f) for f in filtros)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for tamanho in tamanhos:
+            db.configurar_banco(db.ALVO_MEMORIA)
+            gerador_dados.popular_banco(tamanho)
+            ctx = Contexto(tamanho, tmp)
+
+            for nome, funcao in casos:
+                chave = f"{nome}@{tamanho}"
+                try:
+                    resultados[chave] = medir(funcao, ctx, repeticoes)
+                    print(f"{chave:<50} {resultados[chave]['mediana_ms']:>12.2f} ms")
+                except Exception as e:
+                    resultados[chave] = {"erro": f"{type(e).__name__}: {e}"}
+                    print(f"{chave:<50} {'ERRO':>12}  {resultados[chave]['erro']}")
+
+    db.configurar_banco()
+    return resultados
+
+
+def comparar(resultados: Dict, baseline: Dict, limite: float) -> List[str]:
+    """
+    Compara as medianas com a baseline.
+
+    Returns:
+        Lista de descrições das regressões acima do limite
+    """
+    regressoes = []
+    for chave, atual in resultados.items():
+        base = baseline.get(chave)
+        if not base or "erro" in atual or "erro" in base:
+            continue
+        variacao = atual["mediana_ms"] / base["mediana_ms"] - 1
+        if variacao > limite:
+            regressoes.append(
+                f"{chave}: {base['mediana_ms']:.2f} ms -> {atual['mediana_ms']:.2f} ms "
+                f"(+{variacao * 100:.0f}%)"
+            )
+    return regressoes
+
+
+def ambiente() -> Dict:
+    return {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "sqlite": sqlite3.sqlite_version,
+        "data": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark dos caminhos críticos do ProjetoX")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=TAMANHOS_PADRAO)
+    parser.add_argument("--casos", nargs="*", default=[], help="prefixos dos casos (ex.: database relatorio)")
+    parser.add_argument("--repeticoes", type=int, default=REPETICOES_PADRAO)
+    parser.add_argument("--saida", help="arquivo JSON com os resultados desta execução")
+    parser.add_argument("--baseline", default=BASELINE_PADRAO)
+    parser.add_argument("--limite", type=float, default=LIMITE_REGRESSAO,
+                        help="regressão máxima tolerada (0.25 = 25%%)")
+    parser.add_argument("--atualizar-baseline", action="store_true")
+    args = parser.parse_args()
+
+    resultados = executar(args.tamanhos, args.casos, args.repeticoes)
+    erros = [chave for chave, r in resultados.items() if "erro" in r]
+    documento = {"ambiente": ambiente(), "resultados": resultados}
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(documento, f, indent=4, ensure_ascii=False)
+
+    if args.atualizar_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(documento, f, indent=4, ensure_ascii=False)
+        print(f"Baseline gravada em {args.baseline}")
+        return 1 if erros else 0
+
+    if not os.path.exists(args.baseline):
+        print("Sem baseline para comparar (use --atualizar-baseline).")
+        return 1 if erros else 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)["resultados"]
+
+    regressoes = comparar(resultados, baseline, args.limite)
+    if erros:
+        print(f"\n{len(erros)} caso(s) com erro: {', '.join(erros)}")
+    if regressoes:
+        print(f"\nRegressões acima de {args.limite * 100:.0f}%:")
+        for r in regressoes:
+            print(f"  {r}")
+        return 1
+
+    print(f"\nSem regressões acima de {args.limite * 100:.0f}%.")
+    return 1 if erros else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Benchmark (e teste de regressão) da abertura do dashboard.
+
+Abre src/tela_inicial.py várias vezes com PROJETOX_PERFIL_INICIO=sair (a
+janela fecha logo após a primeira pintura, ver perfil_inicio.py), com um
+banco temporário, e mede o tempo a frio desde o lançamento do processo
+até a primeira pintura. Falha (código de saída 1) quando a mediana passa
+de --limite-ms ou quando matplotlib, fpdf ou PIL foram importados antes
+da primeira pintura.
+
+Precisa de display para o Tk.
+
+Uso:
+    python benchmarks/bench_inicializacao.py [--repeticoes 5] [--limite-ms 2000]
+    python benchmarks/bench_inicializacao.py --importtime   # linha do tempo completa
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Optional, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(BENCH_DIR), 'src')
+DASHBOARD = os.path.join(SRC_DIR, 'tela_inicial.py')
+
+REPETICOES_PADRAO = 5
+LIMITE_MS_PADRAO = 2000
+MARCO_PINTURA = "primeira pintura"
+PREFIXO_PESADOS = "Módulos pesados carregados:"
+
+
+def abrir_uma_vez() -> Tuple[Optional[float], str]:
+    """
+    Abre o dashboard e espera a primeira pintura.
+
+    Returns:
+        (ms do lançamento até a primeira pintura ou None se não chegou lá,
+        saída de erro completa do processo)
+    """
+    ambiente = dict(os.environ, PROJETOX_PERFIL_INICIO="sair", PROJETOX_DB_ALVO="temporario")
+    inicio = time.perf_counter()
+    processo = subprocess.Popen([sys.executable, DASHBOARD], cwd=SRC_DIR, env=ambiente,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                text=True, encoding="utf-8")
+    pintura = None
+    linhas = []
+    for linha in processo.stderr:
+        if pintura is None and MARCO_PINTURA in linha:
+            pintura = (time.perf_counter() - inicio) * 1000
+        linhas.append(linha)
+    processo.wait()
+    return pintura, "".join(linhas)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tempo a frio até a primeira pintura do dashboard")
+    parser.add_argument("--repeticoes", type=int, default=REPETICOES_PADRAO)
+    parser.add_argument("--limite-ms", type=float, default=LIMITE_MS_PADRAO,
+                        help="mediana máxima aceita até a primeira pintura")
+    parser.add_argument("--importtime", action="store_true",
+                        help="imprime a linha do tempo da última abertura")
+    args = parser.parse_args()
+
+    tempos = []
+    saida = ""
+    for _ in range(args.repeticoes):
+        pintura, saida = abrir_uma_vez()
+        if pintura is None:
+            motivo = saida.strip().splitlines()[-1] if saida.strip() else "sem saída"
+            print(f"Não foi possível abrir o dashboard: {motivo}")
+            sys.exit(2)
+        tempos.append(pintura)
+
+    if args.importtime:
+        print(saida)
+
+    mediana = statistics.median(tempos)
+    print(f"Primeira pintura: mediana {mediana:.0f} ms, mínimo {min(tempos):.0f} ms, "
+          f"máximo {max(tempos):.0f} ms ({args.repeticoes} aberturas)")
+
+    falhas = []
+    if mediana > args.limite_ms:
+        falhas.append(f"mediana acima do limite de {args.limite_ms:.0f} ms")
+    pesados = next((linha for linha in saida.splitlines() if linha.startswith(PREFIXO_PESADOS)), "")
+    print(pesados)
+    if pesados and not pesados.endswith("nenhum"):
+        falhas.append("módulos pesados importados antes da primeira pintura")
+
+    if falhas:
+        print("FALHOU: " + "; ".join(falhas))
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
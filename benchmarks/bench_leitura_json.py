@@ -0,0 +1,78 @@
+"""
+Benchmark da leitura do dados_projetos.json.
+
+Compara json.load do arquivo inteiro com a leitura incremental de
+leitor_json: tempo total, tempo até o primeiro projeto e pico de memória
+(medido com tracemalloc em uma passada separada, porque ele deixa a
+leitura mais lenta).
+
+Uso:
+    python benchmarks/bench_leitura_json.py [--projetos 24000]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), 'src'))
+sys.path.insert(0, BENCH_DIR)
+
+import gerador_dados
+from leitor_json import iterar_projetos
+
+PROJETOS_PADRAO = 24_000
+
+
+def leitura_completa(caminho: str):
+    with open(caminho, "r", encoding="utf-8") as f:
+        yield from json.load(f)["projetos"]
+
+
+def leitura_incremental(caminho: str):
+    yield from iterar_projetos(caminho)
+
+
+def medir(funcao, caminho: str) -> dict:
+    inicio = time.perf_counter()
+    primeiro = None
+    total = 0
+    for _ in funcao(caminho):
+        if primeiro is None:
+            primeiro = time.perf_counter() - inicio
+        total += 1
+    tempo = time.perf_counter() - inicio
+
+    # Pico de memória de quem só percorre os projetos (sem guardá-los)
+    tracemalloc.start()
+    for _ in funcao(caminho):
+        pass
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {"total": total, "tempo_ms": tempo * 1000, "primeiro_ms": (primeiro or 0) * 1000,
+            "pico_mb": pico / (1024 * 1024)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de leitura do JSON de projetos")
+    parser.add_argument("--projetos", type=int, default=PROJETOS_PADRAO)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        caminho = os.path.join(tmp, "dados_projetos.json")
+        gerador_dados.escrever_json(caminho, args.projetos)
+        tamanho = os.path.getsize(caminho) / (1024 * 1024)
+        print(f"Arquivo: {args.projetos} projetos, {tamanho:.1f} MB\n")
+
+        print(f"{'Método':<14} {'Total (ms)':>12} {'1º projeto (ms)':>16} {'Pico (MB)':>11}")
+        for nome, funcao in [("json.load", leitura_completa), ("incremental", leitura_incremental)]:
+            r = medir(funcao, caminho)
+            print(f"{nome:<14} {r['tempo_ms']:>12.1f} {r['primeiro_ms']:>16.1f} {r['pico_mb']:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Benchmark de abertura da tela de projetos.
+
+Compara, em bases SQLite de vários tamanhos (gerador_dados.py):
+- tabela-completa: como era com o Tableview, lista todos os projetos (com
+  etapas e participantes), monta as linhas e cria um item do Treeview por
+  projeto
+- tabela-virtual: conta os projetos, busca o primeiro bloco ordenado no
+  banco e cria só os itens das linhas visíveis
+
+Mede também a rolagem até o meio e até o fim da lista, a ordenação por
+nome e a busca (primeiro bloco e contagem, como a thread de busca da
+tabela) de um termo raro e de um comum. Cada medição roda em um processo separado (tempo e pico de RSS); a
+criação dos itens do Treeview só é medida quando há display para o Tk.
+
+Gerar a base de 1M leva alguns minutos: use --cache para reaproveitá-la
+entre execuções.
+
+Uso:
+    python benchmarks/bench_tabela.py [--tamanhos 1000 100000 1000000] [--cache DIR]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), 'src'))
+sys.path.insert(0, BENCH_DIR)
+
+import database as db
+import gerador_dados
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+TAMANHOS_PADRAO = [1_000, 100_000, 1_000_000]
+# A tabela completa por último: na base grande ela esgota a memória e tira
+# as páginas do banco do cache do sistema, o que atrasaria os modos seguintes
+MODOS = ["tabela-virtual", "rolar-meio", "rolar-fim", "ordenar-nome", "buscar-raro",
+         "buscar-comum", "tabela-completa"]
+# Termos buscados: o número de um projeto (poucos resultados) e um tema
+# presente em ~1/12 dos nomes (gerador_dados.TEMAS)
+BUSCAS = {"buscar-raro": "12345", "buscar-comum": "Financeiro"}
+LINHAS_VISIVEIS = 20
+# Igual a tabela_virtual.TAMANHO_BLOCO (não importado: exige ttkbootstrap)
+TAMANHO_BLOCO = 100
+
+
+def pico_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / (1024 * 1024) if sys.platform == "darwin" else pico / 1024
+
+
+def criar_treeview():
+    """Treeview para medir a criação dos itens, ou None sem display."""
+    try:
+        import tkinter as tk
+        from tkinter import ttk
+        raiz = tk.Tk()
+    except Exception:
+        return None
+    raiz.withdraw()
+    return ttk.Treeview(raiz, columns=list(range(6)), show="headings")
+
+
+def preencher(view, linhas) -> None:
+    if view is not None:
+        for linha in linhas:
+            view.insert("", "end", values=linha)
+
+
+def linha_completa(p):
+    """Linha como o Tableview antigo montava (a partir do projeto completo)."""
+    etapas = p.get('etapas', [])
+    concluidas = sum(1 for e in etapas if e.get('status') == 'concluído')
+    progresso = f"{(concluidas / len(etapas)) * 100:.0f}%" if etapas else "0%"
+    return [p['id'], p['nome'], p.get('cliente', 'N/A'), p.get('prazo', 'N/A'),
+            str(len(etapas)), progresso, p.get('status', 'ativo').upper()]
+
+
+def linha_pagina(p):
+    progresso = f"{(p['etapas_concluidas'] / p['total_etapas']) * 100:.0f}%" if p['total_etapas'] else "0%"
+    return [p['nome'], p['cliente'], p['prazo'], str(p['total_etapas']), progresso, p['status'].upper()]
+
+
+def executar_modo(modo: str, banco: str) -> None:
+    from armazenamento import ArmazenamentoSQLite
+
+    db.configurar_banco(db.ALVO_ARQUIVO, banco)
+    armazenamento = ArmazenamentoSQLite()
+    view = criar_treeview()
+
+    inicio = time.perf_counter()
+    if modo == "tabela-completa":
+        preencher(view, [linha_completa(p) for p in armazenamento.listar_projetos()])
+    else:
+        busca = BUSCAS.get(modo, "")
+        total = armazenamento.contar_projetos(busca)
+        # Ordem inicial da tela: mais recentes primeiro
+        ordem, decrescente, posicao = "created_at", True, 0
+        if modo == "rolar-meio":
+            posicao = total // 2
+        elif modo == "rolar-fim":
+            posicao = total - LINHAS_VISIVEIS
+        elif modo == "ordenar-nome":
+            ordem, decrescente = "nome", False
+        bloco = posicao // TAMANHO_BLOCO * TAMANHO_BLOCO
+        pagina = armazenamento.listar_projetos_pagina(bloco, TAMANHO_BLOCO, ordem=ordem,
+                                                      decrescente=decrescente, busca=busca)
+        deslocamento = posicao - bloco
+        preencher(view, [linha_pagina(p) for p in pagina[deslocamento:deslocamento + LINHAS_VISIVEIS]])
+    tempo = (time.perf_counter() - inicio) * 1000
+    print(f"{tempo:.1f} {pico_rss_mb():.1f} {int(view is not None)}")
+
+
+def preparar_banco(diretorio: str, tamanho: int) -> str:
+    """Base SQLite com `tamanho` projetos (reaproveitada se já existir no diretório)."""
+    banco = os.path.join(diretorio, f"projetox_{tamanho}.db")
+    if os.path.exists(banco):
+        db.configurar_banco(db.ALVO_ARQUIVO, banco)
+        db.inicializar_database()  # Cria os índices que faltarem em bases antigas
+        if db.contar_projetos() == tamanho:
+            return banco
+        os.remove(banco)
+    print(f"Gerando base com {tamanho} projetos...", flush=True)
+    db.configurar_banco(db.ALVO_ARQUIVO, banco)
+    gerador_dados.popular_banco(tamanho)
+    return banco
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de abertura da tela de projetos")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=TAMANHOS_PADRAO)
+    parser.add_argument("--cache", help="diretório onde guardar as bases geradas")
+    parser.add_argument("--modo", choices=MODOS, help=argparse.SUPPRESS)
+    parser.add_argument("--banco", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.modo:
+        executar_modo(args.modo, args.banco)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        diretorio = args.cache or tmp
+        os.makedirs(diretorio, exist_ok=True)
+        bancos = {tamanho: preparar_banco(diretorio, tamanho) for tamanho in args.tamanhos}
+        db.configurar_banco()
+
+        print(f"\n{'Projetos':>10}  {'Modo':<18}{'ms':>10}{'pico RSS MB':>14}")
+        com_display = None
+        for tamanho, banco in bancos.items():
+            for modo in MODOS:
+                saida = subprocess.run([sys.executable, __file__, "--modo", modo, "--banco", banco],
+                                       capture_output=True, text=True)
+                if saida.returncode != 0:
+                    motivo = "sem memória" if saida.returncode < 0 else saida.stderr.strip().splitlines()[-1]
+                    print(f"{tamanho:>10}  {modo:<18}{'falhou':>10}  ({motivo})")
+                    continue
+                tempo, rss, display = saida.stdout.split()
+                com_display = display == "1"
+                print(f"{tamanho:>10}  {modo:<18}{float(tempo):>10.1f}{float(rss):>14.1f}")
+        if com_display is False:
+            print("\nSem display: a criação dos itens do Treeview não foi medida.")
+
+
+if __name__ == "__main__":
+    main()
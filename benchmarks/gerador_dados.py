@@ -0,0 +1,225 @@
+"""
+Gerador de dados sintéticos para reproduzir problemas de desempenho.
+
+Produz projetos com distribuições realistas (clientes concentrados,
+mistura de status, quantidade variável de etapas e participantes, datas
+em DD-MM-AAAA e DD/MM/AAAA) de forma determinística a partir de uma seed.
+
+Uso:
+    python benchmarks/gerador_dados.py --preset 100k --saida /tmp/projetox.db
+    python benchmarks/gerador_dados.py --projetos 5000 --json /tmp/dados_projetos.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from itertools import accumulate
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, SRC_DIR)
+
+import database as db
+
+PRESETS = {
+    "1k": 1_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+
+SEED_PADRAO = 42
+TAMANHO_LOTE = 5_000
+
+# Data fixa para que a mesma seed gere sempre os mesmos dados
+DATA_REFERENCIA = datetime(2026, 1, 1)
+
+STATUS_PROJETO = ["ativo", "concluído", "pausado", "cancelado"]
+PESOS_STATUS = [55, 25, 12, 8]
+
+STATUS_ETAPA = ["pendente", "em andamento", "concluído"]
+
+PREFIXOS = ["Sistema", "Portal", "Aplicativo", "Migração", "Análise", "Plataforma",
+            "Integração", "Dashboard", "Automação", "Relatório"]
+TEMAS = ["Financeiro", "de Vendas", "de RH", "Logístico", "de Estoque", "Comercial",
+         "de Atendimento", "de Dados", "Jurídico", "de Marketing", "Fiscal", "de Compras"]
+EMPRESAS = ["Alfa", "Beta", "Gama", "Delta", "Ômega", "Sigma", "Nova", "Prime",
+            "Tech", "Solar", "Vale", "Rio", "Norte", "Sul", "Atlas", "Vértice"]
+SUFIXOS_EMPRESA = ["Ltda", "S.A.", "Tecnologia", "Serviços", "Comércio", "Indústria"]
+NOMES = ["Ana", "Bruno", "Carla", "Diego", "Eduarda", "Felipe", "Gabriela", "Henrique",
+         "Isabela", "João", "Larissa", "Marcos", "Natália", "Otávio", "Paula", "Rafael",
+         "Sofia", "Tiago", "Vanessa", "William"]
+SOBRENOMES = ["Silva", "Souza", "Oliveira", "Santos", "Pereira", "Costa", "Rodrigues",
+              "Almeida", "Nascimento", "Lima", "Araújo", "Ferreira"]
+CARGOS = ["analista", "desenvolvedor", "gerente", "designer", "testador",
+          "arquiteto", "consultor", "estagiário"]
+ETAPAS = ["Levantamento", "Coleta", "Estrutura", "Protótipo", "Desenvolvimento",
+          "Testes", "Homologação", "Implantação", "Treinamento", "Documentação",
+          "Revisão", "Entrega"]
+
+
+class GeradorDados:
+    """Gera projetos sintéticos de forma determinística."""
+
+    def __init__(self, seed: int = SEED_PADRAO, total_clientes: int = 500):
+        self.rng = random.Random(seed)
+        self.clientes = self._gerar_clientes(total_clientes)
+        # Distribuição de Zipf: poucos clientes concentram a maioria dos projetos.
+        # Pesos acumulados pré-calculados (choices refaria a soma a cada chamada)
+        self.acum_clientes = list(accumulate(1 / (i + 1) for i in range(len(self.clientes))))
+        self.acum_status = list(accumulate(PESOS_STATUS))
+        self.acum_status_etapa = list(accumulate([30, 30, 40]))
+        self.acum_participantes = list(accumulate([10, 15, 20, 18, 13, 9, 7, 5, 3]))
+
+    def _gerar_clientes(self, total: int) -> List[str]:
+        clientes = []
+        for i in range(total):
+            empresa = self.rng.choice(EMPRESAS) + self.rng.choice(EMPRESAS).lower()
+            clientes.append(f"{empresa} {self.rng.choice(SUFIXOS_EMPRESA)} {i + 1}")
+        return clientes
+
+    def _data(self, dias_min: int, dias_max: int) -> str:
+        """Data relativa à referência, alternando os formatos aceitos pelo sistema."""
+        data = DATA_REFERENCIA + timedelta(days=self.rng.randint(dias_min, dias_max))
+        separador = "-" if self.rng.random() < 0.6 else "/"
+        return data.strftime(f"%d{separador}%m{separador}%Y")
+
+    def _pessoa(self) -> str:
+        return f"{self.rng.choice(NOMES)} {self.rng.choice(SOBRENOMES)}"
+
+    def _etapas(self, status_projeto: str) -> List[Dict]:
+        # Média ~5 etapas, cauda até 20
+        quantidade = min(20, int(self.rng.expovariate(1 / 5)))
+        etapas = []
+        for i in range(quantidade):
+            if status_projeto == "concluído":
+                status = "concluído"
+            else:
+                status = self.rng.choices(STATUS_ETAPA, cum_weights=self.acum_status_etapa)[0]
+            etapas.append({
+                "nome": f"{self.rng.choice(ETAPAS)} {i + 1}",
+                "descricao": "",
+                "status": status,
+                "prazo": self._data(-180, 365) if self.rng.random() < 0.8 else "",
+                "responsavel": self._pessoa(),
+            })
+        return etapas
+
+    def _participantes(self, etapas: List[Dict]) -> List[Dict]:
+        quantidade = self.rng.choices(range(9), cum_weights=self.acum_participantes)[0]
+        return [{
+            "nome": self._pessoa(),
+            "cargo": self.rng.choice(CARGOS),
+            "etapa": self.rng.choice(etapas)["nome"] if etapas else "",
+            "prazo": self._data(-180, 365) if self.rng.random() < 0.7 else "",
+        } for _ in range(quantidade)]
+
+    def projeto(self, projeto_id: int) -> Dict:
+        """
+        Gera um projeto completo.
+
+        Args:
+            projeto_id: ID atribuído ao projeto
+
+        Returns:
+            Dicionário no formato de database.buscar_projeto_completo
+        """
+        status = self.rng.choices(STATUS_PROJETO, cum_weights=self.acum_status)[0]
+        etapas = self._etapas(status)
+        criado = DATA_REFERENCIA - timedelta(minutes=self.rng.randint(0, 2 * 365 * 24 * 60))
+        return {
+            "id": projeto_id,
+            "nome": f"{self.rng.choice(PREFIXOS)} {self.rng.choice(TEMAS)} {projeto_id}",
+            "cliente": self.rng.choices(self.clientes, cum_weights=self.acum_clientes)[0],
+            "descricao": f"Projeto sintético {projeto_id}",
+            "prazo": self._data(-30, 540) if self.rng.random() < 0.9 else "",
+            # Log-normal: mediana ~R$ 50 mil, poucos projetos milionários
+            "orcamento": round(self.rng.lognormvariate(10.8, 1.0), 2),
+            "status": status,
+            "created_at": criado.strftime("%Y-%m-%d %H:%M:%S"),
+            "etapas": etapas,
+            "participantes": self._participantes(etapas),
+        }
+
+    def projetos(self, total: int, primeiro_id: int = 1) -> Iterator[Dict]:
+        """Gera `total` projetos com IDs sequenciais."""
+        for projeto_id in range(primeiro_id, primeiro_id + total):
+            yield self.projeto(projeto_id)
+
+
+def popular_banco(total: int, seed: int = SEED_PADRAO, lote: int = TAMANHO_LOTE) -> int:
+    """
+    Preenche o banco configurado em database (vazio) com projetos sintéticos.
+
+    Args:
+        total: Número de projetos
+        seed: Seed do gerador
+        lote: Projetos por transação
+
+    Returns:
+        Número de projetos inseridos
+    """
+    db.inicializar_database()
+    gerador = GeradorDados(seed)
+    inseridos = 0
+    buffer = []
+    for projeto in gerador.projetos(total):
+        buffer.append(projeto)
+        if len(buffer) >= lote:
+            inseridos += db.adicionar_projetos_em_lote(buffer)
+            buffer = []
+    if buffer:
+        inseridos += db.adicionar_projetos_em_lote(buffer)
+    return inseridos
+
+
+def escrever_json(caminho: str, total: int, seed: int = SEED_PADRAO) -> None:
+    """
+    Escreve um dados_projetos.json legado (participantes em 'pessoas'),
+    sem montar o documento inteiro na memória.
+
+    Args:
+        caminho: Arquivo de saída
+        total: Número de projetos
+        seed: Seed do gerador
+    """
+    gerador = GeradorDados(seed)
+    with open(caminho, "w", encoding="utf-8") as f:
+        f.write('{\n    "projetos": [\n')
+        for i, projeto in enumerate(gerador.projetos(total)):
+            projeto["pessoas"] = projeto.pop("participantes")
+            del projeto["created_at"]
+            if i:
+                f.write(",\n")
+            f.write(json.dumps(projeto, ensure_ascii=False))
+        f.write('\n    ]\n}\n')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Gerador de dados sintéticos do ProjetoX")
+    tamanho = parser.add_mutually_exclusive_group(required=True)
+    tamanho.add_argument("--preset", choices=sorted(PRESETS))
+    tamanho.add_argument("--projetos", type=int)
+    parser.add_argument("--seed", type=int, default=SEED_PADRAO)
+    destino = parser.add_mutually_exclusive_group(required=True)
+    destino.add_argument("--saida", help="arquivo SQLite a preencher")
+    destino.add_argument("--json", help="arquivo dados_projetos.json a gerar")
+    args = parser.parse_args()
+
+    total = PRESETS[args.preset] if args.preset else args.projetos
+    inicio = time.perf_counter()
+    if args.json:
+        escrever_json(args.json, total, args.seed)
+        destino = args.json
+    else:
+        db.configurar_banco(db.ALVO_ARQUIVO, args.saida)
+        popular_banco(total, args.seed)
+        destino = args.saida
+    tempo = time.perf_counter() - inicio
+    print(f"{total} projetos gerados em {destino} ({tempo:.1f} s, {total / tempo:.0f} projetos/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,495 @@
+"""
+Armazenamento de projetos intercambiável.
+
+Define a interface comum (Armazenamento) e três implementações:
+- ArmazenamentoSQLite: banco SQLite de database.py
+- ArmazenamentoJSON: dados_projetos.json com journal (journal_json.py)
+- ArmazenamentoMemoria: dicionário em memória, sem persistência
+
+A implementação usada pelo aplicativo vem de config.ARMAZENAMENTO
+(variável de ambiente PROJETOX_ARMAZENAMENTO).
+
+Projetos são dicionários com 'etapas' e 'participantes'; 'pessoas' é
+mantido como sinônimo de 'participantes' (nome usado no JSON e nas telas
+antigas).
+"""
+import copy
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Protocol, Tuple
+
+import database as db
+from journal_json import JournalJSON, gravar_json_atomico
+
+try:
+    from config import ARQUIVO_PROJETOS, ARMAZENAMENTO
+except ImportError:
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    ARQUIVO_PROJETOS = os.path.join(os.path.dirname(BASE_DIR), 'data', 'dados_projetos.json')
+    ARMAZENAMENTO = os.environ.get('PROJETOX_ARMAZENAMENTO', 'sqlite')  # Mesmo padrão de config
+
+# Tipos de armazenamento
+TIPO_SQLITE = 'sqlite'
+TIPO_JSON = 'json'
+TIPO_MEMORIA = 'memoria'
+
+
+# Consultada durante as buscas: True interrompe com database.BuscaCancelada
+Cancelada = Callable[[], bool]
+# Projetos filtrados entre uma consulta a `cancelada` e a seguinte
+PASSOS_CANCELAMENTO = 1_000
+
+
+class Armazenamento(Protocol):
+    """Operações sobre projetos, etapas e participantes."""
+
+    tipo: str
+
+    def inicializar(self) -> None: ...
+
+    def listar_projetos(self) -> List[Dict]: ...
+
+    # Com a posição do registro de alterações lida junto (None sem registro)
+    def listar_projetos_com_alteracao(self) -> Tuple[List[Dict], Optional[int]]: ...
+
+    def obter_projeto(self, projeto_id: int) -> Optional[Dict]: ...
+
+    def contar_projetos(self, busca: str = "", cancelada: Optional[Cancelada] = None) -> int: ...
+
+    def listar_projetos_pagina(self, inicio: int, quantidade: int, ordem: str = "created_at",
+                               decrescente: bool = True, busca: str = "",
+                               cancelada: Optional[Cancelada] = None) -> List[Dict]: ...
+
+    def adicionar_projeto(self, nome: str, cliente: str = "", descricao: str = "",
+                          prazo: str = "", orcamento: float = 0.0, status: str = "ativo") -> int: ...
+
+    def adicionar_projetos_em_lote(self, projetos: Iterable[Dict]) -> int: ...
+
+    def atualizar_projeto(self, projeto_id: int, **campos) -> bool: ...
+
+    def excluir_projeto(self, projeto_id: int) -> bool: ...
+
+    def adicionar_etapa(self, projeto_id: int, nome: str, descricao: str = "",
+                        status: str = "em andamento", prazo: str = "", responsavel: str = "") -> bool: ...
+
+    def adicionar_participante(self, projeto_id: int, nome: str, cargo: str = "",
+                               etapa: str = "", prazo: str = "") -> bool: ...
+
+    def atualizar_participante(self, projeto_id: int, nome_atual: str, **campos) -> bool: ...
+
+    def remover_participante(self, projeto_id: int, nome: str) -> bool: ...
+
+
+def _normalizar(projeto: Dict) -> Dict:
+    """Garante 'etapas' e 'participantes' (com 'pessoas' como sinônimo)."""
+    participantes = projeto.get('participantes')
+    if participantes is None:
+        participantes = projeto.setdefault('pessoas', [])
+    projeto['participantes'] = projeto['pessoas'] = participantes
+    projeto.setdefault('etapas', [])
+    return projeto
+
+
+def _com_padroes(projeto: Dict) -> Dict:
+    """Cópia do projeto com os valores padrão das colunas do SQLite."""
+    projeto = _normalizar({"cliente": "", "descricao": "", "prazo": "", "orcamento": 0.0,
+                           "status": "ativo", **projeto})
+    etapas = [{"descricao": "", "status": "em andamento", "prazo": "", "responsavel": "", **e}
+              for e in projeto["etapas"]]
+    participantes = [{"cargo": "", "etapa": "", "prazo": "", **p} for p in projeto["participantes"]]
+    projeto["etapas"] = etapas
+    projeto["participantes"] = projeto["pessoas"] = participantes
+    return projeto
+
+
+def _sem_nulos(campos: Dict) -> Dict:
+    """Campos informados (None significa "não alterar", como em database)."""
+    return {chave: valor for chave, valor in campos.items() if valor is not None}
+
+
+def _prazo_ordenavel(prazo: str) -> str:
+    """DD-MM-AAAA (ou DD/MM/AAAA) como AAAAMMDD, igual a database.PRAZO_ORDENAVEL."""
+    return prazo[6:10] + prazo[3:5] + prazo[0:2]
+
+
+# Chaves de ordenação equivalentes a database.ORDENACOES_PROJETOS
+_ORDENACOES = {
+    "created_at": lambda p: p.get("created_at") or "",
+    "nome": lambda p: (p.get("nome") or "").casefold(),
+    "cliente": lambda p: (p.get("cliente") or "").casefold(),
+    "prazo": lambda p: _prazo_ordenavel(p.get("prazo") or ""),
+    "status": lambda p: p.get("status") or "",
+}
+
+
+def _filtrar(projetos: Iterable[Dict], busca: str, cancelada: Optional[Cancelada] = None) -> List[Dict]:
+    """
+    Projetos cujo nome, cliente ou status contém a busca (mesma regra de
+    database.contem_busca). `cancelada` é consultada a cada
+    PASSOS_CANCELAMENTO projetos.
+    """
+    termo = db.normalizar_busca((busca or "").strip())
+    encontrados = []
+    for posicao, p in enumerate(projetos):
+        if cancelada is not None and posicao % PASSOS_CANCELAMENTO == 0 and cancelada():
+            raise db.BuscaCancelada()
+        if not termo or db.contem_busca(termo, p.get("nome"), p.get("cliente"), p.get("status")):
+            encontrados.append(p)
+    return encontrados
+
+
+def _linha_pagina(projeto: Dict) -> Dict:
+    """Campos de um projeto na lista paginada (como database.listar_projetos_pagina)."""
+    etapas = projeto.get("etapas", [])
+    return {
+        "id": projeto["id"],
+        "nome": projeto.get("nome", ""),
+        "cliente": projeto.get("cliente", ""),
+        "prazo": projeto.get("prazo", ""),
+        "status": projeto.get("status", "ativo"),
+        "total_etapas": len(etapas),
+        "etapas_concluidas": sum(1 for e in etapas if e.get("status") == "concluído"),
+    }
+
+
+# -----------------------
+# SQLite
+# -----------------------
+
+class ArmazenamentoSQLite:
+    """Armazenamento no banco SQLite configurado em database."""
+
+    tipo = TIPO_SQLITE
+
+    def inicializar(self) -> None:
+        db.inicializar_database()
+
+    def listar_projetos(self) -> List[Dict]:
+        return [_normalizar(p) for p in db.listar_projetos()]
+
+    def listar_projetos_com_alteracao(self) -> Tuple[List[Dict], Optional[int]]:
+        projetos, seq = db.listar_projetos_com_alteracao()
+        return [_normalizar(p) for p in projetos], seq
+
+    def obter_projeto(self, projeto_id: int) -> Optional[Dict]:
+        projeto = db.buscar_projeto_completo(projeto_id)
+        return _normalizar(projeto) if projeto else None
+
+    def contar_projetos(self, busca: str = "", cancelada: Optional[Cancelada] = None) -> int:
+        return db.contar_projetos(busca, cancelada=cancelada)
+
+    def listar_projetos_pagina(self, inicio: int, quantidade: int, ordem: str = "created_at",
+                               decrescente: bool = True, busca: str = "",
+                               cancelada: Optional[Cancelada] = None) -> List[Dict]:
+        return db.listar_projetos_pagina(inicio, quantidade, ordem=ordem, decrescente=decrescente,
+                                         busca=busca, cancelada=cancelada)
+
+    def adicionar_projeto(self, nome: str, cliente: str = "", descricao: str = "",
+                          prazo: str = "", orcamento: float = 0.0, status: str = "ativo") -> int:
+        return db.adicionar_projeto(nome, cliente=cliente, descricao=descricao, prazo=prazo,
+                                    orcamento=orcamento, status=status)
+
+    def adicionar_projetos_em_lote(self, projetos: Iterable[Dict]) -> int:
+        return db.adicionar_projetos_em_lote(list(projetos))
+
+    def atualizar_projeto(self, projeto_id: int, **campos) -> bool:
+        return db.atualizar_projeto(projeto_id, **campos)
+
+    def excluir_projeto(self, projeto_id: int) -> bool:
+        return db.excluir_projeto(projeto_id)
+
+    def adicionar_etapa(self, projeto_id: int, nome: str, descricao: str = "",
+                        status: str = "em andamento", prazo: str = "", responsavel: str = "") -> bool:
+        if not db.buscar_projeto(projeto_id):
+            return False
+        db.adicionar_etapa(projeto_id, nome, descricao=descricao, status=status,
+                           prazo=prazo, responsavel=responsavel)
+        return True
+
+    def adicionar_participante(self, projeto_id: int, nome: str, cargo: str = "",
+                               etapa: str = "", prazo: str = "") -> bool:
+        if not db.buscar_projeto(projeto_id):
+            return False
+        db.adicionar_participante(projeto_id, nome, cargo=cargo, etapa=etapa, prazo=prazo)
+        return True
+
+    def atualizar_participante(self, projeto_id: int, nome_atual: str, **campos) -> bool:
+        participante = db.buscar_participante_por_nome(projeto_id, nome_atual)
+        if not participante:
+            return False
+        return db.atualizar_participante(participante["id"], **campos)
+
+    def remover_participante(self, projeto_id: int, nome: str) -> bool:
+        participante = db.buscar_participante_por_nome(projeto_id, nome)
+        if not participante:
+            return False
+        return db.excluir_participante(participante["id"])
+
+
+# -----------------------
+# Dicionários (JSON e memória)
+# -----------------------
+
+class _ArmazenamentoDicionarios(ABC):
+    """
+    Base para os armazenamentos que guardam cada projeto como um
+    dicionário completo: as alterações são feitas em uma cópia do projeto,
+    gravada por inteiro em _gravar (se a gravação falhar, o projeto
+    guardado continua como estava).
+    """
+
+    tipo = ""
+
+    def inicializar(self) -> None:
+        pass
+
+    @abstractmethod
+    def listar_projetos(self) -> List[Dict]: ...
+
+    @abstractmethod
+    def obter_projeto(self, projeto_id: int) -> Optional[Dict]: ...
+
+    def listar_projetos_com_alteracao(self) -> Tuple[List[Dict], Optional[int]]:
+        return self.listar_projetos(), None
+
+    def _projetos_leitura(self) -> List[Dict]:
+        """Projetos só para leitura (contagens, filtros), sem cópias quando possível."""
+        return self.listar_projetos()
+
+    def contar_projetos(self, busca: str = "", cancelada: Optional[Cancelada] = None) -> int:
+        return len(_filtrar(self._projetos_leitura(), busca, cancelada))
+
+    def listar_projetos_pagina(self, inicio: int, quantidade: int, ordem: str = "created_at",
+                               decrescente: bool = True, busca: str = "",
+                               cancelada: Optional[Cancelada] = None) -> List[Dict]:
+        # Sem índices: filtra e ordena a lista toda (bases pequenas)
+        if ordem not in _ORDENACOES:
+            raise ValueError(f"Ordenação inválida: {ordem}")
+        chave = _ORDENACOES[ordem]
+        projetos = sorted(_filtrar(self._projetos_leitura(), busca, cancelada),
+                          key=lambda p: (chave(p), p["id"]), reverse=decrescente)
+        inicio = max(0, inicio)
+        return [_linha_pagina(p) for p in projetos[inicio:inicio + max(0, quantidade)]]
+
+    @abstractmethod
+    def _gravar(self, projeto: Dict) -> None:
+        """Grava o projeto completo (novo ou substituindo o de mesmo ID)."""
+
+    @abstractmethod
+    def _remover(self, projeto_id: int) -> None:
+        """Exclui o projeto guardado."""
+
+    def _copia_para_editar(self, projeto_id: int) -> Optional[Dict]:
+        projeto = self.obter_projeto(projeto_id)
+        return copy.deepcopy(projeto) if projeto is not None else None
+
+    def _proximo_id(self) -> int:
+        return max((p.get("id", 0) for p in self._projetos_leitura()), default=0) + 1
+
+    def adicionar_projeto(self, nome: str, cliente: str = "", descricao: str = "",
+                          prazo: str = "", orcamento: float = 0.0, status: str = "ativo") -> int:
+        projeto_id = self._proximo_id()
+        self._gravar(_normalizar({
+            "id": projeto_id,
+            "nome": nome,
+            "cliente": cliente,
+            "descricao": descricao,
+            "prazo": prazo,
+            "orcamento": orcamento,
+            "status": status,
+            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "pessoas": [],
+            "etapas": []
+        }))
+        return projeto_id
+
+    def adicionar_projetos_em_lote(self, projetos: Iterable[Dict]) -> int:
+        proximo_id = self._proximo_id()
+        inseridos = 0
+        for projeto in projetos:
+            projeto = _com_padroes(projeto)
+            if projeto.get("id") is None:
+                projeto["id"] = proximo_id
+            proximo_id = max(proximo_id, projeto["id"] + 1)
+            self._gravar(projeto)
+            inseridos += 1
+        return inseridos
+
+    def atualizar_projeto(self, projeto_id: int, **campos) -> bool:
+        projeto = self._copia_para_editar(projeto_id)
+        if not projeto:
+            return False
+        projeto.update(_sem_nulos(campos))
+        self._gravar(projeto)
+        return True
+
+    def excluir_projeto(self, projeto_id: int) -> bool:
+        if self.obter_projeto(projeto_id) is None:
+            return False
+        self._remover(projeto_id)
+        return True
+
+    def adicionar_etapa(self, projeto_id: int, nome: str, descricao: str = "",
+                        status: str = "em andamento", prazo: str = "", responsavel: str = "") -> bool:
+        projeto = self._copia_para_editar(projeto_id)
+        if not projeto:
+            return False
+        projeto["etapas"].append({
+            "nome": nome,
+            "descricao": descricao,
+            "status": status,
+            "prazo": prazo,
+            "responsavel": responsavel
+        })
+        self._gravar(projeto)
+        return True
+
+    def adicionar_participante(self, projeto_id: int, nome: str, cargo: str = "",
+                               etapa: str = "", prazo: str = "") -> bool:
+        projeto = self._copia_para_editar(projeto_id)
+        if not projeto:
+            return False
+        projeto["participantes"].append({"nome": nome, "cargo": cargo, "etapa": etapa, "prazo": prazo})
+        self._gravar(projeto)
+        return True
+
+    def atualizar_participante(self, projeto_id: int, nome_atual: str, **campos) -> bool:
+        projeto = self._copia_para_editar(projeto_id)
+        if not projeto:
+            return False
+        participante = next((p for p in projeto["participantes"] if p.get("nome") == nome_atual), None)
+        if not participante:
+            return False
+        participante.update(_sem_nulos(campos))
+        self._gravar(projeto)
+        return True
+
+    def remover_participante(self, projeto_id: int, nome: str) -> bool:
+        projeto = self._copia_para_editar(projeto_id)
+        if not projeto:
+            return False
+        restantes = [p for p in projeto["participantes"] if p.get("nome") != nome]
+        if len(restantes) == len(projeto["participantes"]):
+            return False
+        projeto["participantes"] = projeto["pessoas"] = restantes
+        self._gravar(projeto)
+        return True
+
+
+class ArmazenamentoJSON(_ArmazenamentoDicionarios):
+    """
+    Armazenamento em dados_projetos.json: cada alteração é anexada ao
+    journal e as leituras usam o cache validado do JournalJSON.
+    """
+
+    tipo = TIPO_JSON
+
+    def __init__(self, arquivo: str = ARQUIVO_PROJETOS):
+        self.arquivo = arquivo
+        self.journal = JournalJSON(arquivo)
+
+    @staticmethod
+    def _para_json(projeto: Dict) -> Dict:
+        """Formato do arquivo: participantes só em 'pessoas'."""
+        return {chave: valor for chave, valor in projeto.items() if chave != "participantes"}
+
+    def inicializar(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.arquivo)), exist_ok=True)
+        if not os.path.exists(self.arquivo):
+            gravar_json_atomico(self.arquivo, {"projetos": []})
+
+    def listar_projetos(self) -> List[Dict]:
+        self.inicializar()
+        return [_normalizar(p) for p in self.journal.carregar()["projetos"]]
+
+    def _projetos_leitura(self) -> List[Dict]:
+        self.inicializar()
+        return self.journal.carregar(copiar=False)["projetos"]
+
+    def obter_projeto(self, projeto_id: int) -> Optional[Dict]:
+        projeto = self.journal.obter(projeto_id)
+        return _normalizar(projeto) if projeto else None
+
+    def _gravar(self, projeto: Dict) -> None:
+        self.journal.salvar_projeto(self._para_json(projeto))
+
+    def _remover(self, projeto_id: int) -> None:
+        self.journal.excluir_projeto(projeto_id)
+
+    def adicionar_projetos_em_lote(self, projetos: Iterable[Dict]) -> int:
+        # Um snapshot novo em vez de uma linha de journal (com fsync) por projeto
+        atuais = self.listar_projetos()
+        proximo_id = self._proximo_id()
+        novos = []
+        for projeto in projetos:
+            projeto = _com_padroes(projeto)
+            if projeto.get("id") is None:
+                projeto["id"] = proximo_id
+            proximo_id = max(proximo_id, projeto["id"] + 1)
+            novos.append(projeto)
+        self.substituir(atuais + novos)
+        return len(novos)
+
+    def substituir(self, projetos: List[Dict]) -> None:
+        """
+        Regrava o arquivo inteiro com a lista de projetos informada.
+
+        Args:
+            projetos: Todos os projetos
+        """
+        self.inicializar()
+        self.journal.substituir({"projetos": [self._para_json(p) for p in projetos]})
+
+
+class ArmazenamentoMemoria(_ArmazenamentoDicionarios):
+    """Armazenamento só em memória (testes, benchmarks, modo demonstração)."""
+
+    tipo = TIPO_MEMORIA
+
+    def __init__(self, projetos: Optional[Iterable[Dict]] = None):
+        self._projetos: Dict[int, Dict] = {}
+        if projetos:
+            self.adicionar_projetos_em_lote(projetos)
+
+    # Quem lê recebe cópias (deepcopy mantém 'pessoas' e 'participantes'
+    # como a mesma lista): alterá-las não muda o projeto guardado
+    def listar_projetos(self) -> List[Dict]:
+        return [copy.deepcopy(p) for p in self._projetos.values()]
+
+    def _projetos_leitura(self) -> List[Dict]:
+        return list(self._projetos.values())
+
+    def obter_projeto(self, projeto_id: int) -> Optional[Dict]:
+        projeto = self._projetos.get(projeto_id)
+        return copy.deepcopy(projeto) if projeto is not None else None
+
+    def _gravar(self, projeto: Dict) -> None:
+        self._projetos[projeto["id"]] = projeto
+
+    def _remover(self, projeto_id: int) -> None:
+        del self._projetos[projeto_id]
+
+    def _proximo_id(self) -> int:
+        return max(self._projetos, default=0) + 1
+
+
+def criar_armazenamento(tipo: Optional[str] = None, arquivo: Optional[str] = None) -> Armazenamento:
+    """
+    Cria o armazenamento de projetos.
+
+    Args:
+        tipo: TIPO_SQLITE, TIPO_JSON ou TIPO_MEMORIA (padrão: config.ARMAZENAMENTO)
+        arquivo: Arquivo JSON (apenas para TIPO_JSON; padrão: ARQUIVO_PROJETOS)
+
+    Returns:
+        Armazenamento do tipo pedido
+    """
+    tipo = tipo or ARMAZENAMENTO
+    if tipo == TIPO_SQLITE:
+        return ArmazenamentoSQLite()
+    if tipo == TIPO_JSON:
+        return ArmazenamentoJSON(arquivo or ARQUIVO_PROJETOS)
+    if tipo == TIPO_MEMORIA:
+        return ArmazenamentoMemoria()
+    raise ValueError(f"Tipo de armazenamento inválido: {tipo}")
@@ -1,96 +1,41 @@
-import json
-import os
+"""
+Diálogos de projetos, etapas e participantes.
+
+Camada fina sobre o nucleo: as regras de negócio, as validações e a
+persistência ficam lá (sem dependência de interface); aqui só se monta as
+janelas e se exibe as exceções do núcleo em caixas de mensagem.
+"""
 import customtkinter as ctk
 from tkinter import messagebox, simpledialog
-from typing import Optional, Callable, Dict, List
-
-# Importar configurações e utilitários
-try:
-    from config import ARQUIVO_PROJETOS
-    from utils import validar_nome, validar_data
-    import database as db
-    USE_SQLITE = True
-except ImportError:
-    # Fallback para desenvolvimento
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    ARQUIVO_PROJETOS = os.path.join(os.path.dirname(BASE_DIR), 'data', 'dados_projetos.json')
-    USE_SQLITE = False
-    
-    def validar_nome(nome: str, min_length: int = 2, max_length: int = 100) -> tuple:
-        if not nome or not nome.strip():
-            return False, "O nome não pode estar vazio."
-        nome = nome.strip()
-        if len(nome) < min_length:
-            return False, f"O nome deve ter pelo menos {min_length} caracteres."
-        if len(nome) > max_length:
-            return False, f"O nome deve ter no máximo {max_length} caracteres."
-        return True, ""
-    
-    def validar_data(data: str) -> bool:
-        import re
-        from datetime import datetime
-        if not data:
-            return True
-        padrao = r'^\d{2}[-/]\d{2}[-/]\d{4}$'
-        if not re.match(padrao, data):
-            return False
-        try:
-            dia, mes, ano = re.split(r'[-/]', data)
-            datetime(int(ano), int(mes), int(dia))
-            return True
-        except ValueError:
-            return False
+from typing import Optional, Callable, Dict
+
+import nucleo
+from nucleo import ErroProjetoX, ErroValidacao, gerar_novo_id
 
 # -----------------------
 # Funções de persistência
 # -----------------------
 
 def inicializar_banco() -> None:
-    """Inicializa o banco de dados (SQLite ou JSON)."""
-    if USE_SQLITE:
-        db.inicializar_database()
-    else:
-        os.makedirs(os.path.dirname(ARQUIVO_PROJETOS), exist_ok=True)
-        if not os.path.exists(ARQUIVO_PROJETOS):
-            with open(ARQUIVO_PROJETOS, "w", encoding='utf-8') as f:
-                json.dump({"projetos": []}, f, indent=4, ensure_ascii=False)
+    """Inicializa o armazenamento (tabelas do SQLite ou arquivo JSON)."""
+    nucleo.inicializar()
 
 def carregar_projetos() -> Dict:
     """
-    Carrega todos os projetos (compatível com SQLite e JSON).
+    Carrega todos os projetos.
     
     Returns:
         Dicionário com lista de projetos
     """
-    if USE_SQLITE:
-        try:
-            db.inicializar_database()
-            projetos_list = db.listar_projetos()
-            # Converter para formato compatível com código existente
-            projetos_completos = []
-            for proj in projetos_list:
-                projeto_completo = db.buscar_projeto_completo(proj['id'])
-                if projeto_completo:
-                    projetos_completos.append(projeto_completo)
-            return {"projetos": projetos_completos}
-        except Exception as e:
-            messagebox.showerror("Erro", f"Erro ao carregar projetos do banco: {e}")
-            return {"projetos": []}
-    else:
-        inicializar_banco()
-        try:
-            with open(ARQUIVO_PROJETOS, "r", encoding='utf-8') as f:
-                dados = json.load(f)
-                if not isinstance(dados, dict) or "projetos" not in dados:
-                    return {"projetos": []}
-                return dados
-        except (json.JSONDecodeError, FileNotFoundError) as e:
-            messagebox.showerror("Erro", f"Erro ao carregar projetos: {e}")
-            return {"projetos": []}
+    try:
+        return {"projetos": nucleo.listar_projetos()}
+    except ErroProjetoX as e:
+        messagebox.showerror("Erro", str(e))
+        return {"projetos": []}
 
 def salvar_projetos(dados: Dict) -> bool:
     """
-    Salva os dados dos projetos (compatível com SQLite e JSON).
+    Salva os dados dos projetos.
     
     Args:
         dados: Dicionário com lista de projetos
@@ -98,40 +43,15 @@ def salvar_projetos(dados: Dict) -> bool:
     Returns:
         True se salvou com sucesso, False caso contrário
     """
-    if USE_SQLITE:
-        # No SQLite, os dados já foram salvos diretamente pelas funções específicas
-        return True
-    else:
-        try:
-            os.makedirs(os.path.dirname(ARQUIVO_PROJETOS), exist_ok=True)
-            with open(ARQUIVO_PROJETOS, "w", encoding='utf-8') as f:
-                json.dump(dados, f, indent=4, ensure_ascii=False)
-            return True
-        except Exception as e:
-            messagebox.showerror("Erro", f"Erro ao salvar dados: {e}")
-            return False
+    return _executar(nucleo.substituir_projetos, dados)
 
 # -----------------------
 # Utilitários
 # -----------------------
 
-def gerar_novo_id(dados: Dict) -> int:
-    """
-    Gera um novo ID único para um projeto.
-    
-    Args:
-        dados: Dicionário com lista de projetos
-        
-    Returns:
-        Novo ID único
-    """
-    if not dados.get("projetos"):
-        return 1
-    return max(p.get("id", 0) for p in dados["projetos"]) + 1
-
 def carregar_projeto_por_id(id_projeto: int) -> Optional[Dict]:
     """
-    Carrega um projeto específico pelo ID (compatível com SQLite e JSON).
+    Carrega um projeto específico pelo ID.
     
     Args:
         id_projeto: ID do projeto
@@ -139,17 +59,12 @@ def carregar_projeto_por_id(id_projeto: int) -> Optional[Dict]:
     Returns:
         Dicionário com dados do projeto ou None se não encontrado
     """
-    if USE_SQLITE:
-        try:
-            return db.buscar_projeto_completo(id_projeto)
-        except Exception as e:
-            messagebox.showerror("Erro", f"Erro ao buscar projeto: {e}")
-            return None
-    else:
-        dados = carregar_projetos()
-        for projeto in dados.get("projetos", []):
-            if projeto.get("id") == id_projeto:
-                return projeto
+    try:
+        return nucleo.obter_projeto(id_projeto)
+    except nucleo.ProjetoNaoEncontrado:
+        return None
+    except ErroProjetoX as e:
+        messagebox.showerror("Erro", str(e))
         return None
 
 def criar_label_entry(janela: ctk.CTkToplevel, texto: str, **kwargs) -> ctk.CTkEntry:
@@ -169,6 +84,23 @@ def criar_label_entry(janela: ctk.CTkToplevel, texto: str, **kwargs) -> ctk.CTkE
     entrada.pack(pady=(0, 5))
     return entrada
 
+def _executar(operacao: Callable, *args, **kwargs) -> bool:
+    """
+    Executa uma operação do núcleo exibindo o erro, se houver.
+    
+    Returns:
+        True se a operação foi concluída, False em caso de erro
+    """
+    try:
+        operacao(*args, **kwargs)
+        return True
+    except ErroValidacao as e:
+        messagebox.showwarning("Aviso", str(e))
+        return False
+    except ErroProjetoX as e:
+        messagebox.showerror("Erro", str(e))
+        return False
+
 # -----------------------
 # Interface - Projetos
 # -----------------------
@@ -199,39 +131,11 @@ def adicionar_projeto(janela_pai: ctk.CTk, callback: Optional[Callable] = None)
         nome = entry_nome.get().strip()
         descricao = entry_desc.get().strip()
 
-        # Validações
-        valido, mensagem = validar_nome(nome, min_length=3, max_length=100)
-        if not valido:
-            messagebox.showwarning("Aviso", mensagem)
-            return
-
-        if USE_SQLITE:
-            try:
-                db.adicionar_projeto(nome, descricao)
-                messagebox.showinfo("Sucesso", f"Projeto '{nome}' adicionado com sucesso!")
-                janela.destroy()
-                if callback:
-                    callback()
-            except Exception as e:
-                messagebox.showerror("Erro", f"Não foi possível salvar o projeto: {e}")
-        else:
-            dados = carregar_projetos()
-            novo_projeto = {
-                "id": gerar_novo_id(dados),
-                "nome": nome,
-                "descricao": descricao,
-                "pessoas": [],
-                "etapas": []
-            }
-            dados["projetos"].append(novo_projeto)
-            
-            if salvar_projetos(dados):
-                messagebox.showinfo("Sucesso", f"Projeto '{nome}' adicionado com sucesso!")
-                janela.destroy()
-                if callback:
-                    callback()
-            else:
-                messagebox.showerror("Erro", "Não foi possível salvar o projeto.")
+        if _executar(nucleo.criar_projeto, nome, descricao=descricao):
+            messagebox.showinfo("Sucesso", f"Projeto '{nome}' adicionado com sucesso!")
+            janela.destroy()
+            if callback:
+                callback()
 
     # Botões
     btn_frame = ctk.CTkFrame(janela, fg_color="transparent")
@@ -288,22 +192,7 @@ def editar_projeto(janela_pai: ctk.CTk, id_projeto: int, callback: Optional[Call
         nome = entry_nome.get().strip()
         descricao = entry_desc.get().strip()
         
-        # Validações
-        valido, mensagem = validar_nome(nome, min_length=3, max_length=100)
-        if not valido:
-            messagebox.showwarning("Aviso", mensagem)
-            return
-        
-        projeto["nome"] = nome
-        projeto["descricao"] = descricao
-        
-        dados = carregar_projetos()
-        for i, p in enumerate(dados["projetos"]):
-            if p["id"] == id_projeto:
-                dados["projetos"][i] = projeto
-                break
-        
-        if salvar_projetos(dados):
+        if _executar(nucleo.atualizar_projeto, id_projeto, nome=nome, descricao=descricao):
             messagebox.showinfo("Sucesso", "Projeto atualizado com sucesso!")
             janela.destroy()
             if callback:
@@ -350,10 +239,7 @@ def excluir_projeto(janela_pai: ctk.CTk, id_projeto: int, callback: Optional[Cal
     )
     
     if resposta:
-        dados = carregar_projetos()
-        dados["projetos"] = [p for p in dados["projetos"] if p.get("id") != id_projeto]
-        
-        if salvar_projetos(dados):
+        if _executar(nucleo.excluir_projeto, id_projeto):
             messagebox.showinfo("Sucesso", "Projeto excluído com sucesso!")
             if callback:
                 callback()
@@ -397,18 +283,7 @@ def definir_prazo_geral(janela_pai: ctk.CTk, id_projeto: int, callback: Optional
     def salvar():
         prazo = entry_prazo.get().strip()
         
-        if prazo and not validar_data(prazo):
-            messagebox.showwarning("Aviso", "Data inválida! Use o formato DD-MM-AAAA ou DD/MM/AAAA")
-            return
-        
-        projeto["prazo"] = prazo
-        dados = carregar_projetos()
-        for i, p in enumerate(dados["projetos"]):
-            if p["id"] == id_projeto:
-                dados["projetos"][i] = projeto
-                break
-        
-        if salvar_projetos(dados):
+        if _executar(nucleo.atualizar_projeto, id_projeto, prazo=prazo):
             messagebox.showinfo("Sucesso", "Prazo atualizado com sucesso!")
             janela.destroy()
             if callback:
@@ -439,7 +314,7 @@ def definir_prazo_geral(janela_pai: ctk.CTk, id_projeto: int, callback: Optional
 
 def adicionar_etapa_com_dados(id_projeto: int, nome: str, status: str, prazo: str, responsavel: str) -> bool:
     """
-    Adiciona uma etapa a um projeto específico (compatível com SQLite e JSON).
+    Adiciona uma etapa a um projeto específico.
     
     Args:
         id_projeto: ID do projeto
@@ -449,27 +324,10 @@ def adicionar_etapa_com_dados(id_projeto: int, nome: str, status: str, prazo: st
         responsavel: Responsável pela etapa
         
     Returns:
-        True se adicionou com sucesso, False caso contrário
+        True se adicionou com sucesso, False caso contrário (erro já exibido)
     """
-    if USE_SQLITE:
-        try:
-            db.adicionar_etapa(id_projeto, nome, status, prazo, responsavel)
-            return True
-        except Exception as e:
-            messagebox.showerror("Erro", f"Erro ao adicionar etapa: {e}")
-            return False
-    else:
-        dados = carregar_projetos()
-        for projeto in dados["projetos"]:
-            if projeto.get("id") == id_projeto:
-                projeto.setdefault("etapas", []).append({
-                    "nome": nome,
-                    "status": status,
-                    "prazo": prazo,
-                    "responsavel": responsavel
-                })
-                return salvar_projetos(dados)
-        return False
+    return _executar(nucleo.adicionar_etapa, id_projeto, nome, status=status, prazo=prazo,
+                     responsavel=responsavel)
 
 def janela_adicionar_etapa(janela_pai: ctk.CTk, callback: Optional[Callable] = None) -> None:
     """
@@ -517,24 +375,11 @@ def janela_adicionar_etapa(janela_pai: ctk.CTk, callback: Optional[Callable] = N
         prazo = entry_prazo.get().strip()
         responsavel = entry_responsavel.get().strip()
 
-        # Validações
-        valido, mensagem = validar_nome(nome, min_length=3, max_length=100)
-        if not valido:
-            messagebox.showwarning("Aviso", f"Nome da etapa: {mensagem}")
-            return
-        
-        if prazo and not validar_data(prazo):
-            messagebox.showwarning("Aviso", "Data inválida! Use o formato DD-MM-AAAA ou DD/MM/AAAA")
-            return
-
-        sucesso = adicionar_etapa_com_dados(id_projeto, nome, status, prazo, responsavel)
-        if sucesso:
+        if adicionar_etapa_com_dados(id_projeto, nome, status, prazo, responsavel):
             messagebox.showinfo("Sucesso", "Etapa adicionada com sucesso!")
             janela.destroy()
             if callback:
                 callback()
-        else:
-            messagebox.showerror("Erro", f"Projeto com ID {id_projeto} não encontrado.")
 
     # Botões
     btn_frame = ctk.CTkFrame(janela, fg_color="transparent")
@@ -599,16 +444,6 @@ def adicionar_participante(janela: ctk.CTk, id_projeto: int, callback: Optional[
         cargo = entry_cargo.get().strip()
         etapa = entry_etapa.get().strip()
         prazo = entry_prazo.get().strip()
-        
-        # Validações
-        valido, mensagem = validar_nome(nome, min_length=2, max_length=100)
-        if not valido:
-            messagebox.showwarning("Aviso", f"Nome: {mensagem}")
-            return
-        
-        if prazo and not validar_data(prazo):
-            messagebox.showwarning("Aviso", "Data inválida! Use o formato DD-MM-AAAA ou DD/MM/AAAA")
-            return
 
         pessoa = {
             "nome": nome,
@@ -617,14 +452,7 @@ def adicionar_participante(janela: ctk.CTk, id_projeto: int, callback: Optional[
             "prazo": prazo
         }
 
-        projeto["pessoas"].append(pessoa)
-        dados = carregar_projetos()
-        for i, p in enumerate(dados["projetos"]):
-            if p["id"] == id_projeto:
-                dados["projetos"][i] = projeto
-                break
-        
-        if salvar_projetos(dados):
+        if _executar(nucleo.adicionar_participante, id_projeto, **pessoa):
             messagebox.showinfo("Sucesso", "Participante adicionado!")
             win.destroy()
             if callback:
@@ -738,28 +566,14 @@ def editar_participante(janela: ctk.CTk, id_projeto: int, callback: Optional[Cal
             etapa = entry_etapa.get().strip()
             prazo = entry_prazo.get().strip()
             
-            # Validações
-            valido, mensagem = validar_nome(nome, min_length=2, max_length=100)
-            if not valido:
-                messagebox.showwarning("Aviso", f"Nome: {mensagem}")
-                return
-            
-            if prazo and not validar_data(prazo):
-                messagebox.showwarning("Aviso", "Data inválida! Use o formato DD-MM-AAAA ou DD/MM/AAAA")
-                return
-            
-            participante["nome"] = nome
-            participante["cargo"] = cargo
-            participante["etapa"] = etapa
-            participante["prazo"] = prazo
-            
-            dados = carregar_projetos()
-            for i, p in enumerate(dados["projetos"]):
-                if p["id"] == id_projeto:
-                    dados["projetos"][i] = projeto
-                    break
+            pessoa = {
+                "nome": nome,
+                "cargo": cargo,
+                "etapa": etapa,
+                "prazo": prazo
+            }
             
-            if salvar_projetos(dados):
+            if _executar(nucleo.atualizar_participante, id_projeto, nome_escolhido, **pessoa):
                 messagebox.showinfo("Sucesso", "Participante atualizado!")
                 win.destroy()
                 if callback:
@@ -841,14 +655,7 @@ def remover_participante(janela: ctk.CTk, id_projeto: int, callback: Optional[Ca
         if not resposta:
             return
         
-        projeto["pessoas"] = [p for p in projeto["pessoas"] if p["nome"] != nome_escolhido]
-        dados = carregar_projetos()
-        for i, p in enumerate(dados["projetos"]):
-            if p["id"] == id_projeto:
-                dados["projetos"][i] = projeto
-                break
-        
-        if salvar_projetos(dados):
+        if _executar(nucleo.remover_participante, id_projeto, nome_escolhido):
             messagebox.showinfo("Sucesso", "Participante removido.")
             sel_win.destroy()
             if callback:
@@ -0,0 +1,200 @@
+"""
+Catálogo em memória dos projetos exibidos no dashboard.
+
+Guarda os projetos indexados pelo ID (busca O(1) e sem ambiguidade quando
+dois projetos têm o mesmo nome) e mantém índices secundários por status e
+por cliente, usados nos contadores e gráficos. A ordem de listagem é a do
+armazenamento (mais recentes primeiro). A versão muda a cada alteração e
+indica às telas guardadas se precisam ser atualizadas.
+
+MetricasDashboard reúne tudo o que os cards e gráficos do dashboard
+mostram: as contagens vêm dos índices do catálogo e o resto é calculado
+em uma única passada pelos projetos; o catálogo guarda a última instância
+até a próxima alteração (ver CatalogoProjetos.metricas).
+"""
+import heapq
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Valores assumidos quando o projeto não tem o campo (os mesmos das telas)
+STATUS_PADRAO = 'ativo'
+CLIENTE_PADRAO = 'Sem cliente'
+
+
+def status_do(projeto: Dict) -> str:
+    return projeto.get('status', STATUS_PADRAO)
+
+
+def cliente_do(projeto: Dict) -> str:
+    return projeto.get('cliente', CLIENTE_PADRAO)
+
+
+# Quantos projetos entram nos rankings dos gráficos
+TOP_ORCAMENTOS = 10
+MENOS_AVANCADOS = 10
+
+
+class MetricasDashboard:
+    """
+    Métricas do dashboard.
+
+    As contagens por status e por cliente são as dos índices do catálogo
+    (CatalogoProjetos.contagem_por_status e contagem_por_cliente). Uma
+    única passada pelos projetos calcula os totais de projetos e etapas e,
+    com heapq, os projetos de maior orçamento e os menos avançados, sem
+    ordenar a lista inteira para tirar um top 10. Os rankings seguem a
+    ordem de listagem nos empates, como sorted().
+    """
+
+    def __init__(self, projetos: Iterable[Dict], por_status: Dict[str, int],
+                 por_cliente: Dict[str, int]):
+        self.por_status = por_status
+        self.por_cliente = por_cliente
+        self.total_projetos = 0
+        self.total_etapas = 0
+        self.etapas_concluidas = 0
+        orcamentos: List[Tuple[str, float]] = []
+        progressos: List[Tuple[str, float]] = []
+        for projeto in projetos:
+            self.total_projetos += 1
+            etapas = projeto.get('etapas', [])
+            concluidas = sum(1 for e in etapas if e.get('status') == 'concluído')
+            self.total_etapas += len(etapas)
+            self.etapas_concluidas += concluidas
+            orcamentos.append((projeto['nome'], projeto.get('orcamento', 0)))
+            progressos.append((projeto['nome'], (concluidas / len(etapas)) * 100 if etapas else 0))
+        # ((nome, orçamento), ...) do maior para o menor
+        self.maiores_orcamentos: Tuple[Tuple[str, float], ...] = tuple(
+            heapq.nlargest(TOP_ORCAMENTOS, orcamentos, key=itemgetter(1)))
+        # ((nome, % de etapas concluídas), ...) do menor para o maior
+        self.menos_avancados: Tuple[Tuple[str, float], ...] = tuple(
+            heapq.nsmallest(MENOS_AVANCADOS, progressos, key=itemgetter(1)))
+
+    def projetos_com_status(self, status: str) -> int:
+        return self.por_status.get(status, 0)
+
+    def maiores_clientes(self, quantidade: int) -> List[Tuple[str, int]]:
+        """Os clientes com mais projetos, como [(cliente, total), ...]."""
+        return heapq.nlargest(quantidade, self.por_cliente.items(), key=itemgetter(1))
+
+
+class CatalogoProjetos:
+    """Projetos por ID, com índices por status e por cliente."""
+
+    def __init__(self, projetos: Optional[List[Dict]] = None):
+        # Na ordem inversa da listagem (mais antigos primeiro): um projeto
+        # novo entra no fim do dicionário, sem copiar os demais
+        self._por_id: Dict[int, Dict] = {}
+        self._por_status: Dict[str, Set[int]] = {}
+        self._por_cliente: Dict[str, Set[int]] = {}
+        self._lista: Optional[List[Dict]] = None
+        self._metricas: Optional[MetricasDashboard] = None
+        self._versao_metricas = -1
+        self.versao = 0
+        if projetos:
+            self.carregar(projetos)
+
+    # -----------------------
+    # Carga e alterações
+    # -----------------------
+
+    def carregar(self, projetos: List[Dict]) -> None:
+        """
+        Substitui todo o conteúdo do catálogo.
+
+        Args:
+            projetos: Projetos na ordem de listagem
+        """
+        self._por_status = {}
+        self._por_cliente = {}
+        for projeto in projetos:
+            self._indexar(projeto)
+        self._por_id = {projeto['id']: projeto for projeto in reversed(projetos)}
+        self._lista = None
+        self.versao += 1
+
+    def _indexar(self, projeto: Dict) -> None:
+        self._por_status.setdefault(status_do(projeto), set()).add(projeto['id'])
+        self._por_cliente.setdefault(cliente_do(projeto), set()).add(projeto['id'])
+
+    def _desindexar(self, projeto: Dict) -> None:
+        for indice, chave in ((self._por_status, status_do(projeto)),
+                              (self._por_cliente, cliente_do(projeto))):
+            ids = indice.get(chave)
+            if ids is not None:
+                ids.discard(projeto['id'])
+                if not ids:
+                    del indice[chave]
+
+    def atualizar(self, projeto: Dict) -> None:
+        """
+        Insere ou substitui um projeto (projetos novos vão para o início,
+        como na listagem do armazenamento).
+
+        Args:
+            projeto: Projeto completo, com 'id'
+        """
+        anterior = self._por_id.get(projeto['id'])
+        if anterior is not None:
+            self._desindexar(anterior)
+        self._por_id[projeto['id']] = projeto
+        self._indexar(projeto)
+        self._lista = None
+        self.versao += 1
+
+    def remover(self, projeto_id: int) -> Optional[Dict]:
+        """
+        Remove um projeto do catálogo.
+
+        Returns:
+            O projeto removido ou None se não estava no catálogo
+        """
+        projeto = self._por_id.pop(projeto_id, None)
+        if projeto is not None:
+            self._desindexar(projeto)
+            self._lista = None
+            self.versao += 1
+        return projeto
+
+    # -----------------------
+    # Consultas
+    # -----------------------
+
+    def obter(self, projeto_id: int) -> Optional[Dict]:
+        return self._por_id.get(projeto_id)
+
+    def __contains__(self, projeto_id: int) -> bool:
+        return projeto_id in self._por_id
+
+    def __len__(self) -> int:
+        return len(self._por_id)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return reversed(self._por_id.values())
+
+    @property
+    def projetos(self) -> List[Dict]:
+        """Lista dos projetos na ordem de listagem (reaproveitada até a próxima alteração)."""
+        if self._lista is None:
+            self._lista = list(reversed(self._por_id.values()))
+        return self._lista
+
+    def metricas(self) -> MetricasDashboard:
+        """Métricas do dashboard (recalculadas só quando a versão muda)."""
+        if self._metricas is None or self._versao_metricas != self.versao:
+            self._metricas = MetricasDashboard(self.projetos, self.contagem_por_status(),
+                                               self.contagem_por_cliente())
+            self._versao_metricas = self.versao
+        return self._metricas
+
+    def ids_por_status(self, status: str) -> Set[int]:
+        return self._por_status.get(status, set())
+
+    def ids_por_cliente(self, cliente: str) -> Set[int]:
+        return self._por_cliente.get(cliente, set())
+
+    def contagem_por_status(self) -> Dict[str, int]:
+        return {status: len(ids) for status, ids in self._por_status.items()}
+
+    def contagem_por_cliente(self) -> Dict[str, int]:
+        return {cliente: len(ids) for cliente, ids in self._por_cliente.items()}
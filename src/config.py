@@ -25,7 +25,14 @@ ARQUIVO_PROJETOS = os.path.join(DATA_DIR, 'dados_projetos.json')
 ARQUIVO_USUARIOS = os.path.join(DATA_DIR, 'dados_usuarios.json')
 
 # Banco de dados SQLite
-DB_PATH = os.path.join(DATA_DIR, 'projetox.db')
+# PROJETOX_DB troca o arquivo; PROJETOX_DB_ALVO escolhe o alvo
+# ("arquivo", "memoria" ou "temporario" - ver database.configurar_banco)
+DB_PATH = os.environ.get('PROJETOX_DB', os.path.join(DATA_DIR, 'projetox.db'))
+DB_ALVO = os.environ.get('PROJETOX_DB_ALVO', 'arquivo')
+
+# Armazenamento dos projetos: "sqlite", "json" ou "memoria"
+# (ver armazenamento.criar_armazenamento)
+ARMAZENAMENTO = os.environ.get('PROJETOX_ARMAZENAMENTO', 'sqlite')
 
 # Configurações da aplicação
 APP_TITLE = "ProjetoX - Gerenciador de Projetos"
@@ -2,42 +2,384 @@
 Módulo de gerenciamento do banco de dados SQLite.
 Substitui o sistema de arquivos JSON por um banco relacional.
 """
+import atexit
 import sqlite3
 import json
 import os
-from typing import Optional, List, Dict, Tuple
+import random
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from functools import wraps
+from typing import Callable, Optional, List, Dict, Set, Tuple, Iterable
 from contextlib import contextmanager
 
 try:
-    from config import DATA_DIR
+    from config import DATA_DIR, DB_PATH, DB_ALVO
 except ImportError:
     DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+    DB_PATH = os.path.join(DATA_DIR, 'projetox.db')
+    DB_ALVO = 'arquivo'
 
-# Caminho do banco de dados
-DB_PATH = os.path.join(DATA_DIR, 'projetox.db')
+# Alvos possíveis para o banco de dados
+ALVO_ARQUIVO = 'arquivo'          # Arquivo em disco (DB_PATH)
+ALVO_MEMORIA = 'memoria'          # :memory: compartilhado entre conexões
+ALVO_TEMPORARIO = 'temporario'    # Arquivo em diretório temporário descartável
+
+_alvo = ALVO_ARQUIVO
+_usa_uri = False
+_conexao_memoria: Optional[sqlite3.Connection] = None  # Mantém o banco em memória vivo
+_dir_temporario: Optional[str] = None
+_DB_PATH_PADRAO = DB_PATH
+
+# Coordenação de escrita entre várias instâncias do aplicativo
+BUSY_TIMEOUT = 5.0          # Segundos que o SQLite espera por um lock
+TENTATIVAS_ESCRITA = 8      # Tentativas antes de desistir de uma escrita
+BACKOFF_BASE = 0.05         # Espera inicial entre tentativas (segundos)
+BACKOFF_MAXIMO = 2.0        # Espera máxima entre tentativas (segundos)
+# Espera total de uma escrita (locks e tentativas somados) antes de desistir:
+# as escritas das telas rodam na thread da interface, que fica parada
+# enquanto isso
+TEMPO_MAXIMO_ESCRITA = 5.0
+
+# Prazo (time.monotonic) da escrita em andamento em cada thread
+_escritas = threading.local()
+
+# Linhas alteradas desde a última manutenção e momento da última escrita
+# (consumidos pelo agendador de manutenção em manutencao.py)
+_linhas_alteradas = 0
+_ultima_escrita = 0.0
+
+
+def abrir_conexao(timeout: float = BUSY_TIMEOUT) -> sqlite3.Connection:
+    """
+    Abre uma conexão com o banco atual (quem abre é responsável por fechá-la;
+    para operações avulsas use get_connection).
+    
+    Args:
+        timeout: Segundos que o SQLite espera por um lock
+    
+    Returns:
+        Conexão SQLite em modo autocommit, com linhas acessíveis por nome
+    """
+    conn = sqlite3.connect(DB_PATH, timeout=timeout, isolation_level=None,
+                           uri=_usa_uri, check_same_thread=False)
+    conn.row_factory = sqlite3.Row  # Permite acessar colunas por nome
+    # Desligado por padrão no SQLite: sem ele o ON DELETE CASCADE de etapas
+    # e participantes não vale
+    conn.execute("PRAGMA foreign_keys = ON")
+    # LIKE e o índice de trigramas só ignoram maiúsculas em parte dos
+    # alfabetos; a busca usa a mesma regra dos outros armazenamentos
+    conn.create_function("contem_busca", 4, contem_busca, deterministic=True)
+    return conn
 
 
 @contextmanager
-def get_connection():
+def get_connection(escrita: bool = False):
     """
     Context manager para conexão com o banco de dados.
     Garante que a conexão seja fechada após o uso.
     
+    Args:
+        escrita: Se True, abre a transação com BEGIN IMMEDIATE, reservando
+            o lock de escrita logo no início (evita deadlock entre instâncias
+            que leram antes de escrever)
+    
     Yields:
         Conexão SQLite
     """
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row  # Permite acessar colunas por nome
+    conn = abrir_conexao(_espera_lock())
     try:
+        if escrita:
+            conn.execute("BEGIN IMMEDIATE")
         yield conn
-        conn.commit()
+        if conn.in_transaction:
+            conn.commit()
+        _registrar_alteracoes(conn.total_changes)
     except Exception as e:
-        conn.rollback()
+        if conn.in_transaction:
+            conn.rollback()
         raise e
     finally:
         conn.close()
 
 
+def _liberar_alvo_atual() -> None:
+    """Fecha o banco em memória ou apaga o diretório temporário em uso."""
+    global _conexao_memoria, _dir_temporario
+    if _conexao_memoria is not None:
+        _conexao_memoria.close()
+        _conexao_memoria = None
+    if _dir_temporario is not None:
+        shutil.rmtree(_dir_temporario, ignore_errors=True)
+        _dir_temporario = None
+
+
+def configurar_banco(alvo: str = ALVO_ARQUIVO, caminho: Optional[str] = None) -> str:
+    """
+    Seleciona em tempo de execução onde o banco de dados fica.
+    
+    Args:
+        alvo: ALVO_ARQUIVO, ALVO_MEMORIA ou ALVO_TEMPORARIO
+        caminho: Arquivo do banco (apenas para ALVO_ARQUIVO; padrão é o
+            DB_PATH da configuração)
+        
+    Returns:
+        Caminho (ou URI) efetivo do banco de dados
+    """
+    global DB_PATH, _alvo, _usa_uri, _conexao_memoria, _dir_temporario
+    
+    if alvo not in (ALVO_ARQUIVO, ALVO_MEMORIA, ALVO_TEMPORARIO):
+        raise ValueError(f"Alvo de banco inválido: {alvo}")
+    
+    _liberar_alvo_atual()
+    _usa_uri = False
+    
+    if alvo == ALVO_MEMORIA:
+        # Cache compartilhado: todas as conexões do processo veem o mesmo banco,
+        # que existe enquanto houver ao menos uma conexão aberta
+        DB_PATH = f"file:projetox_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        _usa_uri = True
+        _conexao_memoria = sqlite3.connect(DB_PATH, uri=True, check_same_thread=False)
+    elif alvo == ALVO_TEMPORARIO:
+        _dir_temporario = tempfile.mkdtemp(prefix="projetox_")
+        DB_PATH = os.path.join(_dir_temporario, 'projetox.db')
+    else:
+        DB_PATH = caminho or _DB_PATH_PADRAO
+    
+    _alvo = alvo
+    return DB_PATH
+
+
+atexit.register(_liberar_alvo_atual)
+
+if DB_ALVO != ALVO_ARQUIVO:
+    configurar_banco(DB_ALVO)
+
+
+def alvo_banco() -> str:
+    """
+    Retorna o alvo atual do banco de dados.
+    
+    Returns:
+        ALVO_ARQUIVO, ALVO_MEMORIA ou ALVO_TEMPORARIO
+    """
+    return _alvo
+
+
+def _banco_ocupado(erro: sqlite3.OperationalError) -> bool:
+    """Indica se o erro é de lock mantido por outra conexão/processo."""
+    mensagem = str(erro).lower()
+    return "locked" in mensagem or "busy" in mensagem
+
+
+def _espera_lock() -> float:
+    """Espera por lock de uma conexão nova: BUSY_TIMEOUT, limitado ao prazo da escrita."""
+    prazo = getattr(_escritas, "prazo", None)
+    if prazo is None:
+        return BUSY_TIMEOUT
+    return max(0.0, min(BUSY_TIMEOUT, prazo - time.monotonic()))
+
+
+def _com_retentativa(funcao):
+    """
+    Decorator para funções de escrita: repete a operação quando o banco
+    está bloqueado por outra instância, com backoff exponencial e jitter,
+    até TEMPO_MAXIMO_ESCRITA no total (esperas por lock incluídas).
+    """
+    @wraps(funcao)
+    def wrapper(*args, **kwargs):
+        # Escritas aninhadas seguem o prazo da mais externa
+        externa = getattr(_escritas, "prazo", None) is None
+        if externa:
+            _escritas.prazo = time.monotonic() + TEMPO_MAXIMO_ESCRITA
+        try:
+            for tentativa in range(TENTATIVAS_ESCRITA):
+                try:
+                    return funcao(*args, **kwargs)
+                except sqlite3.OperationalError as e:
+                    restante = _escritas.prazo - time.monotonic()
+                    if (not _banco_ocupado(e) or tentativa == TENTATIVAS_ESCRITA - 1
+                            or restante <= 0):
+                        raise
+                    espera = min(BACKOFF_MAXIMO, BACKOFF_BASE * (2 ** tentativa))
+                    time.sleep(min(random.uniform(0, espera), restante))
+        finally:
+            if externa:
+                _escritas.prazo = None
+    return wrapper
+
+
+def _registrar_alteracoes(quantidade: int) -> None:
+    """
+    Contabiliza linhas alteradas por uma conexão já confirmada.
+    
+    Args:
+        quantidade: Número de linhas inseridas, alteradas ou excluídas
+    """
+    global _linhas_alteradas, _ultima_escrita
+    if quantidade > 0:
+        _linhas_alteradas += quantidade
+        _ultima_escrita = time.monotonic()
+
+
+def linhas_alteradas() -> int:
+    """
+    Retorna o número de linhas alteradas desde a última manutenção.
+    
+    Returns:
+        Quantidade de linhas alteradas neste processo
+    """
+    return _linhas_alteradas
+
+
+def ultima_escrita() -> float:
+    """
+    Retorna o instante (time.monotonic) da última escrita confirmada.
+    
+    Returns:
+        Instante da última escrita ou 0.0 se nada foi escrito
+    """
+    return _ultima_escrita
+
+
+def zerar_linhas_alteradas() -> None:
+    """Zera o contador de linhas alteradas após uma manutenção."""
+    global _linhas_alteradas
+    _linhas_alteradas = 0
+
+
+# Prazo (DD-MM-AAAA ou DD/MM/AAAA) reescrito como AAAAMMDD para ordenar
+# por data; o índice idx_projetos_prazo usa exatamente esta expressão
+PRAZO_ORDENAVEL = "substr(prazo, 7, 4) || substr(prazo, 4, 2) || substr(prazo, 1, 2)"
+
+# Colunas pelas quais a lista paginada de projetos pode ser ordenada
+# (nome da ordenação -> expressão do ORDER BY, todas com índice)
+ORDENACOES_PROJETOS = {
+    "created_at": "created_at",
+    "nome": "nome COLLATE NOCASE",
+    "cliente": "cliente COLLATE NOCASE",
+    "prazo": PRAZO_ORDENAVEL,
+    "status": "status",
+}
+
+# Índices secundários (nome -> DDL)
+INDICES = {
+    "idx_etapas_projeto": """
+        CREATE INDEX IF NOT EXISTS idx_etapas_projeto 
+        ON etapas(projeto_id)
+    """,
+    "idx_participantes_projeto": """
+        CREATE INDEX IF NOT EXISTS idx_participantes_projeto 
+        ON participantes(projeto_id)
+    """,
+    # Ordenações da tabela de projetos (listar_projetos_pagina)
+    "idx_projetos_created_at": """
+        CREATE INDEX IF NOT EXISTS idx_projetos_created_at 
+        ON projetos(created_at)
+    """,
+    "idx_projetos_nome": """
+        CREATE INDEX IF NOT EXISTS idx_projetos_nome 
+        ON projetos(nome COLLATE NOCASE)
+    """,
+    "idx_projetos_cliente": """
+        CREATE INDEX IF NOT EXISTS idx_projetos_cliente 
+        ON projetos(cliente COLLATE NOCASE)
+    """,
+    "idx_projetos_status": """
+        CREATE INDEX IF NOT EXISTS idx_projetos_status 
+        ON projetos(status)
+    """,
+    "idx_projetos_prazo": f"""
+        CREATE INDEX IF NOT EXISTS idx_projetos_prazo 
+        ON projetos({PRAZO_ORDENAVEL})
+    """,
+}
+
+# Índice de busca por trigramas (FTS5, conteúdo externo) sobre nome, cliente
+# e status: acha substrings sem percorrer a tabela de projetos. Os gatilhos
+# o mantêm em dia. Trigramas só valem para buscas de 3 ou mais caracteres,
+# e o índice só pré-seleciona: quem decide se o projeto casa é sempre
+# contem_busca, a mesma regra dos armazenamentos JSON e memória. Sem FTS5
+# ou sem o tokenizador trigram (SQLite < 3.34) a tabela é percorrida.
+TABELA_BUSCA = "projetos_busca"
+BUSCA_MINIMA_INDICE = 3
+GATILHOS_BUSCA = {
+    "projetos_busca_ai": """
+        CREATE TRIGGER IF NOT EXISTS projetos_busca_ai AFTER INSERT ON projetos BEGIN
+            INSERT INTO projetos_busca (rowid, nome, cliente, status)
+            VALUES (new.id, new.nome, new.cliente, new.status);
+        END
+    """,
+    "projetos_busca_ad": """
+        CREATE TRIGGER IF NOT EXISTS projetos_busca_ad AFTER DELETE ON projetos BEGIN
+            INSERT INTO projetos_busca (projetos_busca, rowid, nome, cliente, status)
+            VALUES ('delete', old.id, old.nome, old.cliente, old.status);
+        END
+    """,
+    "projetos_busca_au": """
+        CREATE TRIGGER IF NOT EXISTS projetos_busca_au AFTER UPDATE OF nome, cliente, status
+        ON projetos BEGIN
+            INSERT INTO projetos_busca (projetos_busca, rowid, nome, cliente, status)
+            VALUES ('delete', old.id, old.nome, old.cliente, old.status);
+            INSERT INTO projetos_busca (rowid, nome, cliente, status)
+            VALUES (new.id, new.nome, new.cliente, new.status);
+        END
+    """,
+}
+
+
+def normalizar_busca(texto: Optional[str]) -> str:
+    """Texto como é comparado na busca (minúsculas em qualquer alfabeto)."""
+    return (texto or "").lower()
+
+
+def contem_busca(termo: str, *campos: Optional[str]) -> bool:
+    """
+    Regra única da busca de projetos: algum campo contém o termo, sem
+    diferenciar maiúsculas.
+    
+    Args:
+        termo: Texto procurado, já passado por normalizar_busca
+        *campos: Nome, cliente e status do projeto
+    
+    Returns:
+        True se o projeto casa com a busca
+    """
+    return any(termo in normalizar_busca(campo) for campo in campos)
+
+
+# Registro de alterações: os gatilhos anotam o ID de cada projeto criado,
+# alterado ou excluído (inclusive por mudanças em suas etapas e
+# participantes), para que as outras instâncias releiam só esses projetos
+# (ver observador_alteracoes.py). Um registro sem projeto (NULL) significa
+# "tudo pode ter mudado" (ex.: carga em massa sem os gatilhos). A
+# manutenção guarda só os ALTERACOES_GUARDADAS mais recentes.
+TABELA_ALTERACOES = "alteracoes"
+ALTERACOES_GUARDADAS = 10_000
+GATILHOS_ALTERACOES = {
+    f"alteracoes_{tabela}_{evento[0].lower()}": f"""
+        CREATE TRIGGER IF NOT EXISTS alteracoes_{tabela}_{evento[0].lower()}
+        AFTER {evento} ON {tabela} BEGIN
+            INSERT INTO alteracoes (projeto_id) VALUES ({linha}.{coluna});
+        END
+    """
+    for tabela, coluna in (("projetos", "id"), ("etapas", "projeto_id"),
+                           ("participantes", "projeto_id"))
+    for evento, linha in (("INSERT", "new"), ("UPDATE", "new"), ("DELETE", "old"))
+}
+
+# Instruções da VM do SQLite entre verificações de cancelamento das buscas
+PASSOS_CANCELAMENTO = 10_000
+
+
+class BuscaCancelada(Exception):
+    """Consulta interrompida porque foi substituída por outra mais recente."""
+
+
+@_com_retentativa
 def inicializar_database() -> None:
     """
     Inicializa o banco de dados criando todas as tabelas necessárias.
@@ -47,6 +389,14 @@ def inicializar_database() -> None:
     with get_connection() as conn:
         cursor = conn.cursor()
         
+        # VACUUM incremental (só tem efeito em bancos novos; bancos antigos
+        # são convertidos uma vez por manutencao.converter_auto_vacuum, com
+        # `python src/manutencao.py --converter`)
+        cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        
+        # WAL: leitores não bloqueiam o escritor de outra instância
+        cursor.execute("PRAGMA journal_mode = WAL")
+        
         # Tabela de Projetos
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS projetos (
@@ -102,23 +452,164 @@ def inicializar_database() -> None:
         """)
         
         # Índices para melhor performance
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_etapas_projeto 
-            ON etapas(projeto_id)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_participantes_projeto 
-            ON participantes(projeto_id)
-        """)
+        criar_indices(conn)
         
         conn.commit()
 
 
+def criar_indices(conn: sqlite3.Connection) -> None:
+    """
+    Cria os índices do banco (os que ainda não existem).
+    
+    Args:
+        conn: Conexão aberta
+    """
+    for sql in INDICES.values():
+        conn.execute(sql)
+    _criar_indice_busca(conn)
+    _criar_registro_alteracoes(conn)
+
+
+def _criar_indice_busca(conn: sqlite3.Connection) -> None:
+    """
+    Cria o índice de busca e seus gatilhos. Se os gatilhos não existiam
+    (banco antigo ou após remover_indices), o índice é reconstruído a
+    partir da tabela de projetos.
+    
+    Args:
+        conn: Conexão aberta
+    """
+    try:
+        conn.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {TABELA_BUSCA} USING fts5(
+                nome, cliente, status,
+                content='projetos', content_rowid='id', tokenize='trigram'
+            )
+        """)
+    except sqlite3.OperationalError:
+        return  # SQLite sem FTS5/trigram: a busca percorre a tabela
+    
+    existentes = conn.execute(f"""
+        SELECT COUNT(*) FROM sqlite_master
+        WHERE type = 'trigger' AND name IN ({', '.join('?' * len(GATILHOS_BUSCA))})
+    """, list(GATILHOS_BUSCA)).fetchone()[0]
+    for sql in GATILHOS_BUSCA.values():
+        conn.execute(sql)
+    if existentes < len(GATILHOS_BUSCA):
+        conn.execute(f"INSERT INTO {TABELA_BUSCA} ({TABELA_BUSCA}) VALUES ('rebuild')")
+
+
+def _criar_registro_alteracoes(conn: sqlite3.Connection) -> None:
+    """
+    Cria o registro de alterações e seus gatilhos. Se os gatilhos não
+    existiam, as alterações feitas sem eles são desconhecidas e o registro
+    ganha uma entrada sem projeto (as outras instâncias recarregam tudo).
+    
+    Args:
+        conn: Conexão aberta
+    """
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {TABELA_ALTERACOES} (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            projeto_id INTEGER
+        )
+    """)
+    existentes = conn.execute(f"""
+        SELECT COUNT(*) FROM sqlite_master
+        WHERE type = 'trigger' AND name IN ({', '.join('?' * len(GATILHOS_ALTERACOES))})
+    """, list(GATILHOS_ALTERACOES)).fetchone()[0]
+    for sql in GATILHOS_ALTERACOES.values():
+        conn.execute(sql)
+    if existentes < len(GATILHOS_ALTERACOES):
+        conn.execute(f"INSERT INTO {TABELA_ALTERACOES} (projeto_id) VALUES (NULL)")
+
+
+def remover_indices(conn: sqlite3.Connection) -> None:
+    """
+    Remove os índices do banco, para cargas em massa (recriar depois com
+    criar_indices, o que é mais rápido que mantê-los durante a carga).
+    
+    Args:
+        conn: Conexão aberta
+    """
+    for nome in INDICES:
+        conn.execute(f"DROP INDEX IF EXISTS {nome}")
+    # Sem os gatilhos o índice de busca para de ser atualizado; criar_indices
+    # o reconstrói de uma vez
+    for nome in GATILHOS_BUSCA:
+        conn.execute(f"DROP TRIGGER IF EXISTS {nome}")
+    # Nem o registro de alterações: criar_indices avisa as outras instâncias
+    # para recarregarem tudo
+    for nome in GATILHOS_ALTERACOES:
+        conn.execute(f"DROP TRIGGER IF EXISTS {nome}")
+
+
+def ultima_alteracao(conn: sqlite3.Connection) -> int:
+    """
+    Retorna a posição da alteração mais recente no registro.
+    
+    Args:
+        conn: Conexão aberta
+    
+    Returns:
+        Número de sequência da última alteração (0 se o registro está vazio)
+    """
+    return conn.execute(f"SELECT COALESCE(MAX(seq), 0) FROM {TABELA_ALTERACOES}").fetchone()[0]
+
+
+def projetos_alterados_desde(conn: sqlite3.Connection, seq: int,
+                             limite: int) -> Tuple[int, Optional[Set[int]]]:
+    """
+    Lista os projetos alterados depois de uma posição do registro.
+    
+    Args:
+        conn: Conexão aberta
+        seq: Última alteração já vista (retorno anterior desta função ou
+            de ultima_alteracao)
+        limite: Máximo de projetos; acima dele vale mais recarregar tudo
+    
+    Returns:
+        (posição da última alteração, IDs dos projetos alterados). Os IDs
+        são None quando é preciso recarregar tudo: mais de `limite`
+        projetos, uma alteração sem projeto ou alterações já podadas
+    """
+    ultima = ultima_alteracao(conn)
+    if ultima <= seq:
+        return seq, set()
+    primeira = conn.execute(f"SELECT MIN(seq) FROM {TABELA_ALTERACOES}").fetchone()[0]
+    if primeira > seq + 1:
+        return ultima, None
+    ids = {linha[0] for linha in conn.execute(f"""
+        SELECT DISTINCT projeto_id FROM {TABELA_ALTERACOES}
+        WHERE seq > ? AND seq <= ? LIMIT ?
+    """, (seq, ultima, limite + 1))}
+    if len(ids) > limite or None in ids:
+        return ultima, None
+    return ultima, ids
+
+
+def podar_alteracoes(conn: sqlite3.Connection, manter: int = ALTERACOES_GUARDADAS) -> int:
+    """
+    Descarta as alterações antigas do registro.
+    
+    Args:
+        conn: Conexão aberta
+        manter: Quantas alterações recentes guardar
+    
+    Returns:
+        Número de alterações descartadas
+    """
+    return conn.execute(f"""
+        DELETE FROM {TABELA_ALTERACOES}
+        WHERE seq <= (SELECT MAX(seq) FROM {TABELA_ALTERACOES}) - ?
+    """, (manter,)).rowcount
+
+
 # =========================
 # FUNÇÕES DE PROJETOS
 # =========================
 
+@_com_retentativa
 def adicionar_projeto(nome: str, cliente: str = "", descricao: str = "", 
                      prazo: str = "", orcamento: float = 0.0, status: str = "ativo") -> int:
     """
@@ -135,7 +626,7 @@ def adicionar_projeto(nome: str, cliente: str = "", descricao: str = "",
     Returns:
         ID do projeto criado
     """
-    with get_connection() as conn:
+    with get_connection(escrita=True) as conn:
         cursor = conn.cursor()
         cursor.execute("""
             INSERT INTO projetos (nome, cliente, descricao, prazo, orcamento, status)
@@ -167,6 +658,61 @@ def buscar_projeto(projeto_id: int) -> Optional[Dict]:
         return None
 
 
+def _anexar_relacionados(conn: sqlite3.Connection, projetos: List[Dict],
+                         todos: bool = False) -> None:
+    """
+    Preenche 'etapas' e 'participantes' de vários projetos com uma consulta
+    por tabela (em vez de duas consultas por projeto).
+    
+    Args:
+        conn: Conexão aberta
+        projetos: Projetos a completar (alterados no lugar)
+        todos: True quando `projetos` contém todos os projetos do banco,
+            dispensando o filtro por ID
+    """
+    por_id = {}
+    for projeto in projetos:
+        projeto['etapas'] = []
+        projeto['participantes'] = []
+        por_id[projeto['id']] = projeto
+    
+    if not por_id:
+        return
+    
+    if todos:
+        filtros = [("", ())]
+    else:
+        # Respeitar o limite de parâmetros do SQLite
+        ids = list(por_id)
+        filtros = [
+            (f"WHERE projeto_id IN ({', '.join('?' * len(bloco))})", tuple(bloco))
+            for bloco in (ids[i:i + 500] for i in range(0, len(ids), 500))
+        ]
+    
+    # Linhas de projetos que não estão na lista são ignoradas (órfãs de
+    # bancos em que a exclusão não levava as etapas e participantes)
+    for filtro, params in filtros:
+        for row in conn.execute(f"""
+            SELECT id, projeto_id, nome, descricao, status, prazo, responsavel, created_at
+            FROM etapas {filtro}
+            ORDER BY created_at, id
+        """, params):
+            projeto = por_id.get(row['projeto_id'])
+            if projeto is not None:
+                projeto['etapas'].append(dict(row))
+        
+        for row in conn.execute(f"""
+            SELECT id, projeto_id, nome, cargo, etapa, prazo
+            FROM participantes {filtro}
+            ORDER BY id
+        """, params):
+            projeto = por_id.get(row['projeto_id'])
+            if projeto is not None:
+                participante = dict(row)
+                del participante['projeto_id']
+                projeto['participantes'].append(participante)
+
+
 def buscar_projeto_completo(projeto_id: int) -> Optional[Dict]:
     """
     Busca um projeto com todas suas etapas e participantes.
@@ -177,14 +723,19 @@ def buscar_projeto_completo(projeto_id: int) -> Optional[Dict]:
     Returns:
         Dicionário completo com projeto, etapas e participantes
     """
-    projeto = buscar_projeto(projeto_id)
-    if not projeto:
-        return None
-    
-    projeto['etapas'] = listar_etapas(projeto_id)
-    projeto['participantes'] = listar_participantes(projeto_id)
-    
-    return projeto
+    with get_connection() as conn:
+        # Uma transação de leitura: projeto, etapas e participantes do mesmo instante
+        conn.execute("BEGIN")
+        row = conn.execute("""
+            SELECT id, nome, cliente, descricao, prazo, orcamento, status, created_at, updated_at
+            FROM projetos WHERE id = ?
+        """, (projeto_id,)).fetchone()
+        if not row:
+            return None
+        
+        projeto = dict(row)
+        _anexar_relacionados(conn, [projeto])
+        return projeto
 
 
 def listar_projetos() -> List[Dict]:
@@ -194,7 +745,24 @@ def listar_projetos() -> List[Dict]:
     Returns:
         Lista de dicionários com dados dos projetos
     """
+    return listar_projetos_com_alteracao()[0]
+
+
+def listar_projetos_com_alteracao() -> Tuple[List[Dict], int]:
+    """
+    Lista todos os projetos (como listar_projetos) e a posição da última
+    alteração no registro, lidas na mesma transação: a lista reflete
+    exatamente as alterações até essa posição, e as seguintes são as que
+    projetos_alterados_desde informar a partir dela.
+    
+    Returns:
+        (projetos, seq da última alteração)
+    """
     with get_connection() as conn:
+        # Uma transação de leitura: as etapas e participantes são do mesmo
+        # instante que a lista de projetos (sem as de projetos criados por
+        # outra instância entre as consultas)
+        conn.execute("BEGIN")
         cursor = conn.cursor()
         cursor.execute("""
             SELECT id, nome, cliente, descricao, prazo, orcamento, status, created_at, updated_at
@@ -204,14 +772,133 @@ def listar_projetos() -> List[Dict]:
         
         projetos = [dict(row) for row in cursor.fetchall()]
         
-        # Adicionar etapas e participantes a cada projeto
-        for projeto in projetos:
-            projeto['etapas'] = listar_etapas(projeto['id'])
-            projeto['participantes'] = listar_participantes(projeto['id'])
+        # Adicionar etapas e participantes (uma consulta por tabela)
+        _anexar_relacionados(conn, projetos, todos=True)
+        
+        return projetos, ultima_alteracao(conn)
+
+
+def _tem_indice_busca(conn: sqlite3.Connection) -> bool:
+    """Indica se o banco tem o índice de busca por trigramas."""
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                        (TABELA_BUSCA,)).fetchone() is not None
+
+
+def _filtro_busca(conn: sqlite3.Connection, busca: str) -> Tuple[str, tuple]:
+    """
+    Cláusula WHERE (e parâmetros) da busca por nome, cliente ou status:
+    contem_busca decide, e o índice de trigramas, quando possível, evita
+    percorrer a tabela.
+    """
+    termo = normalizar_busca((busca or "").strip())
+    if not termo:
+        return "", ()
+    filtro, params = "WHERE contem_busca(?, nome, cliente, status)", (termo,)
+    if len(termo) >= BUSCA_MINIMA_INDICE and _tem_indice_busca(conn):
+        # Entre aspas, o texto inteiro é uma frase: casa como substring
+        frase = '"' + termo.replace('"', '""') + '"'
+        filtro += f" AND id IN (SELECT rowid FROM {TABELA_BUSCA} WHERE {TABELA_BUSCA} MATCH ?)"
+        params += (frase,)
+    return filtro, params
+
+
+@contextmanager
+def _cancelavel(conn: sqlite3.Connection, cancelada: Optional[Callable[[], bool]]):
+    """
+    Interrompe as consultas da conexão assim que `cancelada()` retornar
+    True (verificado a cada PASSOS_CANCELAMENTO instruções), levantando
+    BuscaCancelada.
+    """
+    if cancelada is None:
+        yield
+        return
+    if cancelada():
+        raise BuscaCancelada()
+    conn.set_progress_handler(cancelada, PASSOS_CANCELAMENTO)
+    try:
+        yield
+    except sqlite3.OperationalError:
+        if cancelada():
+            raise BuscaCancelada() from None
+        raise
+    finally:
+        conn.set_progress_handler(None, 0)
+
+
+def contar_projetos(busca: str = "", cancelada: Optional[Callable[[], bool]] = None) -> int:
+    """
+    Conta os projetos (opcionalmente só os que casam com a busca).
+    
+    Args:
+        busca: Texto procurado no nome, cliente ou status (vazio = todos)
+        cancelada: Função consultada durante a contagem; quando retorna
+            True, a contagem é interrompida com BuscaCancelada
+        
+    Returns:
+        Número de projetos
+    """
+    with get_connection() as conn, _cancelavel(conn, cancelada):
+        filtro, params = _filtro_busca(conn, busca)
+        return conn.execute(f"SELECT COUNT(*) FROM projetos {filtro}", params).fetchone()[0]
+
+
+def listar_projetos_pagina(inicio: int, quantidade: int, ordem: str = "created_at",
+                           decrescente: bool = True, busca: str = "",
+                           cancelada: Optional[Callable[[], bool]] = None) -> List[Dict]:
+    """
+    Lista uma página de projetos para a tabela, sem etapas e participantes
+    (só as contagens de etapas, para o progresso).
+    
+    A ordenação e a busca são feitas pelo banco, e o ID desempata a ordem
+    para que as páginas não se sobreponham. Os IDs da página são obtidos
+    primeiro, só pelo índice da ordenação (o OFFSET pula entradas do
+    índice sem ler as linhas), e depois as linhas desses IDs, na mesma
+    transação de leitura (um projeto excluído por outra instância entre as
+    duas consultas não falta na segunda).
+    
+    Args:
+        inicio: Posição do primeiro projeto da página (0 = primeiro)
+        quantidade: Número máximo de projetos (algumas centenas, no máximo:
+            os IDs viram parâmetros da segunda consulta)
+        ordem: Chave de ORDENACOES_PROJETOS
+        decrescente: Ordem decrescente
+        busca: Texto procurado no nome, cliente ou status (vazio = todos)
+        cancelada: Função consultada durante a busca; quando retorna True,
+            a busca é interrompida com BuscaCancelada
         
-        return projetos
+    Returns:
+        Projetos com id, nome, cliente, prazo, status, total_etapas e
+        etapas_concluidas
+    """
+    if ordem not in ORDENACOES_PROJETOS:
+        raise ValueError(f"Ordenação inválida: {ordem}")
+    direcao = "DESC" if decrescente else "ASC"
+    
+    with get_connection() as conn, _cancelavel(conn, cancelada):
+        conn.execute("BEGIN")
+        filtro, params = _filtro_busca(conn, busca)
+        ids = [row[0] for row in conn.execute(f"""
+            SELECT id FROM projetos {filtro}
+            ORDER BY {ORDENACOES_PROJETOS[ordem]} {direcao}, id {direcao}
+            LIMIT ? OFFSET ?
+        """, params + (max(0, quantidade), max(0, inicio)))]
+        if not ids:
+            return []
+        
+        por_id = {}
+        for row in conn.execute(f"""
+            SELECT p.id, p.nome, p.cliente, p.prazo, p.status,
+                   (SELECT COUNT(*) FROM etapas e WHERE e.projeto_id = p.id) AS total_etapas,
+                   (SELECT COUNT(*) FROM etapas e
+                     WHERE e.projeto_id = p.id AND e.status = 'concluído') AS etapas_concluidas
+            FROM projetos p
+            WHERE p.id IN ({', '.join('?' * len(ids))})
+        """, ids):
+            por_id[row['id']] = dict(row)
+        return [por_id[projeto_id] for projeto_id in ids if projeto_id in por_id]
 
 
+@_com_retentativa
 def atualizar_projeto(projeto_id: int, nome: str = None, cliente: str = None, 
                      descricao: str = None, prazo: str = None, 
                      orcamento: float = None, status: str = None) -> bool:
@@ -263,7 +950,7 @@ def atualizar_projeto(projeto_id: int, nome: str = None, cliente: str = None,
     updates.append("updated_at = CURRENT_TIMESTAMP")
     params.append(projeto_id)
     
-    with get_connection() as conn:
+    with get_connection(escrita=True) as conn:
         cursor = conn.cursor()
         cursor.execute(f"""
             UPDATE projetos
@@ -274,6 +961,7 @@ def atualizar_projeto(projeto_id: int, nome: str = None, cliente: str = None,
         return cursor.rowcount > 0
 
 
+@_com_retentativa
 def excluir_projeto(projeto_id: int) -> bool:
     """
     Exclui um projeto e todos seus dados relacionados.
@@ -284,16 +972,96 @@ def excluir_projeto(projeto_id: int) -> bool:
     Returns:
         True se excluiu com sucesso, False caso contrário
     """
-    with get_connection() as conn:
+    with get_connection(escrita=True) as conn:
         cursor = conn.cursor()
+        # Explícito além do ON DELETE CASCADE: bancos abertos por outras
+        # ferramentas podem estar sem foreign_keys
+        cursor.execute("DELETE FROM etapas WHERE projeto_id = ?", (projeto_id,))
+        cursor.execute("DELETE FROM participantes WHERE projeto_id = ?", (projeto_id,))
         cursor.execute("DELETE FROM projetos WHERE id = ?", (projeto_id,))
         return cursor.rowcount > 0
 
 
+def _inserir_lote(conn: sqlite3.Connection, projetos: Iterable[Dict]) -> int:
+    """
+    Insere projetos com suas etapas e participantes usando executemany.
+    Não controla transação: quem chama decide quando confirmar.
+    
+    IDs ausentes são alocados a partir do maior ID existente, o que evita
+    uma ida ao banco por projeto para obter o lastrowid.
+    
+    Args:
+        conn: Conexão com transação de escrita aberta
+        projetos: Projetos no formato de buscar_projeto_completo; participantes
+            podem vir em 'participantes' ou 'pessoas' (formato JSON)
+        
+    Returns:
+        Número de projetos inseridos
+    """
+    proximo_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM projetos").fetchone()[0]
+    linhas_projetos, linhas_etapas, linhas_participantes = [], [], []
+    
+    for projeto in projetos:
+        projeto_id = projeto.get('id')
+        if projeto_id is None:
+            projeto_id = proximo_id
+        proximo_id = max(proximo_id, projeto_id + 1)
+        
+        linhas_projetos.append((
+            projeto_id, projeto.get('nome', ''), projeto.get('cliente', ''),
+            projeto.get('descricao', ''), projeto.get('prazo', ''),
+            projeto.get('orcamento', 0.0) or 0.0, projeto.get('status', 'ativo'),
+            projeto.get('created_at'), projeto.get('created_at')
+        ))
+        for etapa in projeto.get('etapas', []):
+            linhas_etapas.append((
+                projeto_id, etapa.get('nome', ''), etapa.get('descricao', ''),
+                etapa.get('status', 'em andamento'), etapa.get('prazo', ''),
+                etapa.get('responsavel', '')
+            ))
+        for pessoa in projeto.get('participantes', projeto.get('pessoas', [])):
+            linhas_participantes.append((
+                projeto_id, pessoa.get('nome', ''), pessoa.get('cargo', ''),
+                pessoa.get('etapa', ''), pessoa.get('prazo', '')
+            ))
+    
+    conn.executemany("""
+        INSERT INTO projetos (id, nome, cliente, descricao, prazo, orcamento, status,
+                              created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), COALESCE(?, CURRENT_TIMESTAMP))
+    """, linhas_projetos)
+    conn.executemany("""
+        INSERT INTO etapas (projeto_id, nome, descricao, status, prazo, responsavel)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, linhas_etapas)
+    conn.executemany("""
+        INSERT INTO participantes (projeto_id, nome, cargo, etapa, prazo)
+        VALUES (?, ?, ?, ?, ?)
+    """, linhas_participantes)
+    
+    return len(linhas_projetos)
+
+
+@_com_retentativa
+def adicionar_projetos_em_lote(projetos: List[Dict]) -> int:
+    """
+    Adiciona vários projetos (com etapas e participantes) em uma única transação.
+    
+    Args:
+        projetos: Lista de projetos no formato de buscar_projeto_completo
+        
+    Returns:
+        Número de projetos inseridos
+    """
+    with get_connection(escrita=True) as conn:
+        return _inserir_lote(conn, projetos)
+
+
 # =========================
 # FUNÇÕES DE ETAPAS
 # =========================
 
+@_com_retentativa
 def adicionar_etapa(projeto_id: int, nome: str, descricao: str = "", 
                     status: str = "em andamento", prazo: str = "", responsavel: str = "") -> int:
     """
@@ -310,7 +1078,7 @@ def adicionar_etapa(projeto_id: int, nome: str, descricao: str = "",
     Returns:
         ID da etapa criada
     """
-    with get_connection() as conn:
+    with get_connection(escrita=True) as conn:
         cursor = conn.cursor()
         cursor.execute("""
             INSERT INTO etapas (projeto_id, nome, descricao, status, prazo, responsavel)
@@ -351,6 +1119,7 @@ def listar_etapas(projeto_id: int) -> List[Dict]:
         return [dict(row) for row in cursor.fetchall()]
 
 
+@_com_retentativa
 def atualizar_etapa(etapa_id: int, nome: str = None, status: str = None,
                     prazo: str = None, responsavel: str = None) -> bool:
     """
@@ -390,7 +1159,7 @@ def atualizar_etapa(etapa_id: int, nome: str = None, status: str = None,
     
     params.append(etapa_id)
     
-    with get_connection() as conn:
+    with get_connection(escrita=True) as conn:
         cursor = conn.cursor()
         cursor.execute(f"""
             UPDATE etapas
@@ -401,6 +1170,7 @@ def atualizar_etapa(etapa_id: int, nome: str = None, status: str = None,
         return cursor.rowcount > 0
 
 
+@_com_retentativa
 def excluir_etapa(etapa_id: int) -> bool:
     """
     Exclui uma etapa.
@@ -411,7 +1181,7 @@ def excluir_etapa(etapa_id: int) -> bool:
     Returns:
         True se excluiu com sucesso, False caso contrário
     """
-    with get_connection() as conn:
+    with get_connection(escrita=True) as conn:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM etapas WHERE id = ?", (etapa_id,))
         return cursor.rowcount > 0
@@ -421,6 +1191,7 @@ def excluir_etapa(etapa_id: int) -> bool:
 # FUNÇÕES DE PARTICIPANTES
 # =========================
 
+@_com_retentativa
 def adicionar_participante(projeto_id: int, nome: str, cargo: str = "",
                           etapa: str = "", prazo: str = "") -> int:
     """
@@ -436,7 +1207,7 @@ def adicionar_participante(projeto_id: int, nome: str, cargo: str = "",
     Returns:
         ID do participante criado
     """
-    with get_connection() as conn:
+    with get_connection(escrita=True) as conn:
         cursor = conn.cursor()
         cursor.execute("""
             INSERT INTO participantes (projeto_id, nome, cargo, etapa, prazo)
@@ -492,6 +1263,7 @@ def buscar_participante_por_nome(projeto_id: int, nome: str) -> Optional[Dict]:
         return None
 
 
+@_com_retentativa
 def atualizar_participante(participante_id: int, nome: str = None, cargo: str = None,
                           etapa: str = None, prazo: str = None) -> bool:
     """
@@ -531,7 +1303,7 @@ def atualizar_participante(participante_id: int, nome: str = None, cargo: str =
     
     params.append(participante_id)
     
-    with get_connection() as conn:
+    with get_connection(escrita=True) as conn:
         cursor = conn.cursor()
         cursor.execute(f"""
             UPDATE participantes
@@ -542,6 +1314,7 @@ def atualizar_participante(participante_id: int, nome: str = None, cargo: str =
         return cursor.rowcount > 0
 
 
+@_com_retentativa
 def excluir_participante(participante_id: int) -> bool:
     """
     Exclui um participante.
@@ -552,7 +1325,7 @@ def excluir_participante(participante_id: int) -> bool:
     Returns:
         True se excluiu com sucesso, False caso contrário
     """
-    with get_connection() as conn:
+    with get_connection(escrita=True) as conn:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM participantes WHERE id = ?", (participante_id,))
         return cursor.rowcount > 0
@@ -562,6 +1335,7 @@ def excluir_participante(participante_id: int) -> bool:
 # FUNÇÕES DE USUÁRIOS
 # =========================
 
+@_com_retentativa
 def adicionar_usuario(nome: str, senha_hash: str) -> int:
     """
     Adiciona um novo usuário.
@@ -573,7 +1347,7 @@ def adicionar_usuario(nome: str, senha_hash: str) -> int:
     Returns:
         ID do usuário criado
     """
-    with get_connection() as conn:
+    with get_connection(escrita=True) as conn:
         cursor = conn.cursor()
         cursor.execute("""
             INSERT INTO usuarios (nome, senha_hash)
@@ -606,6 +1380,7 @@ def buscar_usuario(nome: str) -> Optional[Dict]:
         return None
 
 
+@_com_retentativa
 def atualizar_senha_usuario(nome: str, novo_hash: str) -> bool:
     """
     Atualiza a senha de um usuário.
@@ -617,7 +1392,7 @@ def atualizar_senha_usuario(nome: str, novo_hash: str) -> bool:
     Returns:
         True se atualizou com sucesso, False caso contrário
     """
-    with get_connection() as conn:
+    with get_connection(escrita=True) as conn:
         cursor = conn.cursor()
         cursor.execute("""
             UPDATE usuarios
@@ -0,0 +1,380 @@
+"""
+Gráficos do dashboard sem o estado global do pyplot.
+
+Cada gráfico tem uma única Figure (criada na primeira vez e reaproveitada
+a cada exibição) renderizada pelo backend Agg. Quando os dados mudam, os
+artistas existentes (barras, linhas, textos) são atualizados no lugar
+sempre que a estrutura do gráfico é a mesma; a imagem renderizada fica em
+cache pela assinatura (hash) dos dados, então exibir de novo um gráfico
+cujos dados não mudaram não redesenha nada.
+
+RenderizadorGraficos faz a renderização em uma thread própria (uma só: o
+matplotlib não é thread-safe), entregando as imagens por uma fila para a
+thread da interface exibir conforme ficam prontas. O matplotlib só é
+importado quando a primeira figura é criada, já na thread de renderização,
+e não atrasa a abertura do aplicativo.
+
+As funções dados_* montam as entradas de cada gráfico a partir das
+métricas do dashboard (catalogo_projetos.MetricasDashboard) como tuplas
+(hasheáveis), ou None quando não há o que mostrar.
+"""
+import queue
+import random
+import threading
+from collections import namedtuple
+from typing import Callable, Dict, Optional, Tuple
+
+from catalogo_projetos import MetricasDashboard
+
+
+FUNDO = '#222'
+BORDA = '#444'
+DPI = 100
+
+MESES = ('Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun', 'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez')
+TRIMESTRES = ('Q1', 'Q2', 'Q3', 'Q4')
+CORES_STATUS = {'ativo': '#375a7f', 'concluído': '#00bc8c', 'pausado': '#f39c12', 'cancelado': '#e74c3c'}
+
+# Imagem RGBA de um gráfico renderizado (assinatura = hash dos dados)
+ImagemGrafico = namedtuple('ImagemGrafico', 'largura altura rgba assinatura')
+
+
+def _abreviar(texto: str, limite: int) -> str:
+    return texto[:limite] + '...' if len(texto) > limite else texto
+
+
+# -----------------------
+# Dados de cada gráfico
+# -----------------------
+
+def dados_evolucao(metricas: MetricasDashboard) -> Tuple[int, ...]:
+    """Projetos por mês (distribuição simulada a partir do total)."""
+    # Semente fixa pelo total: a mesma base gera sempre a mesma série
+    sorteio = random.Random(metricas.total_projetos)
+    base = metricas.total_projetos // 12
+    return tuple(max(0, base + sorteio.randint(-2, 3)) for _ in MESES)
+
+
+def dados_clientes(metricas: MetricasDashboard) -> Optional[Tuple]:
+    """Top 8 clientes por número de projetos, como ((nome, total), ...)."""
+    top = metricas.maiores_clientes(8)
+    if not top:
+        return None
+    return tuple((_abreviar(nome, 20), total) for nome, total in top)
+
+
+def dados_orcamento(metricas: MetricasDashboard) -> Optional[Tuple]:
+    """Top 10 projetos por orçamento, como ((nome, orçamento), ...)."""
+    top = metricas.maiores_orcamentos
+    if not any(valor > 0 for _, valor in top):
+        return None
+    return tuple((_abreviar(nome, 12), valor) for nome, valor in top)
+
+
+def dados_progresso(metricas: MetricasDashboard) -> Tuple:
+    """Os 10 projetos menos avançados, como ((nome, %), ...)."""
+    return tuple((_abreviar(nome, 20), valor) for nome, valor in metricas.menos_avancados)
+
+
+def dados_status(metricas: MetricasDashboard) -> Optional[Tuple]:
+    """Projetos por status, como ((status, total), ...)."""
+    return tuple(metricas.por_status.items()) or None
+
+
+def dados_trimestres(metricas: MetricasDashboard) -> Optional[Tuple[int, ...]]:
+    """Projetos por trimestre (simulado a partir do total)."""
+    if metricas.total_projetos < 2:
+        return None
+    return tuple(metricas.total_projetos // 4 + i for i in range(len(TRIMESTRES)))
+
+
+def dados_etapas(metricas: MetricasDashboard) -> Optional[Tuple[int, int]]:
+    """Etapas (concluídas, pendentes) de todos os projetos."""
+    if metricas.total_etapas == 0:
+        return None
+    return (metricas.etapas_concluidas, metricas.total_etapas - metricas.etapas_concluidas)
+
+
+# -----------------------
+# Desenho
+# -----------------------
+
+def _estilizar(ax, borda: str = BORDA, grade: Optional[str] = 'both', alpha_grade: float = 0.1,
+               linha_grade: str = '--', tamanho_rotulos: Optional[int] = 9) -> None:
+    ax.set_facecolor(FUNDO)
+    if tamanho_rotulos:
+        ax.tick_params(colors='white', labelsize=tamanho_rotulos)
+    else:
+        ax.tick_params(colors='white')
+    ax.spines['bottom'].set_color(borda)
+    ax.spines['left'].set_color(borda)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    if grade:
+        ax.grid(True, axis=grade, alpha=alpha_grade, linestyle=linha_grade)
+
+
+def _reescalar(ax) -> None:
+    ax.relim()
+    ax.autoscale_view()
+
+
+def _linha(ax, artistas: Dict, rotulos: Tuple[str, ...], valores: Tuple[int, ...], cor: str,
+           **estilo) -> None:
+    """Linha com área preenchida; só os valores mudam entre atualizações."""
+    posicoes = range(len(rotulos))
+    if artistas.get('rotulos') == rotulos:
+        artistas['linha'].set_ydata(valores)
+        artistas['area'].remove()
+    else:
+        artistas['linha'], = ax.plot(rotulos, valores, marker='o', color=cor, **estilo)
+        artistas['rotulos'] = rotulos
+    artistas['area'] = ax.fill_between(posicoes, valores, alpha=0.3, color=cor)
+    _reescalar(ax)
+
+
+def desenhar_evolucao(ax, artistas: Dict, valores: Tuple[int, ...]) -> None:
+    if not artistas:
+        ax.set_ylabel('Quantidade', color='white', fontsize=11)
+        ax.set_xlabel('Mês', color='white', fontsize=11)
+        _estilizar(ax)
+    _linha(ax, artistas, MESES, valores, '#3498db', linewidth=3, markersize=8, label='Projetos Criados')
+    if 'textos' not in artistas:
+        ax.legend(loc='upper left', framealpha=0.8)
+        artistas['textos'] = [ax.text(i, 0, '', ha='center', va='bottom', color='white',
+                                      fontsize=9, fontweight='bold') for i in range(len(MESES))]
+    for i, (texto, valor) in enumerate(zip(artistas['textos'], valores)):
+        texto.set_position((i, valor + 0.5))
+        texto.set_text(str(valor))
+
+
+def desenhar_trimestres(ax, artistas: Dict, valores: Tuple[int, ...]) -> None:
+    if not artistas:
+        ax.set_ylabel('Projetos', color='white')
+        _estilizar(ax, borda='white', alpha_grade=0.2, linha_grade='-', tamanho_rotulos=None)
+    _linha(ax, artistas, TRIMESTRES, valores, '#00bc8c', linewidth=2, markersize=8)
+
+
+def _barras(ax, artistas: Dict, rotulos: Tuple, valores: Tuple, horizontal: bool,
+            formatar: Callable[[float], str], deslocamento: Callable[[float], float],
+            **estilo) -> None:
+    """
+    Barras com o valor escrito ao lado; com os mesmos rótulos, só os
+    tamanhos, cores e textos são atualizados.
+    """
+    tamanho_texto = estilo.pop('fontsize_texto', 9)
+    if artistas.get('rotulos') != rotulos:
+        for artista in artistas.get('barras', []) + artistas.get('textos', []):
+            artista.remove()
+        # Posições numéricas (e não categorias): o eixo não acumula os
+        # rótulos de atualizações anteriores
+        posicoes = range(len(rotulos))
+        if horizontal:
+            artistas['barras'] = list(ax.barh(posicoes, valores, **estilo))
+            ax.set_yticks(posicoes)
+            ax.set_yticklabels(rotulos)
+        else:
+            artistas['barras'] = list(ax.bar(posicoes, valores, **estilo))
+            ax.set_xticks(posicoes)
+            ax.set_xticklabels(rotulos, rotation=45, ha='right')
+        artistas['textos'] = [ax.text(0, 0, '', ha='left' if horizontal else 'center',
+                                      va='center' if horizontal else 'bottom', color='white',
+                                      fontsize=tamanho_texto, fontweight='bold')
+                              for _ in rotulos]
+        artistas['rotulos'] = rotulos
+    else:
+        cores = estilo.get('color')
+        for i, (barra, valor) in enumerate(zip(artistas['barras'], valores)):
+            if horizontal:
+                barra.set_width(valor)
+            else:
+                barra.set_height(valor)
+            if isinstance(cores, list):
+                barra.set_color(cores[i])
+
+    for barra, texto, valor in zip(artistas['barras'], artistas['textos'], valores):
+        if horizontal:
+            texto.set_position((barra.get_width() + deslocamento(valor),
+                                barra.get_y() + barra.get_height() / 2))
+        else:
+            texto.set_position((barra.get_x() + barra.get_width() / 2,
+                                barra.get_height() + deslocamento(valor)))
+        texto.set_text(formatar(valor))
+    _reescalar(ax)
+
+
+def desenhar_clientes(ax, artistas: Dict, dados: Tuple) -> None:
+    if not artistas:
+        ax.set_xlabel('Número de Projetos', color='white', fontsize=11)
+        _estilizar(ax, grade='x')
+    nomes, valores = zip(*dados)
+    _barras(ax, artistas, nomes, valores, True, lambda v: f'{int(v)}', lambda v: 0.1,
+            color='#27ae60', height=0.6, fontsize_texto=10)
+
+
+def desenhar_orcamento(ax, artistas: Dict, dados: Tuple) -> None:
+    if not artistas:
+        ax.set_ylabel('Orçamento (R$)', color='white', fontsize=11)
+        _estilizar(ax, grade='y')
+    nomes, valores = zip(*dados)
+    maior = max(valores)
+    _barras(ax, artistas, nomes, valores, False, lambda v: f'R$ {v:,.0f}', lambda v: maior * 0.02,
+            color='#f39c12', width=0.6, fontsize_texto=8)
+
+
+def _cor_progresso(valor: float) -> str:
+    if valor >= 80:
+        return '#27ae60'  # Verde
+    if valor >= 50:
+        return '#f39c12'  # Laranja
+    return '#e74c3c'      # Vermelho
+
+
+def desenhar_progresso(ax, artistas: Dict, dados: Tuple) -> None:
+    if not artistas:
+        ax.set_xlabel('Progresso (%)', color='white', fontsize=11)
+        ax.set_xlim(0, 105)
+        _estilizar(ax, grade='x')
+    nomes, valores = zip(*dados) if dados else ((), ())
+    _barras(ax, artistas, nomes, valores, True, lambda v: f'{v:.0f}%', lambda v: 2,
+            color=[_cor_progresso(v) for v in valores], height=0.6)
+    ax.set_xlim(0, 105)
+
+
+def desenhar_status(ax, artistas: Dict, dados: Tuple) -> None:
+    # Pizza: as fatias mudam de ângulo e de número, redesenhar é mais simples
+    ax.clear()
+    artistas['desenhado'] = True
+    status, totais = zip(*dados)
+    ax.pie(
+        totais,
+        labels=[s.capitalize() for s in status],
+        autopct='%1.1f%%',
+        colors=[CORES_STATUS.get(s, '#95a5a6') for s in status],
+        textprops={'color': 'white', 'fontsize': 10}
+    )
+
+
+def desenhar_etapas(ax, artistas: Dict, dados: Tuple[int, int]) -> None:
+    if not artistas:
+        ax.set_xlabel('Quantidade', color='white')
+        _estilizar(ax, borda='white', grade=None, tamanho_rotulos=None)
+    total = sum(dados)
+    _barras(ax, artistas, ('Concluídas', 'Pendentes'), dados, True,
+            lambda v: f'{v} ({v / total * 100:.1f}%)', lambda v: 0.5,
+            color=['#00bc8c', '#f39c12'], fontsize_texto=10)
+
+
+# Tamanho (polegadas) e função de desenho de cada gráfico
+GRAFICOS = {
+    'evolucao': ((7, 4.5), desenhar_evolucao),
+    'clientes': ((7, 4.5), desenhar_clientes),
+    'orcamento': ((7, 6), desenhar_orcamento),
+    'progresso': ((7, 6), desenhar_progresso),
+    'status': ((5, 4), desenhar_status),
+    'trimestres': ((5, 4), desenhar_trimestres),
+    'etapas': ((10, 3), desenhar_etapas),
+}
+
+
+class _Grafico:
+    """Figure reaproveitada de um gráfico, com seus artistas e a última imagem."""
+
+    def __init__(self, tamanho: Tuple[float, float], desenhar: Callable):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.figura = Figure(figsize=tamanho, dpi=DPI, facecolor=FUNDO)
+        self.canvas = FigureCanvasAgg(self.figura)
+        self.ax = self.figura.add_subplot()
+        self.desenhar = desenhar
+        self.artistas: Dict = {}
+        self.imagem: Optional[ImagemGrafico] = None
+
+
+class GerenciadorGraficos:
+    """Renderiza os gráficos do dashboard reaproveitando figuras e imagens."""
+
+    def __init__(self):
+        self._graficos: Dict[str, _Grafico] = {}
+        self.renderizacoes = 0
+        self.acertos_cache = 0
+
+    def _grafico(self, chave: str) -> _Grafico:
+        grafico = self._graficos.get(chave)
+        if grafico is None:
+            tamanho, desenhar = GRAFICOS[chave]
+            grafico = self._graficos[chave] = _Grafico(tamanho, desenhar)
+        return grafico
+
+    def renderizar(self, chave: str, dados: Tuple) -> ImagemGrafico:
+        """
+        Retorna a imagem do gráfico para os dados informados.
+
+        Args:
+            chave: Nome do gráfico (ver GRAFICOS)
+            dados: Entradas do gráfico (retorno da função dados_* correspondente)
+
+        Returns:
+            ImagemGrafico com o buffer RGBA; a mesma instância enquanto os
+            dados não mudarem
+        """
+        grafico = self._grafico(chave)
+        assinatura = hash(dados)
+        if grafico.imagem is not None and grafico.imagem.assinatura == assinatura:
+            self.acertos_cache += 1
+            return grafico.imagem
+
+        grafico.desenhar(grafico.ax, grafico.artistas, dados)
+        grafico.figura.tight_layout()
+        grafico.canvas.draw()
+        largura, altura = grafico.canvas.get_width_height()
+        grafico.imagem = ImagemGrafico(largura, altura, bytes(grafico.canvas.buffer_rgba()), assinatura)
+        self.renderizacoes += 1
+        return grafico.imagem
+
+    def liberar(self) -> None:
+        """Descarta figuras e imagens (ex.: ao fechar o dashboard)."""
+        self._graficos.clear()
+
+
+class RenderizadorGraficos:
+    """
+    Thread única de renderização: recebe pedidos (chave, dados) e publica
+    as imagens em `resultados`, na ordem dos pedidos, como tuplas
+    (chave, imagem, erro).
+    """
+
+    def __init__(self, gerenciador: Optional[GerenciadorGraficos] = None):
+        self.gerenciador = gerenciador or GerenciadorGraficos()
+        self.resultados: "queue.Queue[Tuple]" = queue.Queue()
+        self._pedidos: "queue.Queue[Optional[Tuple]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._trabalhar, name="render-graficos", daemon=True)
+        self._thread.start()
+
+    def pedir(self, chave: str, dados: Tuple) -> None:
+        """
+        Enfileira a renderização de um gráfico.
+
+        Args:
+            chave: Nome do gráfico (ver GRAFICOS)
+            dados: Entradas do gráfico
+        """
+        self._pedidos.put((chave, dados))
+
+    def _trabalhar(self) -> None:
+        while True:
+            pedido = self._pedidos.get()
+            if pedido is None:
+                return
+            chave, dados = pedido
+            try:
+                self.resultados.put((chave, self.gerenciador.renderizar(chave, dados), None))
+            except Exception as e:
+                self.resultados.put((chave, None, e))
+
+    def encerrar(self, espera: Optional[float] = None) -> None:
+        """Termina a thread depois dos pedidos já enfileirados."""
+        self._pedidos.put(None)
+        if espera is not None:
+            self._thread.join(espera)
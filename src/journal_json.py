@@ -0,0 +1,521 @@
+"""
+Journal de operações para o armazenamento em JSON.
+
+Em vez de reescrever todo o dados_projetos.json a cada alteração, cada
+operação é anexada (com fsync) a um arquivo .journal ao lado do snapshot.
+Ao carregar, o snapshot é lido e o journal é reaplicado. Quando o journal
+passa do limite, uma thread compacta tudo em um novo snapshot.
+
+O documento carregado fica em cache (com um índice ID -> posição) enquanto
+mtime, tamanho e inode do snapshot e do journal não mudarem; as gravações
+feitas por esta instância atualizam o cache em vez de invalidá-lo. Quem lê
+recebe cópias: alterar um projeto lido (ou gravado) não altera o cache.
+
+O snapshot é sempre regravado de forma atômica (temporário + fsync +
+rename) e as instâncias do aplicativo se coordenam por arquivos .lock.
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from leitor_json import iterar_projetos
+
+# Tamanho do journal (bytes) que dispara a compactação
+LIMITE_COMPACTACAO = 4 * 1024 * 1024
+
+# Snapshots maiores que isso são gravados sem indentação (bytes)
+LIMITE_INDENTACAO = 1024 * 1024
+
+# Trava entre instâncias do aplicativo (segundos)
+TRAVA_TIMEOUT = 30.0
+TRAVA_EXPIRACAO = 120.0    # Trava mais antiga que isso foi abandonada por um processo morto
+
+# Máscara de permissões do processo (para arquivos criados via mkstemp),
+# lida na primeira gravação de um arquivo novo (ver _umask)
+_umask_processo: Optional[int] = None
+_umask_lock = threading.Lock()
+
+# Operações gravadas no journal (todas idempotentes, para que reaplicar
+# um trecho já incorporado ao snapshot não altere o resultado)
+OP_SALVAR_PROJETO = "salvar_projeto"     # {"op", "projeto": {...}}
+OP_EXCLUIR_PROJETO = "excluir_projeto"   # {"op", "id": n}
+
+
+class TravaArquivo:
+    """
+    Trava exclusiva entre threads e entre processos, baseada em um arquivo
+    .lock criado com O_EXCL (funciona igual no Windows e no Linux).
+    """
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self._lock.acquire()
+        limite = time.monotonic() + TRAVA_TIMEOUT
+        while True:
+            try:
+                fd = os.open(self.caminho, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                return self
+            except FileExistsError:
+                self._remover_se_abandonada()
+                if time.monotonic() >= limite:
+                    self._lock.release()
+                    raise TimeoutError(f"Arquivo em uso por outra instância: {self.caminho}")
+                time.sleep(0.01)
+            except BaseException:
+                self._lock.release()
+                raise
+
+    def __exit__(self, *exc):
+        try:
+            os.remove(self.caminho)
+        finally:
+            self._lock.release()
+
+    def _remover_se_abandonada(self) -> None:
+        try:
+            if time.time() - os.path.getmtime(self.caminho) > TRAVA_EXPIRACAO:
+                os.remove(self.caminho)
+        except OSError:
+            pass
+
+
+def _umask() -> int:
+    """
+    Máscara de permissões do processo. No Linux vem de /proc/self/status,
+    sem alterá-la; nos demais sistemas a única forma de lê-la é trocá-la e
+    restaurá-la (feito uma vez só, sob trava), e arquivos criados por outras
+    threads nesse instante podem sair com a máscara 0.
+    """
+    global _umask_processo
+    with _umask_lock:
+        if _umask_processo is None:
+            try:
+                with open("/proc/self/status", encoding="ascii") as f:
+                    _umask_processo = next(int(linha.split()[1], 8) for linha in f
+                                           if linha.startswith("Umask:"))
+            except (OSError, StopIteration, ValueError, IndexError):
+                _umask_processo = os.umask(0)
+                os.umask(_umask_processo)
+        return _umask_processo
+
+
+def _gravar_atomico(caminho: str, escrever: Callable[[TextIO], None]) -> None:
+    """
+    Grava um arquivo de forma segura contra quedas: escreve em um arquivo
+    temporário no mesmo diretório, faz fsync e renomeia sobre o destino.
+    Leitores veem o arquivo antigo ou o novo, nunca um arquivo pela metade.
+    """
+    diretorio = os.path.dirname(os.path.abspath(caminho))
+    fd, temporario = tempfile.mkstemp(prefix=os.path.basename(caminho) + ".", suffix=".tmp", dir=diretorio)
+    try:
+        # mkstemp cria com permissão 0600: manter a do arquivo original
+        # (ou a padrão do processo, para arquivos novos)
+        if os.path.exists(caminho):
+            os.chmod(temporario, os.stat(caminho).st_mode & 0o777)
+        else:
+            os.chmod(temporario, 0o666 & ~_umask())
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            escrever(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, caminho)
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+
+    # Persistir a renomeação (no Windows não é possível abrir diretórios)
+    if os.name != "nt":
+        fd_dir = os.open(diretorio, os.O_RDONLY)
+        try:
+            os.fsync(fd_dir)
+        finally:
+            os.close(fd_dir)
+
+
+def _compactar_por_tamanho(caminho: str, compacto: Optional[bool]) -> bool:
+    if compacto is None:
+        return os.path.exists(caminho) and os.path.getsize(caminho) >= LIMITE_INDENTACAO
+    return compacto
+
+
+def gravar_json_atomico(caminho: str, dados: Dict, compacto: Optional[bool] = None) -> None:
+    """
+    Grava um JSON de forma atômica (temporário + fsync + rename).
+
+    Args:
+        caminho: Arquivo de destino
+        dados: Conteúdo a gravar
+        compacto: Grava sem indentação; se None, decide pelo tamanho atual
+            do arquivo (LIMITE_INDENTACAO)
+    """
+    def escrever(f: TextIO) -> None:
+        if compacto:
+            # dumps sem indentação usa o codificador em C (json.dump não usa)
+            f.write(json.dumps(dados, ensure_ascii=False, separators=(",", ":")))
+        else:
+            json.dump(dados, f, indent=4, ensure_ascii=False)
+
+    compacto = _compactar_por_tamanho(caminho, compacto)
+    _gravar_atomico(caminho, escrever)
+
+
+def gravar_projetos_atomico(caminho: str, projetos: Iterable[Dict], compacto: Optional[bool] = None) -> None:
+    """
+    Grava um {"projetos": [...]} de forma atômica, projeto a projeto, sem
+    montar o documento inteiro na memória.
+
+    Args:
+        caminho: Arquivo de destino
+        projetos: Projetos a gravar (pode ser um gerador)
+        compacto: Grava sem indentação; se None, decide pelo tamanho atual
+            do arquivo (LIMITE_INDENTACAO)
+    """
+    def escrever(f: TextIO) -> None:
+        if compacto:
+            f.write('{"projetos":[')
+            separador = ","
+        else:
+            f.write('{\n    "projetos": [\n')
+            separador = ",\n"
+        for i, projeto in enumerate(projetos):
+            if i:
+                f.write(separador)
+            if compacto:
+                f.write(json.dumps(projeto, ensure_ascii=False, separators=(",", ":")))
+            else:
+                # Mesma indentação do json.dump(..., indent=4) do documento inteiro
+                texto = json.dumps(projeto, indent=4, ensure_ascii=False)
+                f.write("        " + texto.replace("\n", "\n        "))
+        f.write("]}" if compacto else "\n    ]\n}")
+
+    compacto = _compactar_por_tamanho(caminho, compacto)
+    _gravar_atomico(caminho, escrever)
+
+
+def _copiar(valor: Any) -> Any:
+    """Cópia de um valor JSON (dicionários e listas aninhados; mais rápida que deepcopy)."""
+    if isinstance(valor, dict):
+        return {chave: _copiar(item) for chave, item in valor.items()}
+    if isinstance(valor, list):
+        return [_copiar(item) for item in valor]
+    return valor
+
+
+def iterar_com_operacoes(projetos: Iterable[Dict], operacoes: List[Dict]) -> Iterator[Dict]:
+    """
+    Aplica as operações do journal sobre os projetos do snapshot. Percorre
+    o snapshot uma única vez, sem mantê-lo inteiro na memória (só os
+    projetos tocados pelo journal).
+
+    Args:
+        projetos: Projetos do snapshot (pode ser um gerador)
+        operacoes: Operações na ordem em que foram gravadas
+
+    Yields:
+        Projetos resultantes
+    """
+    # Estado final de cada ID tocado pelo journal. Um projeto do snapshot
+    # que nunca foi excluído é atualizado no lugar; os demais vão para o
+    # fim, na ordem do primeiro "salvar" depois da última exclusão.
+    finais: Dict = {}
+    excluidos = set()
+    posicao: Dict = {}
+    for i, operacao in enumerate(operacoes):
+        if operacao.get("op") == OP_SALVAR_PROJETO:
+            projeto = operacao["projeto"]
+            id_projeto = projeto.get("id")
+            if finais.get(id_projeto) is None:
+                posicao[id_projeto] = i
+            finais[id_projeto] = projeto
+        elif operacao.get("op") == OP_EXCLUIR_PROJETO:
+            finais[operacao.get("id")] = None
+            excluidos.add(operacao.get("id"))
+
+    no_lugar = set()
+    for projeto in projetos:
+        id_projeto = projeto.get("id")
+        if id_projeto not in finais:
+            yield projeto
+        elif id_projeto not in excluidos:
+            no_lugar.add(id_projeto)
+            yield finais[id_projeto]
+
+    for id_projeto in sorted(posicao, key=posicao.get):
+        if finais[id_projeto] is not None and id_projeto not in no_lugar:
+            yield finais[id_projeto]
+
+
+class JournalJSON:
+    """Snapshot JSON + journal de operações anexadas."""
+
+    def __init__(self, arquivo: str, limite_compactacao: int = LIMITE_COMPACTACAO):
+        self.arquivo = arquivo
+        self.arquivo_journal = arquivo + ".journal"
+        self.limite_compactacao = limite_compactacao
+        self._lock = TravaArquivo(arquivo + ".lock")                   # Protege o journal
+        self._lock_snapshot = TravaArquivo(arquivo + ".snapshot.lock")  # Serializa quem regrava o snapshot
+        self._compactando: Optional[threading.Thread] = None
+
+        # Cache do documento carregado, válido enquanto os arquivos tiverem
+        # a assinatura (mtime, tamanho, inode) registrada
+        self._cache: Optional[List[Dict]] = None
+        self._indice: Dict[Any, int] = {}
+        self._assinatura_cache: Optional[Tuple] = None
+
+    # Cache
+
+    @staticmethod
+    def _assinatura_arquivo(caminho: str) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(caminho)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _assinatura(self) -> Tuple:
+        """Assinatura atual do snapshot e do journal (chamar com as travas)."""
+        return (self._assinatura_arquivo(self.arquivo), self._assinatura_arquivo(self.arquivo_journal))
+
+    def _cache_valido(self) -> bool:
+        return self._cache is not None and self._assinatura_cache == self._assinatura()
+
+    def _montar_cache(self, projetos: List[Dict]) -> None:
+        self._cache = projetos
+        self._indice = {p.get("id"): i for i, p in enumerate(projetos)}
+        self._assinatura_cache = self._assinatura()
+
+    def _aplicar_no_cache(self, operacao: Dict) -> None:
+        """Reflete no cache uma operação gravada por esta instância."""
+        if operacao.get("op") == OP_SALVAR_PROJETO:
+            projeto = _copiar(operacao["projeto"])
+            posicao = self._indice.get(projeto.get("id"))
+            if posicao is None:
+                self._indice[projeto.get("id")] = len(self._cache)
+                self._cache.append(projeto)
+            else:
+                self._cache[posicao] = projeto
+        elif operacao.get("op") == OP_EXCLUIR_PROJETO:
+            posicao = self._indice.pop(operacao.get("id"), None)
+            if posicao is not None:
+                del self._cache[posicao]
+                for i in range(posicao, len(self._cache)):
+                    self._indice[self._cache[i].get("id")] = i
+
+    def invalidar_cache(self) -> None:
+        """Descarta o cache; a próxima leitura relê os arquivos."""
+        self._assinatura_cache = None
+
+    # Leitura
+
+    def _iterar_snapshot(self) -> Iterator[Dict]:
+        if not os.path.exists(self.arquivo):
+            return iter(())
+        return iterar_projetos(self.arquivo)
+
+    def _ler_journal(self, limite: Optional[int] = None) -> List[Dict]:
+        """Lê as operações do journal (até `limite` bytes, se informado)."""
+        if not os.path.exists(self.arquivo_journal):
+            return []
+        with open(self.arquivo_journal, "rb") as f:
+            conteudo = f.read() if limite is None else f.read(limite)
+
+        operacoes = []
+        for linha in conteudo.splitlines():
+            try:
+                operacoes.append(json.loads(linha))
+            except ValueError:
+                # Linha incompleta (queda durante a gravação): descartar
+                continue
+        return operacoes
+
+    def carregar(self, copiar: bool = True) -> Dict:
+        """
+        Carrega o snapshot e reaplica o journal (ou usa o cache, se os
+        arquivos não mudaram desde a última leitura).
+
+        Args:
+            copiar: False devolve os próprios dicionários do cache, sem o
+                custo da cópia: só para leitura (contagens, filtros)
+
+        Returns:
+            Dicionário {"projetos": [...]}
+        """
+        with self._lock_snapshot, self._lock:
+            if not self._cache_valido():
+                self._montar_cache(list(iterar_com_operacoes(self._iterar_snapshot(), self._ler_journal())))
+            return {"projetos": _copiar(self._cache) if copiar else list(self._cache)}
+
+    def obter(self, id_projeto: int) -> Optional[Dict]:
+        """
+        Retorna um projeto pelo ID: consulta o índice do cache (relendo os
+        arquivos se mudaram) ou, se nada foi carregado ainda, faz uma busca
+        sequencial sem carregar o documento.
+
+        Args:
+            id_projeto: ID do projeto
+
+        Returns:
+            Dicionário do projeto ou None se não encontrado
+        """
+        if self._cache is None:
+            return self.buscar_projeto(id_projeto)
+        projetos = self.carregar(copiar=False)["projetos"]
+        posicao = self._indice.get(id_projeto)
+        return _copiar(projetos[posicao]) if posicao is not None else None
+
+    def iterar_projetos(self) -> Iterator[Dict]:
+        """
+        Percorre os projetos (snapshot + journal) sem carregar o arquivo
+        inteiro. As travas ficam presas até o gerador terminar ou ser
+        fechado, então o consumo deve ser feito de uma vez.
+
+        Yields:
+            Cada projeto, na mesma ordem de carregar()
+        """
+        with self._lock_snapshot, self._lock:
+            yield from iterar_com_operacoes(self._iterar_snapshot(), self._ler_journal())
+
+    def buscar_projeto(self, id_projeto: int) -> Optional[Dict]:
+        """
+        Procura um projeto lendo o arquivo só até encontrá-lo.
+
+        Args:
+            id_projeto: ID do projeto
+
+        Returns:
+            Dicionário do projeto ou None se não encontrado
+        """
+        projetos = self.iterar_projetos()
+        try:
+            for projeto in projetos:
+                if projeto.get("id") == id_projeto:
+                    return projeto
+            return None
+        finally:
+            projetos.close()
+
+    # Escrita
+
+    def registrar(self, operacao: Dict) -> None:
+        """
+        Anexa uma operação ao journal e força a gravação em disco.
+
+        Args:
+            operacao: Dicionário com a chave "op" (ver OP_*)
+        """
+        linha = (json.dumps(operacao, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._lock:
+            cache_valido = self._cache_valido()
+            with open(self.arquivo_journal, "a+b") as f:
+                # Isolar uma linha incompleta deixada por uma queda anterior
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        linha = b"\n" + linha
+                f.write(linha)
+                f.flush()
+                os.fsync(f.fileno())
+            tamanho = os.path.getsize(self.arquivo_journal)
+
+            # Só esta gravação mudou os arquivos: atualizar o cache no lugar
+            if cache_valido:
+                self._aplicar_no_cache(operacao)
+                self._assinatura_cache = self._assinatura()
+            else:
+                self.invalidar_cache()
+
+        if tamanho >= self.limite_compactacao:
+            self.compactar_em_segundo_plano()
+
+    def salvar_projeto(self, projeto: Dict) -> None:
+        """Registra a versão atual completa de um projeto."""
+        self.registrar({"op": OP_SALVAR_PROJETO, "projeto": projeto})
+
+    def excluir_projeto(self, id_projeto: int) -> None:
+        """Registra a exclusão de um projeto."""
+        self.registrar({"op": OP_EXCLUIR_PROJETO, "id": id_projeto})
+
+    def _gravar_snapshot(self, dados: Dict) -> None:
+        gravar_json_atomico(self.arquivo, dados)
+
+    def substituir(self, dados: Dict) -> None:
+        """
+        Grava um snapshot completo e descarta o journal.
+
+        Args:
+            dados: Dicionário {"projetos": [...]}
+        """
+        with self._lock_snapshot, self._lock:
+            self._gravar_snapshot(dados)
+            if os.path.exists(self.arquivo_journal):
+                os.remove(self.arquivo_journal)
+            self._montar_cache(_copiar(dados.get("projetos", [])))
+
+    # Compactação
+
+    def compactar(self) -> None:
+        """
+        Incorpora o journal ao snapshot.
+
+        O novo snapshot é montado a partir dos arquivos (e não do estado em
+        memória de quem chamou), então pode rodar em paralelo com novas
+        operações: o que for anexado durante a compactação é preservado.
+        """
+        with self._lock_snapshot:
+            with self._lock:
+                if not os.path.exists(self.arquivo_journal):
+                    return
+                tamanho = os.path.getsize(self.arquivo_journal)
+                assinatura_inicio = self._assinatura()
+
+            operacoes = self._ler_journal(tamanho)
+            gravar_projetos_atomico(self.arquivo, iterar_com_operacoes(self._iterar_snapshot(), operacoes))
+
+            with self._lock:
+                # Manter só o que foi anexado depois do ponto compactado
+                with open(self.arquivo_journal, "rb") as f:
+                    f.seek(tamanho)
+                    restante = f.read()
+                if restante:
+                    temporario = self.arquivo_journal + ".tmp"
+                    with open(temporario, "wb") as f:
+                        f.write(restante)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(temporario, self.arquivo_journal)
+                else:
+                    os.remove(self.arquivo_journal)
+
+                # O conteúdo não muda na compactação: se ninguém gravou no
+                # meio dela, o cache continua valendo para os novos arquivos
+                if not restante and self._assinatura_cache == assinatura_inicio:
+                    self._assinatura_cache = self._assinatura()
+                else:
+                    self.invalidar_cache()
+
+    def compactar_em_segundo_plano(self) -> None:
+        """Dispara a compactação em uma thread, se nenhuma estiver em andamento."""
+        if self._compactando is not None and self._compactando.is_alive():
+            return
+        self._compactando = threading.Thread(target=self._compactar_seguro, name="compactar-journal", daemon=True)
+        self._compactando.start()
+
+    def _compactar_seguro(self) -> None:
+        try:
+            self.compactar()
+        except Exception as e:
+            print(f"Erro ao compactar o journal: {e}")
+
+    def aguardar_compactacao(self) -> None:
+        """Espera a compactação em andamento terminar (usado no encerramento)."""
+        if self._compactando is not None:
+            self._compactando.join()
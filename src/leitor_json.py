@@ -0,0 +1,149 @@
+"""
+Leitura incremental do dados_projetos.json.
+
+Em vez de carregar o arquivo inteiro com json.load (que precisa de várias
+vezes o tamanho do arquivo em memória antes de devolver o primeiro
+projeto), o arquivo é lido em blocos e cada elemento do array "projetos"
+é decodificado e entregue assim que termina de chegar. O consumo de
+memória fica limitado ao bloco de leitura mais o maior projeto.
+"""
+import json
+from typing import Dict, Iterator, Optional, TextIO
+
+# Tamanho de cada leitura do arquivo (caracteres)
+TAMANHO_BLOCO = 64 * 1024
+
+_ESPACOS = " \t\n\r"
+_decodificador = json.JSONDecoder()
+
+
+class _Leitor:
+    """Buffer deslizante sobre o arquivo, com decodificação de valores JSON."""
+
+    def __init__(self, arquivo: TextIO, tamanho_bloco: int):
+        self.arquivo = arquivo
+        self.tamanho_bloco = tamanho_bloco
+        self.buffer = ""
+        self.pos = 0
+        self.fim = False
+        self.lidos = 0    # Caracteres já descartados do início do buffer (para as mensagens de erro)
+
+    def _ler_mais(self, quantidade: Optional[int] = None) -> bool:
+        """Acrescenta um bloco ao buffer; retorna False no fim do arquivo."""
+        if self.fim:
+            return False
+        bloco = self.arquivo.read(quantidade or self.tamanho_bloco)
+        if not bloco:
+            self.fim = True
+            return False
+        # Descartar o que já foi consumido para não acumular o arquivo inteiro
+        if self.pos:
+            self.lidos += self.pos
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        self.buffer += bloco
+        return True
+
+    def _erro(self, mensagem: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(mensagem, self.buffer, self.pos)
+
+    def proximo_caractere(self) -> str:
+        """Pula espaços e retorna o próximo caractere (sem consumir), ou "" no fim."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _ESPACOS:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._ler_mais():
+                return ""
+
+    def consumir(self, esperado: str) -> None:
+        if self.proximo_caractere() != esperado:
+            raise self._erro(f"Esperado '{esperado}' na posição {self.lidos + self.pos}")
+        self.pos += 1
+
+    def valor(self):
+        """Decodifica o próximo valor JSON completo, lendo mais blocos se preciso."""
+        self.proximo_caractere()
+        while True:
+            try:
+                valor, fim = _decodificador.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Valor ainda incompleto no buffer: dobrar a leitura evita
+                # redecodificar muitas vezes um projeto muito grande
+                if not self._ler_mais(max(self.tamanho_bloco, len(self.buffer) - self.pos)):
+                    raise
+                continue
+            # Um número no fim do buffer pode estar cortado ("12" de "125")
+            if fim == len(self.buffer) and not self.fim and not isinstance(valor, (dict, list, str)):
+                if self._ler_mais():
+                    continue
+            self.pos = fim
+            return valor
+
+
+def _iterar_array(leitor: _Leitor) -> Iterator:
+    leitor.consumir("[")
+    if leitor.proximo_caractere() == "]":
+        leitor.pos += 1
+        return
+    while True:
+        yield leitor.valor()
+        separador = leitor.proximo_caractere()
+        if separador == "]":
+            leitor.pos += 1
+            return
+        leitor.consumir(",")
+
+
+def iterar_json(arquivo: TextIO, chave: str = "projetos",
+                tamanho_bloco: int = TAMANHO_BLOCO) -> Iterator[Dict]:
+    """
+    Percorre os elementos de um array de nível superior de um JSON aberto.
+
+    Args:
+        arquivo: Arquivo texto já aberto
+        chave: Chave do objeto raiz que contém o array
+        tamanho_bloco: Caracteres lidos por vez
+
+    Yields:
+        Cada elemento do array, na ordem do arquivo
+
+    Raises:
+        json.JSONDecodeError: Se o conteúdo não for JSON válido
+    """
+    leitor = _Leitor(arquivo, tamanho_bloco)
+    if leitor.proximo_caractere() == "":
+        return
+    leitor.consumir("{")
+    if leitor.proximo_caractere() == "}":
+        return
+
+    while True:
+        nome = leitor.valor()
+        if not isinstance(nome, str):
+            raise leitor._erro("Chave do objeto raiz não é uma string")
+        leitor.consumir(":")
+        if nome == chave and leitor.proximo_caractere() == "[":
+            yield from _iterar_array(leitor)
+        else:
+            # Outras chaves do objeto raiz (metadados, usuários...) são ignoradas
+            leitor.valor()
+        if leitor.proximo_caractere() == "}":
+            return
+        leitor.consumir(",")
+
+
+def iterar_projetos(caminho: str, tamanho_bloco: int = TAMANHO_BLOCO) -> Iterator[Dict]:
+    """
+    Lê os projetos de um dados_projetos.json um de cada vez.
+
+    Args:
+        caminho: Caminho do arquivo
+        tamanho_bloco: Caracteres lidos por vez
+
+    Yields:
+        Dicionário de cada projeto, na ordem do arquivo
+    """
+    with open(caminho, "r", encoding="utf-8") as f:
+        yield from iterar_json(f, "projetos", tamanho_bloco)
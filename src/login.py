@@ -2,23 +2,20 @@
 Tela de login moderna com ttkbootstrap.
 Design profissional inspirado em aplicações modernas.
 """
-import os
-import sys
-import subprocess
+import perfil_inicio
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 from tkinter import messagebox
-from PIL import Image, ImageTk
 
 # Importar configurações e utilitários
 try:
-    from config import LOGIN_TITLE, SRC_DIR
+    from config import LOGIN_TITLE
     from utils import hash_senha, verificar_senha, validar_nome
     import database as db
+    import nucleo
     USE_SQLITE = True
 except ImportError:
     LOGIN_TITLE = "Login - ProjetoX"
-    SRC_DIR = os.path.dirname(__file__)
     USE_SQLITE = False
     
     import hashlib
@@ -57,6 +54,13 @@ class ModernLoginApp(ttk.Window):
         self.setup_styles()
         
         self.setup_ui()
+        perfil_inicio.marcar("janela de login montada")
+        self.after_idle(perfil_inicio.primeira_pintura)
+        
+        # O dashboard é importado enquanto o usuário digita; os projetos
+        # começam a ser lidos quando a senha é aceita
+        self.pre_carga = None
+        self.after_idle(self.preparar_dashboard)
         
     def center_window(self):
         """Centraliza a janela na tela."""
@@ -310,9 +314,10 @@ class ModernLoginApp(ttk.Window):
                 senha_armazenada = usuario['senha_hash']
                 
                 if verificar_senha(senha, senha_armazenada):
+                    # A leitura corre enquanto a mensagem está aberta
+                    self.pre_carga = nucleo.LeituraProjetos("pre-carga-projetos")
                     messagebox.showinfo("Sucesso", f"Bem-vindo, {nome}!", parent=self)
-                    self.destroy()
-                    self.abrir_dashboard()
+                    self.abrir_dashboard(nome)
                 else:
                     messagebox.showerror("Erro", "Senha incorreta.", parent=self)
                     self.entry_senha.delete(0, 'end')
@@ -321,17 +326,32 @@ class ModernLoginApp(ttk.Window):
         else:
             messagebox.showerror("Erro", "Sistema de banco de dados não disponível.", parent=self)
     
-    def abrir_dashboard(self):
-        """Abre a tela principal do sistema."""
-        caminho_dashboard = os.path.join(SRC_DIR, "tela_inicial.py")
-        
-        if os.path.exists(caminho_dashboard):
-            try:
-                subprocess.Popen([sys.executable, caminho_dashboard])
-            except Exception as e:
-                messagebox.showerror("Erro", f"Erro ao abrir o dashboard: {e}")
-        else:
-            messagebox.showerror("Erro", f"Arquivo 'tela_inicial.py' não encontrado em:\n{caminho_dashboard}")
+    def preparar_dashboard(self):
+        """
+        Importa o dashboard na thread da interface, depois da primeira
+        pintura do login, para que a abertura após o login não espere por
+        isso (os módulos da interface não são importados em outras threads).
+        """
+        try:
+            import tela_inicial  # Só para carregar os módulos
+        except Exception as e:
+            print(f"Não foi possível preparar o dashboard: {e}")
+    
+    def abrir_dashboard(self, usuario):
+        """
+        Abre o dashboard neste processo, com o usuário autenticado.
+        
+        A janela de login fica escondida como janela principal; os módulos
+        já importados, o banco já inicializado e os projetos da pré-carga
+        são reaproveitados.
+        """
+        try:
+            from tela_inicial import ModernDashboard
+            self.withdraw()
+            ModernDashboard(self, usuario=usuario, pre_carga=self.pre_carga)
+        except Exception as e:
+            self.deiconify()
+            messagebox.showerror("Erro", f"Erro ao abrir o dashboard: {e}", parent=self)
 
 
 if __name__ == "__main__":
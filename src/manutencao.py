@@ -0,0 +1,237 @@
+"""
+Manutenção automática do banco de dados SQLite.
+Executa ANALYZE, PRAGMA optimize e VACUUM incremental quando o sistema
+está ocioso e no encerramento da aplicação.
+
+Bancos criados antes do auto_vacuum=INCREMENTAL precisam de uma conversão
+(VACUUM completo, que bloqueia as outras instâncias enquanto reescreve o
+arquivo) feita uma vez, à parte, com o aplicativo fechado:
+
+    python src/manutencao.py --converter
+"""
+import argparse
+import atexit
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import database as db
+
+# Limites que disparam a manutenção
+LIMITE_FRACAO_LIVRE = 0.10       # Fração de páginas livres no arquivo
+LIMITE_PAGINAS_LIVRES = 256      # Mínimo de páginas livres para valer o VACUUM
+LIMITE_LINHAS_ALTERADAS = 1000   # Linhas alteradas desde o último ANALYZE
+
+# Temporização do agendador (segundos)
+TEMPO_OCIOSO = 30.0
+INTERVALO_VERIFICACAO = 15.0
+
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+def estatisticas_banco() -> Dict:
+    """
+    Lê as estatísticas de ocupação do arquivo do banco.
+
+    Returns:
+        Dicionário com paginas, paginas_livres, tamanho_pagina e auto_vacuum
+    """
+    with db.get_connection() as conn:
+        return {
+            "paginas": conn.execute("PRAGMA page_count").fetchone()[0],
+            "paginas_livres": conn.execute("PRAGMA freelist_count").fetchone()[0],
+            "tamanho_pagina": conn.execute("PRAGMA page_size").fetchone()[0],
+            "auto_vacuum": conn.execute("PRAGMA auto_vacuum").fetchone()[0],
+        }
+
+
+def precisa_manutencao(estatisticas: Optional[Dict] = None) -> bool:
+    """
+    Verifica se os limites de fragmentação ou de alterações foram atingidos.
+
+    Args:
+        estatisticas: Resultado de estatisticas_banco() (lido se omitido)
+
+    Returns:
+        True se a manutenção deve ser executada
+    """
+    if db.linhas_alteradas() >= LIMITE_LINHAS_ALTERADAS:
+        return True
+
+    if estatisticas is None:
+        estatisticas = estatisticas_banco()
+
+    if estatisticas["auto_vacuum"] != AUTO_VACUUM_INCREMENTAL:
+        return False  # Páginas livres só voltam ao sistema depois de converter_auto_vacuum
+
+    livres = estatisticas["paginas_livres"]
+    total = max(estatisticas["paginas"], 1)
+    return livres >= LIMITE_PAGINAS_LIVRES and livres / total >= LIMITE_FRACAO_LIVRE
+
+
+def executar_manutencao() -> Dict:
+    """
+    Executa a manutenção do banco de dados.
+
+    - Descarta as alterações antigas do registro de alterações
+    - ANALYZE quando muitas linhas foram alteradas, senão PRAGMA optimize
+    - PRAGMA incremental_vacuum para devolver as páginas livres ao sistema
+      (só em bancos já convertidos, ver converter_auto_vacuum)
+
+    Returns:
+        Dicionário com tempo_ms, paginas_recuperadas e analyze
+    """
+    inicio = time.perf_counter()
+    antes = estatisticas_banco()
+    executou_analyze = False
+
+    with db.get_connection() as conn:
+        db.podar_alteracoes(conn)
+
+        if antes["auto_vacuum"] == AUTO_VACUUM_INCREMENTAL and antes["paginas_livres"] > 0:
+            # O pragma libera uma página por passo; executescript executa
+            # todos os passos (conn.execute pararia no primeiro)
+            conn.executescript("PRAGMA incremental_vacuum;")
+
+        if db.linhas_alteradas() >= LIMITE_LINHAS_ALTERADAS:
+            conn.execute("ANALYZE")
+            executou_analyze = True
+        else:
+            conn.execute("PRAGMA optimize")
+
+    db.zerar_linhas_alteradas()
+    depois = estatisticas_banco()
+
+    return {
+        "tempo_ms": (time.perf_counter() - inicio) * 1000,
+        "paginas_recuperadas": max(antes["paginas"] - depois["paginas"], 0),
+        "bytes_recuperados": max(antes["paginas"] - depois["paginas"], 0) * depois["tamanho_pagina"],
+        "analyze": executou_analyze,
+    }
+
+
+def converter_auto_vacuum() -> Dict:
+    """
+    Converte o banco para auto_vacuum=INCREMENTAL com um VACUUM completo.
+
+    Reescreve o arquivo inteiro mantendo o lock de escrita até o fim:
+    executar uma vez, com o aplicativo fechado. Não faz nada em bancos já
+    convertidos (os criados por database.inicializar_database já nascem
+    assim).
+
+    Returns:
+        Dicionário com convertido, tempo_ms e paginas_recuperadas
+    """
+    inicio = time.perf_counter()
+    antes = estatisticas_banco()
+    if antes["auto_vacuum"] == AUTO_VACUUM_INCREMENTAL:
+        return {"convertido": False, "tempo_ms": 0.0, "paginas_recuperadas": 0}
+
+    with db.get_connection() as conn:
+        conn.execute(f"PRAGMA auto_vacuum = {AUTO_VACUUM_INCREMENTAL}")
+        conn.execute("VACUUM")
+
+    depois = estatisticas_banco()
+    return {
+        "convertido": depois["auto_vacuum"] == AUTO_VACUUM_INCREMENTAL,
+        "tempo_ms": (time.perf_counter() - inicio) * 1000,
+        "paginas_recuperadas": max(antes["paginas"] - depois["paginas"], 0),
+    }
+
+
+class AgendadorManutencao:
+    """
+    Executa a manutenção em segundo plano quando o banco está ocioso
+    e uma última vez no encerramento.
+
+    O resultado da última manutenção e o último erro ficam em
+    `ultimo_resultado` e `ultimo_erro`; `ao_concluir` e `ao_erro`, se
+    informados, são chamados com o resultado (ver executar_manutencao) ou
+    com a exceção, na thread da manutenção.
+    """
+
+    def __init__(self, tempo_ocioso: float = TEMPO_OCIOSO,
+                 intervalo: float = INTERVALO_VERIFICACAO,
+                 ao_concluir: Optional[Callable[[Dict], None]] = None,
+                 ao_erro: Optional[Callable[[Exception], None]] = None):
+        self.tempo_ocioso = tempo_ocioso
+        self.intervalo = intervalo
+        self.ao_concluir = ao_concluir
+        self.ao_erro = ao_erro
+        self.ultimo_resultado: Optional[Dict] = None
+        self.ultimo_erro: Optional[Exception] = None
+        self._parar = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def iniciar(self) -> None:
+        """Inicia a verificação periódica em uma thread de segundo plano."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._executar, name="manutencao-db", daemon=True)
+        self._thread.start()
+        atexit.register(self.parar)
+
+    def parar(self) -> None:
+        """Interrompe o agendador e executa a manutenção de encerramento."""
+        if self._thread is None:
+            return
+        self._parar.set()
+        self._thread.join()
+        self._thread = None
+        atexit.unregister(self.parar)
+        self._tentar_manutencao()
+
+    def _ocioso(self) -> bool:
+        return time.monotonic() - db.ultima_escrita() >= self.tempo_ocioso
+
+    def _executar(self) -> None:
+        while not self._parar.wait(self.intervalo):
+            if self._ocioso():
+                self._tentar_manutencao()
+
+    def _tentar_manutencao(self) -> None:
+        with self._lock:
+            try:
+                if not precisa_manutencao():
+                    return
+                self.ultimo_resultado = executar_manutencao()
+                if self.ao_concluir is not None:
+                    self.ao_concluir(self.ultimo_resultado)
+            except Exception as e:
+                self.ultimo_erro = e
+                if self.ao_erro is not None:
+                    self.ao_erro(e)
+
+
+def descrever_resultado(r: Dict) -> str:
+    """Resumo de uma manutenção (resultado de executar_manutencao) para exibir."""
+    return (f"Manutenção do banco: {r['tempo_ms']:.1f} ms, {r['paginas_recuperadas']} páginas "
+            f"recuperadas ({r['bytes_recuperados'] // 1024} KB){', ANALYZE' if r['analyze'] else ''}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Manutenção do banco SQLite do ProjetoX")
+    parser.add_argument("--db", help="arquivo SQLite (padrão: o da configuração)")
+    parser.add_argument("--converter", action="store_true",
+                        help="converte para auto_vacuum=INCREMENTAL (VACUUM completo; "
+                             "com o aplicativo fechado)")
+    args = parser.parse_args()
+
+    if args.db:
+        db.configurar_banco(db.ALVO_ARQUIVO, args.db)
+
+    if args.converter:
+        r = converter_auto_vacuum()
+        if not r["convertido"]:
+            print(f"{db.DB_PATH} já usa auto_vacuum=INCREMENTAL")
+            return
+        print(f"{db.DB_PATH} convertido em {r['tempo_ms']:.0f} ms "
+              f"({r['paginas_recuperadas']} páginas recuperadas)")
+        return
+
+    print(descrever_resultado(executar_manutencao()))
+
+
+if __name__ == "__main__":
+    main()
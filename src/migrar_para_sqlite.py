@@ -0,0 +1,200 @@
+"""
+Migração do dados_projetos.json para o banco SQLite.
+
+Lê o JSON (snapshot + journal) de forma incremental, converte o formato
+('pessoas' -> participantes) e insere em lotes com executemany, sem os
+índices secundários (recriados no final). Cada lote é uma transação que
+também grava o ponto de controle, então uma migração interrompida continua
+de onde parou ao ser executada de novo.
+
+Uso:
+    python src/migrar_para_sqlite.py [--json dados_projetos.json] [--db projetox.db]
+"""
+import argparse
+import os
+import time
+from itertools import islice
+from typing import Callable, Dict, List
+
+import database as db
+from journal_json import JournalJSON
+
+try:
+    from config import ARQUIVO_PROJETOS
+except ImportError:
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    ARQUIVO_PROJETOS = os.path.join(os.path.dirname(BASE_DIR), 'data', 'dados_projetos.json')
+
+# Projetos por transação (cada commit é um ponto de retomada)
+TAMANHO_LOTE = 10_000
+
+# Cache de páginas da conexão de carga (KiB, valor negativo para o SQLite)
+CACHE_CARGA_KB = 64 * 1024
+
+
+def _assinatura_json(caminho: str) -> str:
+    """Identifica o conteúdo do JSON (snapshot + journal) pelo tamanho e mtime."""
+    partes = []
+    for arquivo in (caminho, caminho + ".journal"):
+        if os.path.exists(arquivo):
+            st = os.stat(arquivo)
+            partes.append(f"{st.st_size}:{st.st_mtime_ns}")
+        else:
+            partes.append("-")
+    return "|".join(partes)
+
+
+def _preparar_controle(conn) -> None:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS migracao_json (
+            arquivo TEXT PRIMARY KEY,
+            assinatura TEXT NOT NULL,
+            projetos INTEGER NOT NULL DEFAULT 0,
+            concluida INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def migrar(caminho_json: str = ARQUIVO_PROJETOS, lote: int = TAMANHO_LOTE,
+           reiniciar: bool = False, progresso: Callable[[str], None] = print) -> Dict:
+    """
+    Migra os projetos do JSON para o banco configurado em database.
+
+    Args:
+        caminho_json: Arquivo dados_projetos.json
+        lote: Projetos por transação
+        reiniciar: Descarta uma migração anterior (interrompida ou concluída)
+            deste arquivo e começa do zero
+        progresso: Função que recebe as mensagens de andamento
+
+    Returns:
+        Dicionário com projetos, etapas, participantes, segundos,
+        linhas_por_segundo e retomado_de (projetos já migrados antes)
+
+    Raises:
+        FileNotFoundError: Se o JSON não existir
+        ValueError: Se o banco de destino já tiver outros projetos ou se o
+            JSON mudou desde a migração interrompida
+    """
+    if not os.path.exists(caminho_json):
+        raise FileNotFoundError(f"Arquivo não encontrado: {caminho_json}")
+
+    arquivo = os.path.abspath(caminho_json)
+    assinatura = _assinatura_json(arquivo)
+    totais = {"projetos": 0, "etapas": 0, "participantes": 0}
+
+    db.inicializar_database()
+    with db.get_connection() as conn:
+        # Carga: menos fsync (WAL + NORMAL continua consistente após uma
+        # queda) e cache maior para os índices da chave primária
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA cache_size = -{CACHE_CARGA_KB}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        _preparar_controle(conn)
+
+        controle = conn.execute(
+            "SELECT assinatura, projetos, concluida FROM migracao_json WHERE arquivo = ?", (arquivo,)
+        ).fetchone()
+
+        conn.execute("BEGIN IMMEDIATE")
+        if controle and reiniciar:
+            # O banco de destino só contém o que esta migração inseriu
+            # (ver verificação abaixo), então pode ser esvaziado
+            conn.execute("DELETE FROM participantes")
+            conn.execute("DELETE FROM etapas")
+            conn.execute("DELETE FROM projetos")
+            conn.execute("DELETE FROM migracao_json WHERE arquivo = ?", (arquivo,))
+            controle = None
+
+        if controle and controle["concluida"]:
+            conn.commit()
+            progresso(f"{arquivo} já foi migrado ({controle['projetos']} projetos); "
+                      f"use --reiniciar para migrar de novo.")
+            return {**totais, "segundos": 0.0, "linhas_por_segundo": 0.0,
+                    "retomado_de": controle["projetos"]}
+
+        if controle is None:
+            if conn.execute("SELECT 1 FROM projetos LIMIT 1").fetchone():
+                conn.rollback()
+                raise ValueError("O banco de destino já tem projetos; migre para um banco vazio.")
+            conn.execute("INSERT INTO migracao_json (arquivo, assinatura) VALUES (?, ?)",
+                         (arquivo, assinatura))
+            ja_migrados = 0
+        elif controle["assinatura"] != assinatura:
+            conn.rollback()
+            raise ValueError("O JSON mudou desde a migração interrompida; use --reiniciar.")
+        else:
+            ja_migrados = controle["projetos"]
+            progresso(f"Retomando a migração após {ja_migrados} projetos.")
+
+        # Índices secundários são recriados de uma vez no final
+        db.remover_indices(conn)
+        conn.commit()
+
+        inicio = time.perf_counter()
+
+        def gravar(buffer: List[Dict]) -> None:
+            conn.execute("BEGIN IMMEDIATE")
+            totais["projetos"] += db._inserir_lote(conn, buffer)
+            totais["etapas"] += sum(len(p.get("etapas", [])) for p in buffer)
+            totais["participantes"] += sum(len(p.get("pessoas", p.get("participantes", []))) for p in buffer)
+            conn.execute("""
+                UPDATE migracao_json SET projetos = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE arquivo = ?
+            """, (ja_migrados + totais["projetos"], arquivo))
+            conn.commit()
+
+            linhas = sum(totais.values())
+            decorrido = time.perf_counter() - inicio
+            progresso(f"  {ja_migrados + totais['projetos']} projetos "
+                      f"({linhas / decorrido if decorrido else 0:.0f} linhas/s)")
+
+        # O journal fica travado durante a leitura: o aplicativo não grava
+        # no JSON enquanto a migração roda
+        projetos = JournalJSON(arquivo).iterar_projetos()
+        try:
+            buffer = []
+            for projeto in islice(projetos, ja_migrados, None):
+                buffer.append(projeto)
+                if len(buffer) >= lote:
+                    gravar(buffer)
+                    buffer = []
+            if buffer:
+                gravar(buffer)
+        finally:
+            projetos.close()
+
+        conn.execute("BEGIN IMMEDIATE")
+        db.criar_indices(conn)
+        conn.execute("UPDATE migracao_json SET concluida = 1, updated_at = CURRENT_TIMESTAMP WHERE arquivo = ?",
+                     (arquivo,))
+        conn.commit()
+        conn.execute("ANALYZE")
+
+    segundos = time.perf_counter() - inicio
+    linhas = sum(totais.values())
+    return {**totais, "segundos": segundos,
+            "linhas_por_segundo": linhas / segundos if segundos else 0.0,
+            "retomado_de": ja_migrados}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Migra o dados_projetos.json para o SQLite")
+    parser.add_argument("--json", default=ARQUIVO_PROJETOS, help="arquivo dados_projetos.json")
+    parser.add_argument("--db", help="arquivo SQLite de destino (padrão: o da configuração)")
+    parser.add_argument("--lote", type=int, default=TAMANHO_LOTE, help="projetos por transação")
+    parser.add_argument("--reiniciar", action="store_true",
+                        help="descarta a migração anterior deste arquivo e começa do zero")
+    args = parser.parse_args()
+
+    if args.db:
+        db.configurar_banco(db.ALVO_ARQUIVO, args.db)
+
+    r = migrar(args.json, args.lote, args.reiniciar)
+    print(f"\n{r['projetos']} projetos, {r['etapas']} etapas e {r['participantes']} participantes "
+          f"migrados para {db.DB_PATH} em {r['segundos']:.1f} s ({r['linhas_por_segundo']:.0f} linhas/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,428 @@
+"""
+Núcleo do ProjetoX: regras de negócio e persistência dos projetos.
+
+Não importa nenhuma biblioteca de interface gráfica e não exibe diálogos:
+as validações e falhas viram exceções tipadas (ErroProjetoX e derivadas),
+que as telas (banco.py, tela_inicial.py) decidem como mostrar. Pode ser
+usado em scripts, serviços e benchmarks.
+"""
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from armazenamento import Armazenamento, ArmazenamentoJSON, Cancelada, criar_armazenamento
+
+try:
+    from config import ARQUIVO_PROJETOS, ARMAZENAMENTO
+    from utils import validar_nome, validar_data
+except ImportError:
+    # Fallback para desenvolvimento
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    ARQUIVO_PROJETOS = os.path.join(os.path.dirname(BASE_DIR), 'data', 'dados_projetos.json')
+    ARMAZENAMENTO = os.environ.get('PROJETOX_ARMAZENAMENTO', 'sqlite')  # Mesmo padrão de config
+
+    def validar_nome(nome: str, min_length: int = 2, max_length: int = 100) -> tuple:
+        if not nome or not nome.strip():
+            return False, "O nome não pode estar vazio."
+        nome = nome.strip()
+        if len(nome) < min_length:
+            return False, f"O nome deve ter pelo menos {min_length} caracteres."
+        if len(nome) > max_length:
+            return False, f"O nome deve ter no máximo {max_length} caracteres."
+        return True, ""
+
+    def validar_data(data: str) -> bool:
+        import re
+        from datetime import datetime
+        if not data:
+            return True
+        padrao = r'^\d{2}[-/]\d{2}[-/]\d{4}$'
+        if not re.match(padrao, data):
+            return False
+        try:
+            dia, mes, ano = re.split(r'[-/]', data)
+            datetime(int(ano), int(mes), int(dia))
+            return True
+        except ValueError:
+            return False
+
+MENSAGEM_DATA_INVALIDA = "Data inválida! Use o formato DD-MM-AAAA ou DD/MM/AAAA"
+
+
+# -----------------------
+# Exceções
+# -----------------------
+
+class ErroProjetoX(Exception):
+    """Erro base do núcleo; a mensagem já pode ser exibida ao usuário."""
+
+
+class ErroValidacao(ErroProjetoX, ValueError):
+    """Dados informados inválidos (nome, data...)."""
+
+
+class ProjetoNaoEncontrado(ErroProjetoX, LookupError):
+    """Não existe projeto com o ID informado."""
+
+    def __init__(self, id_projeto: int):
+        super().__init__(f"Projeto com ID {id_projeto} não encontrado.")
+        self.id_projeto = id_projeto
+
+
+class ParticipanteNaoEncontrado(ErroProjetoX, LookupError):
+    """Não existe participante com o nome informado no projeto."""
+
+    def __init__(self, id_projeto: int, nome: str):
+        super().__init__(f"Participante '{nome}' não encontrado no projeto {id_projeto}.")
+        self.id_projeto = id_projeto
+        self.nome = nome
+
+
+class ErroArmazenamento(ErroProjetoX):
+    """Falha ao ler ou gravar os dados (arquivo, banco, trava)."""
+
+
+@contextmanager
+def _protegido(acao: str):
+    """Converte falhas de E/S, SQLite e JSON em ErroArmazenamento."""
+    try:
+        yield
+    except ErroProjetoX:
+        raise
+    except (OSError, sqlite3.Error, ValueError) as e:
+        raise ErroArmazenamento(f"Erro ao {acao}: {e}") from e
+
+
+# -----------------------
+# Armazenamento
+# -----------------------
+
+_armazenamento: Optional[Armazenamento] = None
+
+
+def armazenamento() -> Armazenamento:
+    """
+    Armazenamento em uso (criado na primeira chamada, conforme config.ARMAZENAMENTO).
+
+    Returns:
+        Armazenamento compartilhado pelo processo
+    """
+    global _armazenamento
+    if _armazenamento is None:
+        _armazenamento = criar_armazenamento(ARMAZENAMENTO, ARQUIVO_PROJETOS)
+    return _armazenamento
+
+
+def definir_armazenamento(novo: Armazenamento) -> None:
+    """
+    Troca o armazenamento em uso (ex.: memória em testes e benchmarks).
+
+    Args:
+        novo: Armazenamento a usar daqui em diante
+    """
+    global _armazenamento
+    _armazenamento = novo
+
+
+# -----------------------
+# Validações
+# -----------------------
+
+def _validar_nome(nome: str, min_length: int, prefixo: str = "") -> str:
+    valido, mensagem = validar_nome(nome, min_length=min_length, max_length=100)
+    if not valido:
+        raise ErroValidacao(f"{prefixo}{mensagem}")
+    return nome.strip()
+
+
+def _validar_data(data: str) -> str:
+    if data and not validar_data(data):
+        raise ErroValidacao(MENSAGEM_DATA_INVALIDA)
+    return data
+
+
+# -----------------------
+# Projetos
+# -----------------------
+
+def inicializar() -> None:
+    """Inicializa o armazenamento (tabelas do SQLite ou arquivo JSON)."""
+    with _protegido("inicializar o armazenamento"):
+        armazenamento().inicializar()
+
+
+def listar_projetos() -> List[Dict]:
+    """
+    Lista todos os projetos com etapas e participantes.
+
+    Returns:
+        Lista de projetos
+
+    Raises:
+        ErroArmazenamento: Se os dados não puderem ser lidos
+    """
+    with _protegido("carregar projetos"):
+        return armazenamento().listar_projetos()
+
+
+class LeituraProjetos:
+    """
+    Leitura de todos os projetos em uma thread própria (só acessa o
+    armazenamento). O resultado chega em `resultado` como (projetos, seq,
+    erro), onde seq é a posição do registro de alterações lida junto com os
+    projetos (None sem registro); quem espera verifica a fila na sua
+    própria thread (ex.: com after() na interface).
+    """
+
+    def __init__(self, nome: str = "leitura-projetos"):
+        self.resultado: "queue.Queue[tuple]" = queue.Queue(maxsize=1)
+        threading.Thread(target=self._ler, name=nome, daemon=True).start()
+
+    def _ler(self) -> None:
+        try:
+            self.resultado.put((*armazenamento().listar_projetos_com_alteracao(), None))
+        except Exception as e:
+            self.resultado.put((None, None, e))
+
+
+def obter_projeto(id_projeto: int) -> Dict:
+    """
+    Retorna um projeto pelo ID.
+
+    Args:
+        id_projeto: ID do projeto
+
+    Returns:
+        Dicionário do projeto
+
+    Raises:
+        ProjetoNaoEncontrado: Se o projeto não existir
+        ErroArmazenamento: Se os dados não puderem ser lidos
+    """
+    with _protegido("buscar projeto"):
+        projeto = armazenamento().obter_projeto(id_projeto)
+    if projeto is None:
+        raise ProjetoNaoEncontrado(id_projeto)
+    return projeto
+
+
+def contar_projetos(busca: str = "", cancelada: Optional[Cancelada] = None) -> int:
+    """
+    Conta os projetos (opcionalmente só os que casam com a busca).
+
+    Args:
+        busca: Texto procurado no nome, cliente ou status (vazio = todos)
+        cancelada: Consultada durante a contagem; True a interrompe
+
+    Raises:
+        ErroArmazenamento: Se os dados não puderem ser lidos
+        database.BuscaCancelada: Se `cancelada()` passou a retornar True
+    """
+    with _protegido("contar projetos"):
+        return armazenamento().contar_projetos(busca, cancelada=cancelada)
+
+
+def listar_projetos_pagina(inicio: int, quantidade: int, ordem: str = "created_at",
+                           decrescente: bool = True, busca: str = "",
+                           cancelada: Optional[Cancelada] = None) -> List[Dict]:
+    """
+    Lista uma página de projetos, ordenada e filtrada pelo armazenamento.
+
+    Args:
+        inicio: Posição do primeiro projeto da página (0 = primeiro)
+        quantidade: Número máximo de projetos
+        ordem: created_at, nome, cliente, prazo ou status
+        decrescente: Ordem decrescente
+        busca: Texto procurado no nome, cliente ou status (vazio = todos)
+        cancelada: Consultada durante a busca; True a interrompe
+
+    Returns:
+        Projetos com id, nome, cliente, prazo, status, total_etapas e
+        etapas_concluidas (sem etapas e participantes)
+
+    Raises:
+        ErroArmazenamento: Se os dados não puderem ser lidos
+        database.BuscaCancelada: Se `cancelada()` passou a retornar True
+    """
+    with _protegido("carregar projetos"):
+        return armazenamento().listar_projetos_pagina(inicio, quantidade, ordem=ordem,
+                                                      decrescente=decrescente, busca=busca,
+                                                      cancelada=cancelada)
+
+
+def gerar_novo_id(dados: Dict) -> int:
+    """
+    Gera um novo ID único para um projeto.
+
+    Args:
+        dados: Dicionário com lista de projetos
+
+    Returns:
+        Novo ID único
+    """
+    if not dados.get("projetos"):
+        return 1
+    return max(p.get("id", 0) for p in dados["projetos"]) + 1
+
+
+def criar_projeto(nome: str, descricao: str = "", cliente: str = "", prazo: str = "",
+                  orcamento: float = 0.0, status: str = "ativo") -> int:
+    """
+    Cria um projeto.
+
+    Returns:
+        ID do projeto criado
+
+    Raises:
+        ErroValidacao: Nome ou prazo inválidos
+        ErroArmazenamento: Se não for possível gravar
+    """
+    nome = _validar_nome(nome, 3)
+    _validar_data(prazo)
+    with _protegido("salvar o projeto"):
+        return armazenamento().adicionar_projeto(nome, cliente=cliente, descricao=descricao, prazo=prazo,
+                                                 orcamento=orcamento, status=status)
+
+
+def atualizar_projeto(id_projeto: int, **campos) -> None:
+    """
+    Atualiza campos de um projeto.
+
+    Args:
+        id_projeto: ID do projeto
+        **campos: nome, cliente, descricao, prazo, orcamento, status
+
+    Raises:
+        ErroValidacao: Nome ou prazo inválidos
+        ProjetoNaoEncontrado: Se o projeto não existir
+        ErroArmazenamento: Se não for possível gravar
+    """
+    if campos.get("nome") is not None:
+        campos["nome"] = _validar_nome(campos["nome"], 3)
+    if campos.get("prazo") is not None:
+        _validar_data(campos["prazo"])
+    with _protegido("salvar dados"):
+        atualizado = armazenamento().atualizar_projeto(id_projeto, **campos)
+    if not atualizado:
+        raise ProjetoNaoEncontrado(id_projeto)
+
+
+def excluir_projeto(id_projeto: int) -> None:
+    """
+    Exclui um projeto (com etapas e participantes).
+
+    Raises:
+        ProjetoNaoEncontrado: Se o projeto não existir
+        ErroArmazenamento: Se não for possível gravar
+    """
+    with _protegido("excluir o projeto"):
+        excluido = armazenamento().excluir_projeto(id_projeto)
+    if not excluido:
+        raise ProjetoNaoEncontrado(id_projeto)
+
+
+def substituir_projetos(dados: Dict) -> None:
+    """
+    Regrava todos os projetos de uma vez (só tem efeito no armazenamento
+    JSON; nos demais cada alteração já foi gravada pela função específica).
+
+    Args:
+        dados: Dicionário com lista de projetos
+    """
+    atual = armazenamento()
+    if isinstance(atual, ArmazenamentoJSON):
+        with _protegido("salvar dados"):
+            atual.substituir(dados.get("projetos", []))
+
+
+# -----------------------
+# Etapas
+# -----------------------
+
+def adicionar_etapa(id_projeto: int, nome: str, status: str = "pendente", prazo: str = "",
+                    responsavel: str = "", descricao: str = "") -> None:
+    """
+    Adiciona uma etapa a um projeto.
+
+    Raises:
+        ErroValidacao: Nome ou prazo inválidos
+        ProjetoNaoEncontrado: Se o projeto não existir
+        ErroArmazenamento: Se não for possível gravar
+    """
+    nome = _validar_nome(nome, 3, "Nome da etapa: ")
+    _validar_data(prazo)
+    with _protegido("adicionar etapa"):
+        adicionada = armazenamento().adicionar_etapa(id_projeto, nome, descricao=descricao, status=status,
+                                                     prazo=prazo, responsavel=responsavel)
+    if not adicionada:
+        raise ProjetoNaoEncontrado(id_projeto)
+
+
+# -----------------------
+# Participantes (identificados pelo nome dentro do projeto)
+# -----------------------
+
+def adicionar_participante(id_projeto: int, nome: str, cargo: str = "", etapa: str = "",
+                           prazo: str = "") -> None:
+    """
+    Adiciona um participante a um projeto.
+
+    Raises:
+        ErroValidacao: Nome ou prazo inválidos
+        ProjetoNaoEncontrado: Se o projeto não existir
+        ErroArmazenamento: Se não for possível gravar
+    """
+    nome = _validar_nome(nome, 2, "Nome: ")
+    _validar_data(prazo)
+    with _protegido("salvar dados"):
+        adicionado = armazenamento().adicionar_participante(id_projeto, nome, cargo=cargo,
+                                                            etapa=etapa, prazo=prazo)
+    if not adicionado:
+        raise ProjetoNaoEncontrado(id_projeto)
+
+
+def _participante_nao_encontrado(id_projeto: int, nome: str) -> ErroProjetoX:
+    """Distingue projeto inexistente de participante inexistente."""
+    obter_projeto(id_projeto)
+    return ParticipanteNaoEncontrado(id_projeto, nome)
+
+
+def atualizar_participante(id_projeto: int, nome_atual: str, nome: str, cargo: str = "",
+                           etapa: str = "", prazo: str = "") -> None:
+    """
+    Atualiza um participante do projeto.
+
+    Args:
+        id_projeto: ID do projeto
+        nome_atual: Nome atual do participante
+        nome, cargo, etapa, prazo: Novos dados
+
+    Raises:
+        ErroValidacao: Nome ou prazo inválidos
+        ProjetoNaoEncontrado / ParticipanteNaoEncontrado: Se não existirem
+        ErroArmazenamento: Se não for possível gravar
+    """
+    nome = _validar_nome(nome, 2, "Nome: ")
+    _validar_data(prazo)
+    with _protegido("salvar dados"):
+        atualizado = armazenamento().atualizar_participante(id_projeto, nome_atual, nome=nome, cargo=cargo,
+                                                            etapa=etapa, prazo=prazo)
+    if not atualizado:
+        raise _participante_nao_encontrado(id_projeto, nome_atual)
+
+
+def remover_participante(id_projeto: int, nome: str) -> None:
+    """
+    Remove um participante do projeto.
+
+    Raises:
+        ProjetoNaoEncontrado / ParticipanteNaoEncontrado: Se não existirem
+        ErroArmazenamento: Se não for possível gravar
+    """
+    with _protegido("salvar dados"):
+        removido = armazenamento().remover_participante(id_projeto, nome)
+    if not removido:
+        raise _participante_nao_encontrado(id_projeto, nome)
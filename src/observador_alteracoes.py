@@ -0,0 +1,111 @@
+"""
+Aviso de alterações feitas no banco SQLite por outras instâncias.
+
+PRAGMA data_version muda quando outra conexão confirma uma escrita no
+banco. Numa conexão mantida aberta, consultá-lo não lê nenhuma tabela,
+então a verificação periódica quase não custa nada enquanto ninguém
+escreve. Quando muda, o registro de alterações (preenchido por gatilhos,
+ver database.GATILHOS_ALTERACOES) diz quais projetos foram tocados desde
+a última verificação, e só esses precisam ser relidos.
+
+O ponto de partida é a posição do registro lida junto com os projetos
+(database.listar_projetos_com_alteracao), passada a sincronizar depois de
+cada carga completa: nenhuma alteração entre a leitura e o início do
+acompanhamento fica de fora.
+
+A posição só avança quando quem verificou confirma que aplicou as
+alterações (confirmar): se a aplicação falhar, a próxima verificação
+informa os mesmos projetos de novo.
+"""
+from typing import NamedTuple, Optional, Set
+
+import database as db
+
+# Mais projetos alterados que isto de uma vez: recarregar tudo
+LIMITE_PROJETOS = 200
+
+
+class Verificacao(NamedTuple):
+    """Resultado de ObservadorAlteracoes.verificar, a passar para confirmar."""
+    desde: int           # Posição do registro de onde a verificação partiu
+    versao: int          # data_version lido antes do registro
+    ultima: int          # Posição da última alteração lida
+    ids: Optional[Set[int]]  # Projetos alterados (None = recarregar tudo)
+
+
+class ObservadorAlteracoes:
+    """
+    Verifica, quando chamado, se outra conexão alterou o banco.
+
+    As escritas desta instância também são vistas (cada operação de
+    database.py usa uma conexão própria); quem aplica as alterações deve
+    ignorar os projetos que já estão em dia. Até a primeira chamada de
+    sincronizar, verificar não informa nada.
+
+    verificar pode rodar em outra thread (a conexão aceita isso), mas uma
+    verificação por vez.
+    """
+
+    def __init__(self, limite: int = LIMITE_PROJETOS):
+        self.limite = limite
+        self._conn = None
+        self._versao: Optional[int] = None
+        self._ultima: Optional[int] = None
+
+    def iniciar(self) -> None:
+        """Abre a conexão."""
+        if self._conn is None:
+            self._conn = db.abrir_conexao()
+
+    def sincronizar(self, seq: int) -> None:
+        """
+        Marca como já vistas as alterações até `seq`.
+
+        Args:
+            seq: Posição do registro lida na mesma transação que os
+                projetos carregados
+        """
+        self._ultima = seq
+        # As alterações feitas depois da carga podem ter mudado data_version
+        # antes desta chamada: a próxima verificação sempre consulta o registro
+        self._versao = None
+
+    def parar(self) -> None:
+        """Fecha a conexão."""
+        if self._conn is None:
+            return
+        self._conn.close()
+        self._conn = None
+
+    def _versao_dados(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def verificar(self) -> Optional[Verificacao]:
+        """
+        Procura projetos alterados depois da última posição confirmada,
+        sem avançá-la.
+
+        Returns:
+            None se nada mudou (ou antes de sincronizar); senão a
+            Verificacao, com os IDs dos projetos criados, alterados ou
+            excluídos ou None quando é preciso recarregar tudo (ver
+            database.projetos_alterados_desde)
+        """
+        desde = self._ultima
+        if desde is None:
+            return None
+        versao = self._versao_dados()
+        if versao == self._versao:
+            return None
+        ultima, ids = db.projetos_alterados_desde(self._conn, desde, self.limite)
+        return Verificacao(desde, versao, ultima, ids)
+
+    def confirmar(self, verificacao: Verificacao) -> None:
+        """
+        Marca as alterações da verificação como aplicadas. Ignorada se a
+        posição mudou desde então (ex.: uma carga completa sincronizou).
+        """
+        if verificacao.desde != self._ultima:
+            return
+        self._versao = verificacao.versao
+        self._ultima = verificacao.ultima
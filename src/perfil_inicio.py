@@ -0,0 +1,138 @@
+"""
+Linha do tempo da abertura do aplicativo.
+
+Ativada pela variável de ambiente PROJETOX_PERFIL_INICIO:
+- "1": ao chegar à primeira pintura, imprime no stderr os marcos da
+  abertura e o tempo de cada import (no formato de python -X importtime:
+  tempo próprio | acumulado, em microssegundos, indentado pela
+  profundidade); marcos posteriores são impressos quando acontecem
+- "sair": o mesmo, e a janela fecha logo após a primeira pintura (usado
+  por benchmarks/bench_inicializacao.py)
+
+Deve ser o primeiro import dos pontos de entrada (login.py,
+tela_inicial.py): os tempos contam a partir daqui e só os imports
+posteriores são medidos. Desativado, não instala nada.
+"""
+import os
+import sys
+import threading
+import time
+from importlib.abc import Loader, MetaPathFinder
+from typing import List, Optional, Tuple
+
+MODO = os.environ.get("PROJETOX_PERFIL_INICIO", "")
+ATIVO = MODO in ("1", "sair")
+SAIR_APOS_PINTURA = MODO == "sair"
+
+# Módulos que não devem ser carregados antes da primeira pintura
+MODULOS_PESADOS = ("matplotlib", "fpdf", "PIL")
+
+_inicio = time.perf_counter()
+_marcos: List[Tuple[str, float]] = []
+# (módulo, próprio, acumulado, profundidade), na ordem em que terminaram
+_imports: List[Tuple[str, float, float, int]] = []
+_relatorio_impresso = False
+
+# Tempo dos imports filhos do módulo sendo executado, por thread
+_pilhas = threading.local()
+
+
+class _CarregadorCronometrado(Loader):
+    """Mede o exec_module do carregador original."""
+
+    def __init__(self, carregador: Loader, nome: str):
+        self._carregador = carregador
+        self._nome = nome
+
+    def create_module(self, spec):
+        return self._carregador.create_module(spec)
+
+    def exec_module(self, modulo) -> None:
+        pilha = getattr(_pilhas, "pilha", None)
+        if pilha is None:
+            pilha = _pilhas.pilha = []
+        pilha.append(0.0)
+        inicio = time.perf_counter()
+        try:
+            self._carregador.exec_module(modulo)
+        finally:
+            acumulado = time.perf_counter() - inicio
+            filhos = pilha.pop()
+            if pilha:
+                pilha[-1] += acumulado
+            _imports.append((self._nome, acumulado - filhos, acumulado, len(pilha)))
+
+    def __getattr__(self, nome):
+        # get_resource_reader, is_package... continuam sendo do original
+        return getattr(self._carregador, nome)
+
+
+class _Cronometro(MetaPathFinder):
+    """Pergunta aos demais buscadores e cronometra o carregador encontrado."""
+
+    def find_spec(self, nome, caminho, alvo=None):
+        for buscador in sys.meta_path:
+            if buscador is self or not hasattr(buscador, "find_spec"):
+                continue
+            spec = buscador.find_spec(nome, caminho, alvo)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _CarregadorCronometrado(spec.loader, nome)
+            return spec
+        return None
+
+
+if ATIVO:
+    sys.meta_path.insert(0, _Cronometro())
+
+
+def decorrido_ms() -> float:
+    """Milissegundos desde o início da abertura."""
+    return (time.perf_counter() - _inicio) * 1000
+
+
+def marcar(nome: str) -> None:
+    """
+    Registra um marco da abertura (não faz nada se o perfil está desativado).
+
+    Args:
+        nome: Descrição do marco ("janela criada", "primeira pintura"...)
+    """
+    if not ATIVO:
+        return
+    _marcos.append((nome, decorrido_ms()))
+    if _relatorio_impresso:
+        print(f"[perfil] {decorrido_ms():9.1f} ms  {nome}", file=sys.stderr, flush=True)
+
+
+def pesados_carregados() -> List[str]:
+    """Módulos de MODULOS_PESADOS já importados."""
+    return [nome for nome in MODULOS_PESADOS if nome in sys.modules]
+
+
+def relatorio(titulo: Optional[str] = None) -> str:
+    """
+    Texto da linha do tempo: marcos, módulos pesados já carregados e
+    tempo de cada import.
+    """
+    linhas = [titulo or "Abertura do ProjetoX (ms desde o início)"]
+    for nome, ms in _marcos:
+        linhas.append(f"{ms:9.1f}  {nome}")
+    pesados = pesados_carregados()
+    linhas.append(f"Módulos pesados carregados: {', '.join(pesados) if pesados else 'nenhum'}")
+    linhas.append("import time: self [us] | cumulative | imported package")
+    for nome, proprio, acumulado, profundidade in _imports:
+        linhas.append(f"import time: {proprio * 1e6:9.0f} | {acumulado * 1e6:10.0f} | "
+                      f"{'  ' * profundidade}{nome}")
+    return "\n".join(linhas)
+
+
+def primeira_pintura() -> None:
+    """Marca a primeira pintura e imprime o relatório no stderr."""
+    global _relatorio_impresso
+    if not ATIVO or _relatorio_impresso:
+        return
+    marcar("primeira pintura")
+    print(relatorio(), file=sys.stderr, flush=True)
+    _relatorio_impresso = True
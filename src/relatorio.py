@@ -1,13 +1,14 @@
 """
 Módulo de geração de relatórios.
 Gera PDFs, CSVs e gráficos dos projetos.
+
+fpdf e matplotlib são importados só pelas funções que os usam: importar
+este módulo não os carrega.
 """
-from fpdf import FPDF
 import datetime
 import os
 import platform
 import csv
-import matplotlib.pyplot as plt
 from typing import Dict, List
 
 try:
@@ -45,13 +46,16 @@ def abrir_arquivo(nome_arquivo: str) -> None:
 # Exportar PDF do projeto
 # -----------------------
 
-def gerar_pdf_projeto(projeto: Dict) -> None:
+def gerar_pdf_projeto(projeto: Dict, abrir: bool = True) -> None:
     """
     Gera um relatório em PDF com os dados do projeto.
     
     Args:
         projeto: Dicionário com dados do projeto
+        abrir: Abre o arquivo gerado no visualizador do sistema
     """
+    from fpdf import FPDF
+
     try:
         pdf = FPDF()
         pdf.add_page()
@@ -119,7 +123,8 @@ def gerar_pdf_projeto(projeto: Dict) -> None:
         nome_arquivo = f"relatorio_{sanitizar_nome_arquivo(nome_proj)}_{projeto.get('id', 'sem_id')}.pdf"
         pdf.output(nome_arquivo)
         print(f"PDF gerado: {nome_arquivo}")
-        abrir_arquivo(nome_arquivo)
+        if abrir:
+            abrir_arquivo(nome_arquivo)
     except Exception as e:
         print(f"Erro ao gerar PDF: {e}")
 
@@ -127,13 +132,16 @@ def gerar_pdf_projeto(projeto: Dict) -> None:
 # Gráfico de Barras Horizontais
 # -----------------------
 
-def gerar_grafico_barras(projeto: Dict) -> None:
+def gerar_grafico_barras(projeto: Dict, abrir: bool = True) -> None:
     """
     Gera um gráfico horizontal de barras com o status das etapas.
     
     Args:
         projeto: Dicionário com dados do projeto
+        abrir: Abre o arquivo gerado no visualizador do sistema
     """
+    import matplotlib.pyplot as plt
+
     try:
         etapas = projeto.get("etapas", [])
         if not etapas:
@@ -177,7 +185,8 @@ def gerar_grafico_barras(projeto: Dict) -> None:
         plt.savefig(nome_arquivo, dpi=150, bbox_inches='tight')
         print(f"Gráfico gerado: {nome_arquivo}")
         plt.close()
-        abrir_arquivo(nome_arquivo)
+        if abrir:
+            abrir_arquivo(nome_arquivo)
     except Exception as e:
         print(f"Erro ao gerar gráfico: {e}")
         plt.close()
@@ -186,12 +195,13 @@ def gerar_grafico_barras(projeto: Dict) -> None:
 # Exportar CSV do projeto
 # -----------------------
 
-def exportar_csv_projeto(projeto: Dict) -> None:
+def exportar_csv_projeto(projeto: Dict, abrir: bool = True) -> None:
     """
     Exporta as etapas e participantes do projeto em formato CSV.
     
     Args:
         projeto: Dicionário com dados do projeto
+        abrir: Abre o arquivo gerado no visualizador do sistema
     """
     try:
         nome_proj = sanitizar_nome_arquivo(projeto.get('nome', 'projeto'))
@@ -235,6 +245,7 @@ def exportar_csv_projeto(projeto: Dict) -> None:
                     ])
         
         print(f"CSV gerado: {nome_arquivo}")
-        abrir_arquivo(nome_arquivo)
+        if abrir:
+            abrir_arquivo(nome_arquivo)
     except Exception as e:
         print(f"Erro ao gerar CSV: {e}")
@@ -0,0 +1,450 @@
+"""
+Tabela com rolagem virtual para listas grandes.
+
+Só as linhas visíveis existem como itens do Treeview: a barra de rolagem
+representa a lista inteira (o total vem de `contar`) e, ao rolar, os itens
+são refeitos com as linhas da nova posição. As linhas são pedidas em blocos
+a `buscar_pagina`, que faz a ordenação e a busca (no banco, no caso do
+SQLite); os últimos blocos ficam em cache para que a rolagem fina não volte
+ao armazenamento a cada passo.
+
+Nenhuma consulta roda na thread da interface. A busca, a ordenação, a
+contagem e os blocos que faltam são pedidos a threads e chegam por uma fila
+verificada com after(); enquanto um bloco não chega, suas linhas aparecem
+como LINHA_CARREGANDO. A digitação é agrupada (ATRASO_BUSCA_MS sem teclas),
+cada nova consulta cancela a anterior (a função `cancelada` passada ao
+armazenamento passa a retornar True, também para os blocos que saíram da
+tela) e o primeiro bloco aparece na tabela antes de a contagem do total
+terminar.
+"""
+import queue
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+
+# Linhas pedidas por vez a buscar_pagina e blocos mantidos em cache
+TAMANHO_BLOCO = 100
+BLOCOS_EM_CACHE = 20
+
+# Linhas por passo da roda do mouse
+LINHAS_POR_PASSO = 3
+
+# Pausa na digitação antes de buscar e intervalo com que a thread da
+# interface verifica os resultados da busca
+ATRASO_BUSCA_MS = 250
+INTERVALO_RESULTADOS_MS = 30
+
+# Texto da primeira coluna das linhas cujo bloco ainda está sendo buscado
+LINHA_CARREGANDO = "Carregando..."
+
+# (título, chave de ordenação ou None, largura)
+Coluna = Tuple[str, Optional[str], int]
+
+
+class TabelaVirtual(ttk.Frame):
+    """
+    Tabela paginada pelo armazenamento, com ordenação pelo cabeçalho e busca.
+
+    `buscar_pagina` e `contar` são chamadas só fora da thread da interface
+    (possivelmente várias ao mesmo tempo), com o argumento nomeado
+    `cancelada`; se levantarem uma exceção, ela é entregue a `ao_erro` na
+    thread da interface.
+
+    Args:
+        master: Widget pai
+        colunas: (título, chave de ordenação ou None se a coluna não ordena, largura)
+        buscar_pagina: (inicio, quantidade, ordem, decrescente, busca, cancelada=None) -> linhas
+        contar: (busca, cancelada=None) -> total de linhas
+        formatar_linha: Valores exibidos de uma linha (as linhas têm 'id')
+        ao_erro: Recebe as falhas de buscar_pagina e contar (None = propagar)
+        ordem: Ordenação inicial (pode não ser uma das colunas)
+        decrescente: Ordem inicial decrescente
+        bootstyle: Estilo do Treeview
+    """
+
+    def __init__(self, master, colunas: Sequence[Coluna],
+                 buscar_pagina: Callable[..., List[Dict]], contar: Callable[..., int],
+                 formatar_linha: Callable[[Dict], Sequence],
+                 ao_erro: Optional[Callable[[Exception], None]] = None,
+                 ordem: str = "created_at", decrescente: bool = True, bootstyle: str = "info"):
+        super().__init__(master)
+        self.colunas = list(colunas)
+        self.buscar_pagina = buscar_pagina
+        self.contar = contar
+        self.formatar_linha = formatar_linha
+        self.ao_erro = ao_erro
+        # Consulta exibida (as pedidas e ainda não respondidas ficam em _pedido)
+        self.ordem = ordem
+        self.decrescente = decrescente
+        self.busca = ""
+
+        self.total = 0
+        self.inicio = 0           # Posição da primeira linha visível
+        self.visiveis = 20        # Recalculado com a altura do Treeview
+        self._blocos: "OrderedDict[int, List[Dict]]" = OrderedDict()
+
+        # Consulta em segundo plano: cada uma tem uma geração, e as de
+        # gerações anteriores estão canceladas
+        self._pedido = (self.busca, self.ordem, self.decrescente)
+        self._geracao = 0
+        self._consultando = False  # Resposta da consulta atual ainda não chegou
+        self._contando = False    # Total ainda sendo contado (self.total é parcial)
+        self._resultados: "queue.Queue[Tuple[int, str, object]]" = queue.Queue()
+        self._busca_agendada = None
+        self._verificacao = None
+        # Blocos sendo buscados, os que a tela mostra agora (os demais pedidos
+        # são cancelados) e os que falharam (não são pedidos de novo até a
+        # próxima consulta)
+        self._blocos_pedidos: Set[int] = set()
+        self._blocos_visiveis: Set[int] = set()
+        self._blocos_falhos: Set[int] = set()
+
+        self._criar_widgets(bootstyle)
+        self.bind("<Destroy>", self._ao_destruir)
+        self._consultar(self.busca, self.ordem, self.decrescente)
+
+    # -----------------------
+    # Widgets
+    # -----------------------
+
+    def _criar_widgets(self, bootstyle: str) -> None:
+        barra = ttk.Frame(self)
+        barra.pack(fill=X, pady=(0, 5))
+
+        ttk.Label(barra, text="🔍").pack(side=LEFT, padx=(0, 5))
+        self.entrada_busca = ttk.Entry(barra, width=40)
+        self.entrada_busca.pack(side=LEFT)
+        self.entrada_busca.bind("<KeyRelease>", self._ao_digitar)
+        self.entrada_busca.bind("<Return>", lambda e: self.buscar(self.entrada_busca.get()))
+        ttk.Button(barra, text="Limpar", bootstyle="secondary-outline",
+                   command=self._limpar_busca).pack(side=LEFT, padx=5)
+
+        self.rotulo_posicao = ttk.Label(barra, bootstyle="secondary")
+        self.rotulo_posicao.pack(side=RIGHT)
+
+        corpo = ttk.Frame(self)
+        corpo.pack(fill=BOTH, expand=YES)
+
+        ids = [f"c{i}" for i in range(len(self.colunas))]
+        self.view = ttk.Treeview(corpo, columns=ids, show="headings", selectmode="browse",
+                                 bootstyle=bootstyle)
+        for id_coluna, (titulo, chave, largura) in zip(ids, self.colunas):
+            comando = (lambda c=chave: self.ordenar(c)) if chave else ""
+            self.view.heading(id_coluna, text=titulo, anchor=W, command=comando)
+            self.view.column(id_coluna, width=largura, anchor=W)
+
+        self.barra_rolagem = ttk.Scrollbar(corpo, orient=VERTICAL, command=self._rolar)
+        self.barra_rolagem.pack(side=RIGHT, fill=Y)
+        self.view.pack(side=LEFT, fill=BOTH, expand=YES)
+
+        self.view.bind("<Configure>", self._ao_redimensionar)
+        self.view.bind("<MouseWheel>", self._ao_rodar)
+        self.view.bind("<Button-4>", lambda e: self.rolar_para(self.inicio - LINHAS_POR_PASSO))
+        self.view.bind("<Button-5>", lambda e: self.rolar_para(self.inicio + LINHAS_POR_PASSO))
+        self.view.bind("<Up>", lambda e: self._mover_selecao(-1))
+        self.view.bind("<Down>", lambda e: self._mover_selecao(1))
+        self.view.bind("<Prior>", lambda e: self.rolar_para(self.inicio - self.visiveis) or "break")
+        self.view.bind("<Next>", lambda e: self.rolar_para(self.inicio + self.visiveis) or "break")
+        self.view.bind("<Home>", lambda e: self.rolar_para(0) or "break")
+        self.view.bind("<End>", lambda e: self.rolar_para(self.total) or "break")
+
+    def _atualizar_cabecalhos(self) -> None:
+        seta = " ▼" if self.decrescente else " ▲"
+        for i, (titulo, chave, _) in enumerate(self.colunas):
+            self.view.heading(f"c{i}", text=titulo + (seta if chave and chave == self.ordem else ""))
+
+    # -----------------------
+    # Dados
+    # -----------------------
+
+    def recarregar(self) -> None:
+        """
+        Recarrega do armazenamento (após alterações), mantendo a busca, a
+        ordem e a posição: o total é recontado em uma thread e as linhas
+        visíveis são buscadas de novo quando ele chega.
+        """
+        if self._pedido != (self.busca, self.ordem, self.decrescente):
+            self._consultar(*self._pedido)  # A consulta pedida já lerá os dados novos
+            return
+        self._nova_geracao()
+        threading.Thread(target=self._recontar_em_segundo_plano,
+                         args=(self._geracao, self.busca),
+                         name="contagem-tabela", daemon=True).start()
+        self._agendar_recebimento()
+
+    def ordenar(self, chave: str) -> None:
+        """Ordena pela chave (a mesma chave de novo inverte a ordem)."""
+        busca, ordem, decrescente = self._pedido
+        if chave == ordem:
+            self._consultar(busca, ordem, not decrescente)
+        else:
+            self._consultar(busca, chave, False)
+
+    def buscar(self, texto: str) -> None:
+        """Mostra só as linhas que casam com o texto (vazio = todas)."""
+        self._cancelar_agendamento()
+        busca, ordem, decrescente = self._pedido
+        if texto.strip() != busca:
+            self._consultar(texto.strip(), ordem, decrescente)
+
+    def _ao_digitar(self, event) -> None:
+        """Busca quando a digitação para por ATRASO_BUSCA_MS."""
+        self._cancelar_agendamento()
+        self._busca_agendada = self.after(ATRASO_BUSCA_MS,
+                                          lambda: self.buscar(self.entrada_busca.get()))
+
+    def _cancelar_agendamento(self) -> None:
+        if self._busca_agendada is not None:
+            self.after_cancel(self._busca_agendada)
+            self._busca_agendada = None
+
+    def _limpar_busca(self) -> None:
+        self.entrada_busca.delete(0, END)
+        self.buscar("")
+
+    def _falhou(self, erro: Exception) -> None:
+        if self.ao_erro is None:
+            raise erro
+        self.ao_erro(erro)
+
+    def _linhas(self, inicio: int, fim: int) -> List[Optional[Dict]]:
+        """
+        Linhas [inicio, fim) dos blocos em cache; as dos blocos que faltam
+        são None e esses blocos são pedidos a uma thread.
+        """
+        linhas: List[Optional[Dict]] = []
+        self._blocos_visiveis = set(range(inicio // TAMANHO_BLOCO, (fim - 1) // TAMANHO_BLOCO + 1))
+        for bloco in sorted(self._blocos_visiveis):
+            deslocamento = bloco * TAMANHO_BLOCO
+            de, ate = max(0, inicio - deslocamento), min(TAMANHO_BLOCO, fim - deslocamento)
+            if bloco in self._blocos:
+                self._blocos.move_to_end(bloco)
+                linhas.extend(self._blocos[bloco][de:ate])
+                continue
+            if bloco not in self._blocos_pedidos and bloco not in self._blocos_falhos:
+                self._pedir_bloco(bloco)
+            linhas.extend([None] * (ate - de))
+        return linhas
+
+    def _guardar_bloco(self, bloco: int, linhas: List[Dict]) -> None:
+        self._blocos[bloco] = linhas
+        self._blocos.move_to_end(bloco)
+        if len(self._blocos) > BLOCOS_EM_CACHE:
+            self._blocos.popitem(last=False)
+
+    # -----------------------
+    # Consulta em segundo plano
+    # -----------------------
+
+    def _nova_geracao(self) -> None:
+        """Cancela as consultas e os blocos pedidos até aqui."""
+        self._geracao += 1
+        self._consultando = True
+        self._blocos_pedidos.clear()
+        self._blocos_falhos.clear()
+
+    def _agendar_recebimento(self) -> None:
+        if self._verificacao is None:
+            self._verificacao = self.after(INTERVALO_RESULTADOS_MS, self._receber_resultados)
+
+    def _consultar(self, busca: str, ordem: str, decrescente: bool) -> None:
+        """Cancela a consulta em andamento e inicia outra em uma thread."""
+        self._pedido = (busca, ordem, decrescente)
+        self._nova_geracao()
+        self.rotulo_posicao.configure(text="Buscando...")
+        threading.Thread(target=self._consultar_em_segundo_plano,
+                         args=(self._geracao, busca, ordem, decrescente),
+                         name="busca-tabela", daemon=True).start()
+        self._agendar_recebimento()
+
+    def _pedir_bloco(self, bloco: int) -> None:
+        """Busca um bloco da consulta exibida em uma thread."""
+        self._blocos_pedidos.add(bloco)
+        threading.Thread(target=self._buscar_bloco_em_segundo_plano,
+                         args=(self._geracao, bloco, self.busca, self.ordem, self.decrescente),
+                         name="bloco-tabela", daemon=True).start()
+        self._agendar_recebimento()
+
+    def _consultar_em_segundo_plano(self, geracao: int, busca: str, ordem: str,
+                                    decrescente: bool) -> None:
+        """Primeiro bloco e depois o total, entregues pela fila de resultados."""
+        def cancelada() -> bool:
+            return geracao != self._geracao
+
+        try:
+            linhas = self.buscar_pagina(0, TAMANHO_BLOCO, ordem, decrescente, busca,
+                                        cancelada=cancelada)
+            self._resultados.put((geracao, "pagina", (busca, ordem, decrescente, linhas)))
+            if len(linhas) < TAMANHO_BLOCO:
+                total = len(linhas)  # Tudo coube no primeiro bloco
+            else:
+                total = self.contar(busca, cancelada=cancelada)
+            self._resultados.put((geracao, "total", total))
+        except Exception as e:
+            # Canceladas levantam exceções que ninguém precisa ver
+            if not cancelada():
+                self._resultados.put((geracao, "erro", e))
+
+    def _recontar_em_segundo_plano(self, geracao: int, busca: str) -> None:
+        """Total da consulta exibida, entregue pela fila de resultados."""
+        def cancelada() -> bool:
+            return geracao != self._geracao
+
+        try:
+            self._resultados.put((geracao, "recontagem", self.contar(busca, cancelada=cancelada)))
+        except Exception as e:
+            if not cancelada():
+                self._resultados.put((geracao, "erro", e))
+
+    def _buscar_bloco_em_segundo_plano(self, geracao: int, bloco: int, busca: str, ordem: str,
+                                       decrescente: bool) -> None:
+        """Um bloco da consulta exibida; cancelado também se sair da tela."""
+        def cancelada() -> bool:
+            return geracao != self._geracao or bloco not in self._blocos_visiveis
+
+        try:
+            linhas = self.buscar_pagina(bloco * TAMANHO_BLOCO, TAMANHO_BLOCO, ordem, decrescente,
+                                        busca, cancelada=cancelada)
+            self._resultados.put((geracao, "bloco", (bloco, linhas)))
+        except Exception as e:
+            # Cancelado ou não, o bloco deixa de estar pendente
+            self._resultados.put((geracao, "erro_bloco", (bloco, None if cancelada() else e)))
+
+    def _receber_resultados(self) -> None:
+        """Aplica os resultados da consulta atual (os de consultas canceladas são descartados)."""
+        self._verificacao = None
+        while True:
+            try:
+                geracao, tipo, valor = self._resultados.get_nowait()
+            except queue.Empty:
+                break
+            if geracao != self._geracao:
+                continue
+            if tipo == "pagina":
+                self.busca, self.ordem, self.decrescente, linhas = valor
+                self._blocos.clear()
+                self._blocos[0] = linhas
+                self.total = len(linhas)
+                self._contando = len(linhas) == TAMANHO_BLOCO
+                self._atualizar_cabecalhos()
+                self.rolar_para(0)
+            elif tipo in ("total", "recontagem"):
+                if tipo == "recontagem":
+                    self._blocos.clear()  # Lidos antes das alterações
+                self.total = valor
+                self._contando = self._consultando = False
+                self.rolar_para(self.inicio)
+            elif tipo == "bloco":
+                bloco, linhas = valor
+                self._blocos_pedidos.discard(bloco)
+                self._guardar_bloco(bloco, linhas)
+                if bloco in self._blocos_visiveis:
+                    self.rolar_para(self.inicio)
+            elif tipo == "erro_bloco":
+                bloco, erro = valor
+                self._blocos_pedidos.discard(bloco)
+                if erro is not None:
+                    self._blocos_falhos.add(bloco)
+                    self._falhou(erro)
+                elif bloco in self._blocos_visiveis:
+                    self.rolar_para(self.inicio)  # Cancelado, mas voltou à tela
+            else:
+                self._contando = self._consultando = False
+                self.rolar_para(self.inicio)
+                self._falhou(valor)
+        if self._consultando or self._blocos_pedidos:
+            self._verificacao = self.after(INTERVALO_RESULTADOS_MS, self._receber_resultados)
+
+    def _ao_destruir(self, event) -> None:
+        """Cancela a consulta e os agendamentos quando a tabela sai da tela."""
+        if event.widget is not self:
+            return
+        self._geracao += 1
+        self._cancelar_agendamento()
+        if self._verificacao is not None:
+            self.after_cancel(self._verificacao)
+            self._verificacao = None
+
+    # -----------------------
+    # Rolagem
+    # -----------------------
+
+    def rolar_para(self, inicio: int) -> None:
+        """Mostra as linhas a partir da posição (limitada à lista)."""
+        self.inicio = max(0, min(inicio, self.total - self.visiveis))
+        fim = min(self.total, self.inicio + self.visiveis)
+        linhas = self._linhas(self.inicio, fim) if fim > self.inicio else []
+
+        selecionado = self.selecionado()
+        self.view.delete(*self.view.get_children())
+        carregando = [LINHA_CARREGANDO] + [""] * (len(self.colunas) - 1)
+        for posicao, linha in enumerate(linhas, start=self.inicio):
+            if linha is None:
+                self.view.insert("", END, iid=f"carregando-{posicao}", values=carregando)
+            else:
+                self.view.insert("", END, iid=str(linha["id"]), values=list(self.formatar_linha(linha)))
+        if selecionado is not None and self.view.exists(str(selecionado)):
+            self.view.selection_set(str(selecionado))
+
+        if self.total:
+            self.barra_rolagem.set(self.inicio / self.total, fim / self.total)
+            total = f"{self.total:,}+ (contando...)" if self._contando else f"{self.total:,}"
+            self.rotulo_posicao.configure(
+                text=f"{self.inicio + 1:,}–{fim:,} de {total}".replace(",", ".")
+            )
+        else:
+            self.barra_rolagem.set(0, 1)
+            self.rotulo_posicao.configure(
+                text="Buscando..." if self._consultando else "Nenhum projeto encontrado")
+
+    def _rolar(self, acao: str, quantidade: str, unidade: Optional[str] = None) -> None:
+        """Comando da barra de rolagem (moveto fração / scroll n units|pages)."""
+        if acao == "moveto":
+            self.rolar_para(round(float(quantidade) * self.total))
+        elif unidade == "pages":
+            self.rolar_para(self.inicio + int(quantidade) * self.visiveis)
+        else:
+            self.rolar_para(self.inicio + int(quantidade))
+
+    def _ao_rodar(self, event) -> str:
+        passos = -1 if event.delta > 0 else 1
+        self.rolar_para(self.inicio + passos * LINHAS_POR_PASSO)
+        return "break"
+
+    def _mover_selecao(self, direcao: int) -> Optional[str]:
+        """Setas: nas bordas da área visível, rola em vez de parar."""
+        itens = self.view.get_children()
+        selecao = self.view.selection()
+        if not itens or not selecao:
+            return None
+        posicao = itens.index(selecao[0]) + direcao
+        if 0 <= posicao < len(itens):
+            return None  # Movimento normal do Treeview
+        self.rolar_para(self.inicio + direcao)
+        itens = self.view.get_children()
+        if itens:
+            alvo = itens[0] if direcao < 0 else itens[-1]
+            self.view.selection_set(alvo)
+            self.view.focus(alvo)
+        return "break"
+
+    def _ao_redimensionar(self, event) -> None:
+        """Ajusta o número de linhas visíveis à altura do Treeview."""
+        altura_linha = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        # Uma linha de altura fica com o cabeçalho
+        visiveis = max(1, event.height // altura_linha - 1)
+        if visiveis != self.visiveis:
+            self.visiveis = visiveis
+            self.rolar_para(self.inicio)
+
+    # -----------------------
+    # Seleção
+    # -----------------------
+
+    def selecionado(self) -> Optional[int]:
+        """ID da linha selecionada ou None (também para uma linha ainda carregando)."""
+        selecao = self.view.selection()
+        return int(selecao[0]) if selecao and selecao[0].isdigit() else None
@@ -1,45 +1,172 @@
 """
 Dashboard moderno do ProjetoX com ttkbootstrap.
 Interface profissional para gerenciamento de projetos.
+
+matplotlib (gráficos), PIL (imagens dos gráficos) e fpdf (PDF) só são
+importados quando usados pela primeira vez, fora do caminho até a primeira
+pintura; PROJETOX_PERFIL_INICIO=1 mostra a linha do tempo da abertura
+(perfil_inicio.py).
 """
+import perfil_inicio
 import os
+import queue
+import threading
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-try:
-    from ttkbootstrap.tableview import Tableview
-except ImportError:
-    from ttkbootstrap.widgets.table import Tableview
 from tkinter import messagebox
 from datetime import datetime
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 # Importações locais
+import nucleo
+from armazenamento import TIPO_SQLITE
+from catalogo_projetos import CatalogoProjetos
+from observador_alteracoes import ObservadorAlteracoes
+from tabela_virtual import TabelaVirtual
+import graficos
 try:
     from config import DATA_DIR
-    import database as db
-    USE_SQLITE = True
+    from manutencao import AgendadorManutencao, descrever_resultado
 except ImportError:
-    USE_SQLITE = False
+    AgendadorManutencao = None
     DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
 
+perfil_inicio.marcar("imports do dashboard")
+
+# Intervalo com que a thread da interface verifica se a carga (ou um
+# gráfico) terminou
+INTERVALO_CARGA_MS = 30
+
+# Intervalo entre as verificações de alterações feitas por outras instâncias
+INTERVALO_ALTERACOES_MS = 1000
 
-class ModernDashboard(ttk.Window):
-    """Dashboard moderno para gestão de projetos."""
+
+def _ler_alteracoes(observador, armazenamento, resultado):
+    """
+    Verifica (em uma thread) as alterações de outras instâncias e relê os
+    projetos alterados; entrega (verificacao, projetos por ID, erro) na fila.
+    """
+    try:
+        verificacao = observador.verificar()
+        projetos = {}
+        if verificacao is not None and verificacao.ids:
+            projetos = {projeto_id: armazenamento.obter_projeto(projeto_id)
+                        for projeto_id in verificacao.ids}
+        resultado.put((verificacao, projetos, None))
+    except Exception as e:
+        resultado.put((None, None, e))
+
+
+class ModernDashboard(ttk.Toplevel):
+    """
+    Dashboard moderno para gestão de projetos.
     
-    def __init__(self):
-        super().__init__(themename="darkly")
-        
-        self.title("ProjetoX - Dashboard")
+    É uma janela filha da janela principal do aplicativo: a do login, que
+    fica escondida enquanto o dashboard está aberto (o login abre o
+    dashboard no mesmo processo). Aberto sozinho, cria uma janela
+    principal escondida. Fechar o dashboard encerra o aplicativo.
+    
+    Args:
+        master: Janela principal (None = criar uma)
+        usuario: Nome do usuário autenticado
+        pre_carga: nucleo.LeituraProjetos iniciada antes da abertura (o
+            login a inicia assim que a senha é aceita); a primeira carga a
+            aproveita em vez de ler tudo de novo
+    """
+    
+    def __init__(self, master=None, usuario=None, pre_carga=None):
+        if master is None:
+            master = ttk.Window(themename="darkly")
+            master.withdraw()
+        else:
+            master.style.theme_use("darkly")
+        super().__init__(master=master)
+        
+        self.usuario = usuario
+        self.title(f"ProjetoX - Dashboard ({usuario})" if usuario else "ProjetoX - Dashboard")
         self.geometry("1400x800")
         self.state('zoomed')  # Maximizar
+        self.protocol("WM_DELETE_WINDOW", self.encerrar)
         
         self.current_page = "dashboard"
-        self.projetos = []
+        self.catalogo = CatalogoProjetos()
+        
+        # Páginas montadas, guardadas (escondidas) ao trocar de página:
+        # id -> [frame, versão do catálogo exibida]. Formulários e o aviso de
+        # carregamento são temporários e descartados ao sair
+        self._paginas = {}
+        self._pagina_visivel = None
+        self._pagina_temporaria = None
+        self.tabela_projetos = None
+        self._rotulo_data = None
+        self.dados_carregados = False
+        
+        # Gráficos renderizados fora da thread da interface (figuras
+        # reaproveitadas), as imagens já exibidas e os rótulos que esperam
+        # uma imagem (com a assinatura dos dados pedidos), por gráfico
+        self.renderizador = graficos.RenderizadorGraficos()
+        self._fotos_graficos = {}
+        self._graficos_pendentes = {}
+        self._verificacao_graficos = None
+        
+        # Carga em segundo plano: cada pedido recebe uma geração nova e só o
+        # resultado da geração atual é aplicado (os anteriores são descartados)
+        self._geracao_carga = 0
+        self._verificacao_carga = None
+        self._ao_concluir_carga = None
+        self._pre_carga = pre_carga
+        
+        # SQLite, JSON ou memória, conforme config.ARMAZENAMENTO (o mesmo
+        # usado pelos diálogos de banco.py)
+        self.armazenamento = nucleo.armazenamento()
+        
+        # Manutenção do banco (ANALYZE/optimize/VACUUM) quando ocioso, com o
+        # tempo gasto e o espaço recuperado (ou o erro) no console
+        usa_sqlite = self.armazenamento.tipo == TIPO_SQLITE
+        self.manutencao = None
+        if usa_sqlite and AgendadorManutencao:
+            self.manutencao = AgendadorManutencao(
+                ao_concluir=lambda r: print(descrever_resultado(r)),
+                ao_erro=lambda e: print(f"Erro na manutenção do banco: {e}"))
+        if self.manutencao:
+            self.manutencao.iniciar()
+        
+        # Alterações de outras instâncias (outra janela do dashboard no mesmo
+        # banco): verificadas periodicamente em uma thread, relendo só os
+        # projetos alterados desde a última carga completa. Uma verificação
+        # por vez, com geração como a carga; uma recarga completa pedida por
+        # elas é refeita se for cancelada
+        self.observador = ObservadorAlteracoes() if usa_sqlite else None
+        self._verificacao_alteracoes = None
+        self._recebimento_alteracoes = None
+        self._geracao_alteracoes = 0
+        self._recarregar_tudo = False
+        if self.observador:
+            try:
+                self.observador.iniciar()
+            except Exception as e:
+                print(f"Alterações de outras instâncias não serão acompanhadas: {e}")
+                self.observador = None
+            else:
+                self._verificacao_alteracoes = self.after(INTERVALO_ALTERACOES_MS,
+                                                          self._verificar_alteracoes)
         
+        # A primeira tela é desenhada com placeholders; os dados chegam depois
         self.setup_ui()
-        self.carregar_dados()
-        
+        perfil_inicio.marcar("janela montada")
+        # Os callbacks ociosos rodam depois do redesenho pendente da janela
+        self.after_idle(self._primeira_pintura)
+    
+    def _primeira_pintura(self):
+        perfil_inicio.marcar("dashboard pintado")
+        perfil_inicio.primeira_pintura()
+        if perfil_inicio.SAIR_APOS_PINTURA:
+            self.after_idle(self.encerrar)
+        
+    @property
+    def projetos(self):
+        """Projetos carregados, na ordem de listagem."""
+        return self.catalogo.projetos
+    
     def setup_ui(self):
         """Configura a interface do dashboard."""
         # Container principal
@@ -81,6 +208,14 @@ class ModernDashboard(ttk.Window):
         )
         title.pack()
         
+        if self.usuario:
+            ttk.Label(
+                logo_frame,
+                text=f"👤 {self.usuario}",
+                font=("Segoe UI", 10),
+                bootstyle="inverse-dark"
+            ).pack(pady=(5, 0))
+        
         ttk.Separator(self.sidebar, bootstyle="secondary").pack(fill=X, padx=10, pady=15)
         
         # Menu de navegação
@@ -115,23 +250,126 @@ class ModernDashboard(ttk.Window):
     
     def navigate(self, command, page_id):
         """Navega para uma página."""
+        # Uma carga pedida pela página anterior não deve redesenhar esta
+        self.cancelar_carga()
         self.current_page = page_id
         command()
     
-    def clear_content(self):
-        """Limpa a área de conteúdo."""
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
+    def mostrar_pagina(self, pagina_id, montar, versao, atualizar=None):
+        """
+        Mostra uma página guardada, montando-a só quando necessário.
+        
+        Se os dados não mudaram desde a montagem (mesma versão do catálogo),
+        a página volta à tela como estava. Se mudaram, `atualizar` a põe em
+        dia no lugar ou, sem `atualizar`, ela é montada de novo.
+        
+        Args:
+            pagina_id: Identificador da página
+            montar: Monta a página no frame recebido
+            versao: Versão dos dados que a página exibe (catalogo.versao)
+            atualizar: Atualiza os dados da página já montada
+        """
+        self.esconder_pagina()
+        guardada = self._paginas.get(pagina_id)
+        if guardada is not None and guardada[1] != versao:
+            if atualizar is not None:
+                atualizar()
+                guardada[1] = versao
+            else:
+                self.descartar_pagina(pagina_id)
+                guardada = None
+        if guardada is None:
+            frame = ttk.Frame(self.content_area)
+            guardada = self._paginas[pagina_id] = [frame, versao]
+            montar(frame)
+        guardada[0].pack(fill=BOTH, expand=YES)
+        self._pagina_visivel = pagina_id
+    
+    def pagina_temporaria(self, pagina_id):
+        """
+        Mostra uma página vazia que é descartada ao trocar de página
+        (formulários e aviso de carregamento).
+        
+        Returns:
+            Frame onde montar a página
+        """
+        self.esconder_pagina()
+        self._pagina_temporaria = ttk.Frame(self.content_area)
+        self._pagina_temporaria.pack(fill=BOTH, expand=YES)
+        self._pagina_visivel = pagina_id
+        return self._pagina_temporaria
+    
+    def esconder_pagina(self):
+        """Tira a página atual da tela (as guardadas continuam montadas)."""
+        if self._pagina_temporaria is not None:
+            self._pagina_temporaria.destroy()
+            self._pagina_temporaria = None
+        guardada = self._paginas.get(self._pagina_visivel)
+        if guardada is not None:
+            guardada[0].pack_forget()
+        self._pagina_visivel = None
+    
+    def descartar_pagina(self, pagina_id):
+        """Destrói uma página guardada (a próxima exibição a monta de novo)."""
+        guardada = self._paginas.pop(pagina_id, None)
+        if guardada is None:
+            return
+        guardada[0].destroy()
+        if pagina_id == "projetos":
+            self.tabela_projetos = None
+        elif pagina_id == "dashboard":
+            self._rotulo_data = None
+    
+    def mostrar_carregando(self, titulo):
+        """Exibe placeholders enquanto os dados são carregados."""
+        pagina = self.pagina_temporaria("carregando")
+        
+        ttk.Label(
+            pagina,
+            text=titulo,
+            font=("Segoe UI", 24, "bold"),
+            bootstyle="inverse"
+        ).pack(anchor=W, pady=(0, 15))
+        
+        # Cards vazios no lugar das estatísticas
+        cards = ttk.Frame(pagina)
+        cards.pack(fill=X, pady=(0, 15))
+        for coluna in range(4):
+            card = ttk.Frame(cards, bootstyle="secondary", padding=10)
+            card.grid(row=0, column=coluna, padx=5, sticky="nsew")
+            cards.columnconfigure(coluna, weight=1)
+            ttk.Label(card, text="—", font=("Segoe UI", 30, "bold"),
+                      bootstyle="inverse-secondary").pack(anchor=W)
+            ttk.Label(card, text=" ", font=("Segoe UI", 11),
+                      bootstyle="inverse-secondary").pack(anchor=W, pady=(2, 0))
+        
+        # Área dos gráficos/tabela
+        corpo = ttk.Frame(pagina, bootstyle="secondary")
+        corpo.pack(fill=BOTH, expand=YES)
+        
+        aviso = ttk.Frame(corpo, bootstyle="secondary")
+        aviso.place(relx=0.5, rely=0.5, anchor=CENTER)
+        ttk.Label(aviso, text="Carregando projetos...", font=("Segoe UI", 13),
+                  bootstyle="inverse-secondary").pack(pady=(0, 10))
+        barra = ttk.Progressbar(aviso, mode="indeterminate", length=300, bootstyle="info-striped")
+        barra.pack()
+        barra.start(15)
     
     def show_dashboard(self):
         """Exibe o dashboard principal com gráficos profissionais."""
-        self.clear_content()
-        
-        # Recarregar dados para garantir que estejam atualizados
-        self.carregar_dados()
-        
+        # As edições feitas nesta janela já atualizam o catálogo; só a
+        # primeira exibição carrega tudo (em segundo plano, com placeholders)
+        if not self.dados_carregados:
+            self.mostrar_carregando("DASHBOARD DE CONTROLE DE PROJETOS")
+            self.carregar_dados(self.show_dashboard)
+            return
+        self.mostrar_pagina("dashboard", self.montar_dashboard, self.catalogo.versao)
+        self._rotulo_data.configure(text=datetime.now().strftime("%d/%m/%Y - %H:%M"))
+    
+    def montar_dashboard(self, pagina):
+        """Monta o dashboard com os dados já carregados."""
         # Cabeçalho com título grande
-        header = ttk.Frame(self.content_area, bootstyle="primary")
+        header = ttk.Frame(pagina, bootstyle="primary")
         header.pack(fill=X, pady=(0, 5))
         
         header_content = ttk.Frame(header)
@@ -152,9 +390,10 @@ class ModernDashboard(ttk.Window):
             bootstyle="inverse-secondary"
         )
         date_label.pack(side=RIGHT, pady=5)
+        self._rotulo_data = date_label
         
         # Container principal com scroll
-        main_container = ttk.Frame(self.content_area)
+        main_container = ttk.Frame(pagina)
         main_container.pack(fill=BOTH, expand=YES, padx=10, pady=10)
         
         if not self.projetos:
@@ -196,15 +435,12 @@ class ModernDashboard(ttk.Window):
         stats_row = ttk.Frame(main_container)
         stats_row.pack(fill=X, pady=(0, 15))
         
-        total_projetos = len(self.projetos)
-        projetos_ativos = sum(1 for p in self.projetos if p.get('status', 'ativo') == 'ativo')
-        projetos_concluidos = sum(1 for p in self.projetos if p.get('status', 'ativo') == 'concluído')
-        total_etapas = sum(len(p.get('etapas', [])) for p in self.projetos)
+        metricas = self.catalogo.metricas()
         
-        self.create_modern_stat_card(stats_row, "Total de Projetos", total_projetos, "📁", "info", 0)
-        self.create_modern_stat_card(stats_row, "Projetos Ativos", projetos_ativos, "✓", "success", 1)
-        self.create_modern_stat_card(stats_row, "Concluídos", projetos_concluidos, "🎯", "warning", 2)
-        self.create_modern_stat_card(stats_row, "Total de Etapas", total_etapas, "📋", "primary", 3)
+        self.create_modern_stat_card(stats_row, "Total de Projetos", metricas.total_projetos, "📁", "info", 0)
+        self.create_modern_stat_card(stats_row, "Projetos Ativos", metricas.projetos_com_status('ativo'), "✓", "success", 1)
+        self.create_modern_stat_card(stats_row, "Concluídos", metricas.projetos_com_status('concluído'), "🎯", "warning", 2)
+        self.create_modern_stat_card(stats_row, "Total de Etapas", metricas.total_etapas, "📋", "primary", 3)
         
         # Linha 2: Dois gráficos lado a lado
         row2 = ttk.Frame(main_container)
@@ -264,195 +500,100 @@ class ModernDashboard(ttk.Window):
             bootstyle=f"inverse-{style}"
         ).pack(anchor=W, pady=(2, 0))
     
+    def exibir_grafico(self, parent, chave, dados, **pack):
+        """
+        Exibe um gráfico, renderizado em segundo plano.
+        
+        Com os mesmos dados da exibição anterior a imagem já pronta aparece
+        na hora; senão fica um aviso no lugar do gráfico até a thread de
+        renderização entregar a imagem (cada gráfico aparece assim que fica
+        pronto, sem esperar os demais).
+        """
+        rotulo = ttk.Label(parent, anchor=CENTER)
+        rotulo.pack(fill=BOTH, expand=YES, **pack)
+        
+        assinatura, foto = self._fotos_graficos.get(chave, (None, None))
+        if foto is not None and assinatura == hash(dados):
+            rotulo.configure(image=foto)
+            rotulo.image = foto  # Manter referência
+            return
+        
+        rotulo.configure(text="⏳ Gerando gráfico...", bootstyle="secondary")
+        self._graficos_pendentes[chave] = (rotulo, hash(dados))
+        self.renderizador.pedir(chave, dados)
+        if self._verificacao_graficos is None:
+            self._verificacao_graficos = self.after(INTERVALO_CARGA_MS, self._receber_graficos)
+    
+    def _receber_graficos(self):
+        """Exibe os gráficos que a thread de renderização já entregou."""
+        self._verificacao_graficos = None
+        while True:
+            try:
+                chave, imagem, erro = self.renderizador.resultados.get_nowait()
+            except queue.Empty:
+                break
+            rotulo, assinatura = self._graficos_pendentes.get(chave, (None, None))
+            if imagem is not None and imagem.assinatura != assinatura:
+                continue  # Pedido de uma montagem anterior da página
+            self._graficos_pendentes.pop(chave, None)
+            if rotulo is None or not rotulo.winfo_exists():
+                continue
+            if erro is not None:
+                rotulo.configure(text=f"Erro ao gerar gráfico: {erro}")
+                continue
+            
+            # PhotoImage só pode ser criada na thread da interface
+            from PIL import Image, ImageTk
+            foto = ImageTk.PhotoImage(Image.frombuffer(
+                "RGBA", (imagem.largura, imagem.altura), imagem.rgba, "raw", "RGBA", 0, 1
+            ))
+            self._fotos_graficos[chave] = (imagem.assinatura, foto)
+            rotulo.configure(image=foto, text="")
+            rotulo.image = foto  # Manter referência
+        
+        if self._graficos_pendentes:
+            self._verificacao_graficos = self.after(INTERVALO_CARGA_MS, self._receber_graficos)
+    
     def create_projects_evolution_chart(self, parent):
         """Gráfico de linha: Evolução de projetos ao longo dos meses."""
         chart_frame = ttk.Labelframe(parent, text="Evolução de Projetos por Mês", bootstyle="primary")
         chart_frame.pack(side=LEFT, fill=BOTH, expand=YES, padx=(0, 5))
         
-        fig, ax = plt.subplots(figsize=(7, 4.5), facecolor='#222')
-        ax.set_facecolor('#222')
-        
-        # Agrupar projetos por mês (simulado com os últimos 12 meses)
-        meses = ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun', 'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez']
         # Simular distribuição (em produção, use dados reais de created_at)
-        valores = []
-        base = len(self.projetos) // 12
-        for i in range(12):
-            import random
-            valores.append(max(0, base + random.randint(-2, 3)))
-        
-        # Linha com marcadores
-        line = ax.plot(meses, valores, marker='o', linewidth=3, markersize=8, color='#3498db', label='Projetos Criados')
-        ax.fill_between(range(len(meses)), valores, alpha=0.3, color='#3498db')
-        
-        # Adicionar valores nos pontos
-        for i, (mes, val) in enumerate(zip(meses, valores)):
-            ax.text(i, val + 0.5, str(val), ha='center', va='bottom', color='white', fontsize=9, fontweight='bold')
-        
-        ax.set_ylabel('Quantidade', color='white', fontsize=11)
-        ax.set_xlabel('Mês', color='white', fontsize=11)
-        ax.tick_params(colors='white', labelsize=9)
-        ax.spines['bottom'].set_color('#444')
-        ax.spines['left'].set_color('#444')
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.grid(True, alpha=0.1, linestyle='--')
-        ax.legend(loc='upper left', framealpha=0.8)
-        
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=BOTH, expand=YES, padx=10, pady=10)
+        self.exibir_grafico(chart_frame, 'evolucao', graficos.dados_evolucao(self.catalogo.metricas()), padx=10, pady=10)
     
     def create_projects_by_client_chart(self, parent):
-        """Gráfico de barras horizontais: Projetos por Cliente."""
+        """Gráfico de barras horizontais: Projetos por Cliente (top 8)."""
         chart_frame = ttk.Labelframe(parent, text="Projetos por Cliente", bootstyle="success")
         chart_frame.pack(side=RIGHT, fill=BOTH, expand=YES, padx=(5, 0))
         
-        # Contar projetos por cliente
-        clientes = {}
-        for p in self.projetos:
-            cliente = p.get('cliente', 'Sem cliente')
-            clientes[cliente] = clientes.get(cliente, 0) + 1
-        
-        if not clientes:
+        dados = graficos.dados_clientes(self.catalogo.metricas())
+        if not dados:
             ttk.Label(chart_frame, text="Sem dados", bootstyle="secondary").pack(expand=YES)
             return
         
-        # Top 8 clientes
-        top_clientes = sorted(clientes.items(), key=lambda x: x[1], reverse=True)[:8]
-        nomes = [c[0][:20] + '...' if len(c[0]) > 20 else c[0] for c in top_clientes]
-        valores = [c[1] for c in top_clientes]
-        
-        fig, ax = plt.subplots(figsize=(7, 4.5), facecolor='#222')
-        ax.set_facecolor('#222')
-        
-        bars = ax.barh(nomes, valores, color='#27ae60', height=0.6)
-        
-        # Adicionar valores nas barras
-        for bar, val in zip(bars, valores):
-            width = bar.get_width()
-            ax.text(width + 0.1, bar.get_y() + bar.get_height()/2, 
-                   f'{int(val)}', ha='left', va='center', color='white', fontsize=10, fontweight='bold')
-        
-        ax.set_xlabel('Número de Projetos', color='white', fontsize=11)
-        ax.tick_params(colors='white', labelsize=9)
-        ax.spines['bottom'].set_color('#444')
-        ax.spines['left'].set_color('#444')
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.grid(axis='x', alpha=0.1, linestyle='--')
-        
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=BOTH, expand=YES, padx=10, pady=10)
+        self.exibir_grafico(chart_frame, 'clientes', dados, padx=10, pady=10)
     
     def create_budget_by_project_chart(self, parent):
-        """Gráfico de barras verticais: Orçamento por Projeto."""
+        """Gráfico de barras verticais: Orçamento por Projeto (top 10)."""
         chart_frame = ttk.Labelframe(parent, text="Orçamento por Projeto", bootstyle="warning")
         chart_frame.pack(side=LEFT, fill=BOTH, expand=YES, padx=(0, 5))
         
-        # Top 10 projetos por orçamento
-        projetos_com_orcamento = [(p['nome'], p.get('orcamento', 0)) for p in self.projetos]
-        projetos_com_orcamento.sort(key=lambda x: x[1], reverse=True)
-        top_10 = projetos_com_orcamento[:10]
-        
-        if not any(x[1] > 0 for x in top_10):
+        dados = graficos.dados_orcamento(self.catalogo.metricas())
+        if not dados:
             ttk.Label(chart_frame, text="Nenhum orçamento cadastrado", bootstyle="secondary", 
                      font=("Segoe UI", 11)).pack(expand=YES)
             return
         
-        nomes = [p[0][:12] + '...' if len(p[0]) > 12 else p[0] for p in top_10]
-        valores = [p[1] for p in top_10]
-        
-        fig, ax = plt.subplots(figsize=(7, 6), facecolor='#222')
-        ax.set_facecolor('#222')
-        
-        bars = ax.bar(range(len(nomes)), valores, color='#f39c12', width=0.6)
-        
-        # Adicionar valores em cima das barras
-        for bar, val in zip(bars, valores):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2, height + max(valores)*0.02,
-                   f'R$ {val:,.0f}', ha='center', va='bottom', color='white', fontsize=8, fontweight='bold')
-        
-        ax.set_ylabel('Orçamento (R$)', color='white', fontsize=11)
-        ax.set_xticks(range(len(nomes)))
-        ax.set_xticklabels(nomes, rotation=45, ha='right')
-        ax.tick_params(colors='white', labelsize=9)
-        ax.spines['bottom'].set_color('#444')
-        ax.spines['left'].set_color('#444')
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.grid(axis='y', alpha=0.1, linestyle='--')
-        
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=BOTH, expand=YES, padx=10, pady=10)
+        self.exibir_grafico(chart_frame, 'orcamento', dados, padx=10, pady=10)
     
     def create_project_progress_chart(self, parent):
         """Gráfico de barras horizontais: Progresso de conclusão dos projetos."""
         chart_frame = ttk.Labelframe(parent, text="Progresso de Conclusão (%)", bootstyle="info")
         chart_frame.pack(side=RIGHT, fill=BOTH, expand=YES, padx=(5, 0))
         
-        # Calcular progresso (top 10)
-        projetos_progresso = []
-        for p in self.projetos:
-            etapas = p.get('etapas', [])
-            if etapas:
-                concluidas = sum(1 for e in etapas if e.get('status') == 'concluído')
-                progresso = (concluidas / len(etapas)) * 100
-            else:
-                progresso = 0
-            projetos_progresso.append((p['nome'], progresso))
-        
-        # Ordenar por progresso (menores primeiro para mostrar o que precisa atenção)
-        projetos_progresso.sort(key=lambda x: x[1])
-        top_10 = projetos_progresso[:10]
-        
-        nomes = [p[0][:20] + '...' if len(p[0]) > 20 else p[0] for p in top_10]
-        valores = [p[1] for p in top_10]
-        
-        fig, ax = plt.subplots(figsize=(7, 6), facecolor='#222')
-        ax.set_facecolor('#222')
-        
-        # Cores gradientes baseadas no progresso
-        cores = []
-        for v in valores:
-            if v >= 80:
-                cores.append('#27ae60')  # Verde
-            elif v >= 50:
-                cores.append('#f39c12')  # Laranja
-            else:
-                cores.append('#e74c3c')  # Vermelho
-        
-        bars = ax.barh(nomes, valores, color=cores, height=0.6)
-        
-        # Adicionar valores nas barras
-        for bar, val in zip(bars, valores):
-            width = bar.get_width()
-            ax.text(width + 2, bar.get_y() + bar.get_height()/2, 
-                   f'{val:.0f}%', ha='left', va='center', color='white', fontsize=9, fontweight='bold')
-        
-        ax.set_xlabel('Progresso (%)', color='white', fontsize=11)
-        ax.set_xlim(0, 105)
-        ax.tick_params(colors='white', labelsize=9)
-        ax.spines['bottom'].set_color('#444')
-        ax.spines['left'].set_color('#444')
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.grid(axis='x', alpha=0.1, linestyle='--')
-        
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=BOTH, expand=YES, padx=10, pady=10)
+        # Menores progressos primeiro para mostrar o que precisa atenção
+        self.exibir_grafico(chart_frame, 'progresso', graficos.dados_progresso(self.catalogo.metricas()), padx=10, pady=10)
     
     def create_stat_card(self, parent, title, value, style, column):
         """Cria um card de estatística."""
@@ -476,59 +617,22 @@ class ModernDashboard(ttk.Window):
         )
         title_label.pack(pady=(0, 20))
     
-    def create_progress_chart(self, parent):
-        """Cria gráfico de progresso dos projetos."""
-        chart_frame = ttk.Labelframe(
-            parent,
-            text="📊 Progresso dos Projetos",
-            bootstyle="info"
-        )
-        chart_frame.pack(fill=BOTH, expand=YES, pady=10, padx=5)
-        
-        # Criar figura matplotlib
-        fig, ax = plt.subplots(figsize=(10, 4), facecolor='#222')
-        ax.set_facecolor('#222')
-        
-        nomes = [p['nome'][:20] + '...' if len(p['nome']) > 20 else p['nome'] for p in self.projetos[:10]]
-        progressos = []
-        
-        for p in self.projetos[:10]:
-            etapas = p.get('etapas', [])
-            if etapas:
-                concluidas = sum(1 for e in etapas if e.get('status') == 'concluído')
-                progresso = (concluidas / len(etapas)) * 100
-            else:
-                progresso = 0
-            progressos.append(progresso)
-        
-        bars = ax.barh(nomes, progressos, color='#375a7f')
-        ax.set_xlabel('Progresso (%)', color='white')
-        ax.set_xlim(0, 100)
-        ax.tick_params(colors='white')
-        ax.spines['bottom'].set_color('white')
-        ax.spines['left'].set_color('white')
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        
-        # Adicionar valores nas barras
-        for bar, progresso in zip(bars, progressos):
-            width = bar.get_width()
-            ax.text(width + 2, bar.get_y() + bar.get_height()/2, 
-                   f'{progresso:.0f}%', ha='left', va='center', color='white')
-        
-        plt.tight_layout()
-        
-        # Incorporar no tkinter
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=BOTH, expand=YES, padx=10, pady=10)
-    
     def show_projetos(self):
-        """Exibe a lista de projetos."""
-        self.clear_content()
-        
+        """
+        Exibe a lista de projetos.
+        
+        A tabela busca as linhas no armazenamento conforme a rolagem (só as
+        visíveis viram itens), então a página não espera a carga de todos
+        os projetos. Se os dados mudaram, a tabela guardada só relê as
+        linhas visíveis (busca, ordem e posição são mantidas).
+        """
+        atualizar = self.tabela_projetos.recarregar if self.tabela_projetos is not None else None
+        self.mostrar_pagina("projetos", self.montar_projetos, self.catalogo.versao, atualizar)
+    
+    def montar_projetos(self, pagina):
+        """Monta a página de projetos."""
         # Cabeçalho
-        header = ttk.Frame(self.content_area)
+        header = ttk.Frame(pagina)
         header.pack(fill=X, pady=(0, 20))
         
         title = ttk.Label(
@@ -547,10 +651,11 @@ class ModernDashboard(ttk.Window):
         )
         btn_novo.pack(side=RIGHT)
         
-        # Tabela de projetos
-        if not self.projetos:
+        # Tabela de projetos (o catálogo diz se há projetos sem consultar o
+        # armazenamento; antes da carga, a própria tabela informa)
+        if self.dados_carregados and not len(self.catalogo):
             empty_label = ttk.Label(
-                self.content_area,
+                pagina,
                 text="Nenhum projeto encontrado.\nClique em 'Novo Projeto' para começar!",
                 font=("Segoe UI", 14),
                 bootstyle="secondary",
@@ -559,51 +664,27 @@ class ModernDashboard(ttk.Window):
             empty_label.pack(expand=YES)
             return
         
-        # Frame da tabela
-        table_frame = ttk.Frame(self.content_area)
-        table_frame.pack(fill=BOTH, expand=YES)
-        
-        # Criar dados para tabela
-        columns = ["Nome", "Cliente", "Prazo", "Etapas", "Progresso", "Status"]
-        rows = []
-        
-        for p in self.projetos:
-            etapas = p.get('etapas', [])
-            total_etapas = len(etapas)
-            
-            if total_etapas > 0:
-                concluidas = sum(1 for e in etapas if e.get('status') == 'concluído')
-                progresso = f"{(concluidas/total_etapas)*100:.0f}%"
-            else:
-                progresso = "0%"
-            
-            rows.append([
-                p['nome'],
-                p.get('cliente', 'N/A'),
-                p.get('prazo', 'N/A'),
-                str(total_etapas),
-                progresso,
-                p.get('status', 'ativo').upper()
-            ])
-        
-        # Tableview
-        table = Tableview(
-            table_frame,
-            coldata=columns,
-            rowdata=rows,
-            paginated=True,
-            searchable=True,
-            bootstyle="info",
-            pagesize=15,
-            height=20
+        # Colunas: (título, ordenação no armazenamento, largura)
+        columns = [("Nome", "nome", 280), ("Cliente", "cliente", 200), ("Prazo", "prazo", 110),
+                   ("Etapas", None, 70), ("Progresso", None, 90), ("Status", "status", 110)]
+        
+        table = TabelaVirtual(
+            pagina,
+            colunas=columns,
+            buscar_pagina=self.buscar_pagina_projetos,
+            contar=self.contar_projetos,
+            formatar_linha=self.linha_tabela,
+            ao_erro=self.erro_tabela,
+            bootstyle="info"
         )
         table.pack(fill=BOTH, expand=YES, padx=5, pady=5)
+        self.tabela_projetos = table
         
         # Bind duplo clique
         table.view.bind("<Double-Button-1>", self.on_projeto_double_click)
         
         # Frame de ações
-        actions_frame = ttk.Frame(self.content_area)
+        actions_frame = ttk.Frame(pagina)
         actions_frame.pack(fill=X, pady=(10, 0))
         
         btn_editar = ttk.Button(
@@ -622,74 +703,102 @@ class ModernDashboard(ttk.Window):
         )
         btn_excluir.pack(side=LEFT, padx=5)
     
+    def contar_projetos(self, busca, cancelada=None):
+        """Total de projetos da tabela (chamado também pela thread de busca)."""
+        return self.armazenamento.contar_projetos(busca, cancelada=cancelada)
+    
+    def buscar_pagina_projetos(self, inicio, quantidade, ordem, decrescente, busca, cancelada=None):
+        """Página de projetos da tabela, ordenada e filtrada pelo armazenamento."""
+        return self.armazenamento.listar_projetos_pagina(
+            inicio, quantidade, ordem=ordem, decrescente=decrescente, busca=busca,
+            cancelada=cancelada
+        )
+    
+    def erro_tabela(self, erro):
+        """Falha ao ler os projetos da tabela."""
+        messagebox.showerror("Erro", f"Erro ao carregar projetos: {erro}")
+    
+    def linha_tabela(self, p):
+        """Valores de uma linha da tabela (linha de listar_projetos_pagina)."""
+        total_etapas = p.get('total_etapas', 0)
+        
+        if total_etapas > 0:
+            progresso = f"{(p.get('etapas_concluidas', 0)/total_etapas)*100:.0f}%"
+        else:
+            progresso = "0%"
+        
+        return [
+            p['nome'],
+            p.get('cliente') or 'N/A',
+            p.get('prazo') or 'N/A',
+            str(total_etapas),
+            progresso,
+            (p.get('status') or 'ativo').upper()
+        ]
+    
+    def projeto_selecionado(self, table):
+        """Projeto completo (com etapas e participantes) da linha selecionada."""
+        projeto_id = table.selecionado()
+        if projeto_id is None:
+            return None
+        try:
+            projeto = self.armazenamento.obter_projeto(projeto_id)
+        except Exception as e:
+            messagebox.showerror("Erro", f"Erro ao carregar projeto: {e}")
+            return None
+        if projeto is None:
+            # Excluído por outra instância: tirar a linha da tabela
+            table.recarregar()
+        return projeto
+    
     def on_projeto_double_click(self, event):
         """Handler para duplo clique em projeto."""
-        # Pegar item selecionado
-        widget = event.widget
-        selection = widget.selection()
-        if selection:
-            item = widget.item(selection[0])
-            nome_projeto = item['values'][0]
-            
-            # Buscar projeto completo
-            projeto = next((p for p in self.projetos if p['nome'] == nome_projeto), None)
-            if projeto:
-                self.visualizar_projeto_detalhado(projeto)
+        if event.widget.identify_region(event.x, event.y) == "heading":
+            return
+        projeto = self.projeto_selecionado(self.tabela_projetos)
+        if projeto:
+            self.visualizar_projeto_detalhado(projeto)
     
     def editar_projeto_selecionado(self, table):
         """Edita o projeto selecionado."""
-        selected = table.view.selection()
-        if not selected:
+        if table.selecionado() is None:
             messagebox.showwarning("Aviso", "Selecione um projeto para editar.")
             return
         
-        # Pegar nome do projeto
-        item = table.view.item(selected[0])
-        nome_projeto = item['values'][0]
-        
-        # Buscar projeto completo
-        projeto = next((p for p in self.projetos if p['nome'] == nome_projeto), None)
+        projeto = self.projeto_selecionado(table)
         if projeto:
             self.abrir_editor_projeto(projeto)
     
     def excluir_projeto_selecionado(self, table):
         """Exclui o projeto selecionado."""
-        selected = table.view.selection()
-        if not selected:
+        if table.selecionado() is None:
             messagebox.showwarning("Aviso", "Selecione um projeto para excluir.")
             return
         
-        # Pegar nome do projeto
-        item = table.view.item(selected[0])
-        nome_projeto = item['values'][0]
+        projeto = self.projeto_selecionado(table)
+        if not projeto:
+            return
         
         confirma = messagebox.askyesno(
             "Confirmar Exclusão",
-            f"Tem certeza que deseja excluir o projeto '{nome_projeto}'?\n\nEsta ação não pode ser desfeita e removerá:\n• Todas as etapas\n• Todos os participantes\n• Todos os dados relacionados"
+            f"Tem certeza que deseja excluir o projeto '{projeto['nome']}'?\n\nEsta ação não pode ser desfeita e removerá:\n• Todas as etapas\n• Todos os participantes\n• Todos os dados relacionados"
         )
         
         if confirma:
             try:
-                if USE_SQLITE:
-                    # Buscar ID do projeto
-                    projeto = next((p for p in self.projetos if p['nome'] == nome_projeto), None)
-                    if projeto:
-                        db.excluir_projeto(projeto['id'])
-                        messagebox.showinfo("Sucesso", "Projeto excluído com sucesso!")
-                        self.carregar_dados()
-                        self.show_projetos()
-                else:
-                    messagebox.showerror("Erro", "Exclusão requer SQLite.")
+                self.armazenamento.excluir_projeto(projeto['id'])
+                messagebox.showinfo("Sucesso", "Projeto excluído com sucesso!")
+                self.atualizar_projeto_local(projeto['id'])
             except Exception as e:
                 messagebox.showerror("Erro", f"Erro ao excluir projeto: {e}")
     
     def novo_projeto(self):
         """Abre janela para criar novo projeto."""
-        self.clear_content()
+        pagina = self.pagina_temporaria("novo")
         
         # Cabeçalho
         title = ttk.Label(
-            self.content_area,
+            pagina,
             text="Criar Novo Projeto",
             font=("Segoe UI", 32, "bold"),
             bootstyle="inverse"
@@ -697,7 +806,7 @@ class ModernDashboard(ttk.Window):
         title.pack(pady=(0, 30))
         
         # Formulário
-        form_frame = ttk.Frame(self.content_area)
+        form_frame = ttk.Frame(pagina)
         form_frame.pack(fill=BOTH, expand=YES, padx=100)
         
         # Nome do projeto
@@ -762,20 +871,16 @@ class ModernDashboard(ttk.Window):
         
         try:
             # Adicionar ao banco
-            if USE_SQLITE:
-                db.adicionar_projeto(
-                    nome=nome,
-                    cliente=cliente,
-                    prazo=prazo,
-                    orcamento=float(orcamento) if orcamento else 0.0,
-                    descricao=descricao if descricao else ""
-                )
-            else:
-                messagebox.showerror("Erro", "Sistema configurado apenas para SQLite")
-                return
+            projeto_id = self.armazenamento.adicionar_projeto(
+                nome=nome,
+                cliente=cliente,
+                prazo=prazo,
+                orcamento=float(orcamento) if orcamento else 0.0,
+                descricao=descricao if descricao else ""
+            )
             
             messagebox.showinfo("Sucesso", "Projeto criado com sucesso!")
-            self.carregar_dados()
+            self.atualizar_projeto_local(projeto_id)
             self.show_projetos()
             
         except Exception as e:
@@ -783,10 +888,16 @@ class ModernDashboard(ttk.Window):
     
     def show_relatorios(self):
         """Exibe a tela de relatórios."""
-        self.clear_content()
-        
+        if not self.dados_carregados:
+            self.mostrar_carregando("Relatórios e Gráficos")
+            self.carregar_dados(self.show_relatorios)
+            return
+        self.mostrar_pagina("relatorios", self.montar_relatorios, self.catalogo.versao)
+    
+    def montar_relatorios(self, pagina):
+        """Monta a página de relatórios com os dados já carregados."""
         # Cabeçalho
-        header = ttk.Frame(self.content_area)
+        header = ttk.Frame(pagina)
         header.pack(fill=X, pady=(0, 20))
         
         title = ttk.Label(
@@ -816,7 +927,7 @@ class ModernDashboard(ttk.Window):
         btn_pdf.pack(side=RIGHT, padx=5)
         
         # Container de gráficos
-        charts_container = ttk.Frame(self.content_area)
+        charts_container = ttk.Frame(pagina)
         charts_container.pack(fill=BOTH, expand=YES)
         
         # Primeira linha de gráficos
@@ -836,16 +947,169 @@ class ModernDashboard(ttk.Window):
         # Gráfico de etapas
         self.create_etapas_chart(row2)
     
-    def carregar_dados(self):
-        """Carrega os dados dos projetos."""
+    def carregar_dados(self, ao_concluir=None):
+        """
+        Carrega os projetos em uma thread separada.
+        
+        A thread só lê o armazenamento; o resultado volta para a thread da
+        interface por uma fila verificada com after(), onde self.projetos é
+        atualizado e ao_concluir é chamado. Um novo pedido (ou
+        cancelar_carga) descarta o resultado de qualquer carga anterior.
+        
+        Args:
+            ao_concluir: Função chamada (sem argumentos) depois da carga
+        """
+        self.cancelar_carga()
+        # A carga completa inclui o que uma verificação em andamento traria
+        self.cancelar_verificacao_alteracoes()
+        geracao = self._geracao_carga
+        if self._pre_carga is not None:
+            # Primeira carga: a leitura já começou durante o login
+            leitura, self._pre_carga = self._pre_carga, None
+        else:
+            leitura = nucleo.LeituraProjetos("carga-projetos")
+        resultado = leitura.resultado
+        
+        self._ao_concluir_carga = ao_concluir
+        self._verificacao_carga = self.after(INTERVALO_CARGA_MS, self._verificar_carga,
+                                             geracao, resultado, ao_concluir)
+    
+    def _verificar_carga(self, geracao, resultado, ao_concluir):
+        """Aplica o resultado da carga, se já chegou e ainda é o mais recente."""
+        if geracao != self._geracao_carga:
+            return
         try:
-            if USE_SQLITE:
-                self.projetos = db.listar_projetos()
-            else:
-                self.projetos = []  # Fallback vazio - apenas SQLite suportado
-        except Exception as e:
-            messagebox.showerror("Erro", f"Erro ao carregar projetos: {e}")
-            self.projetos = []
+            projetos, seq, erro = resultado.get_nowait()
+        except queue.Empty:
+            self._verificacao_carga = self.after(INTERVALO_CARGA_MS, self._verificar_carga,
+                                                 geracao, resultado, ao_concluir)
+            return
+        
+        self._verificacao_carga = None
+        if erro is not None:
+            messagebox.showerror("Erro", f"Erro ao carregar projetos: {erro}")
+            projetos = []
+        self.catalogo.carregar(projetos)
+        if self.observador and seq is not None:
+            self.observador.sincronizar(seq)
+        self.dados_carregados = True
+        self._recarregar_tudo = False
+        perfil_inicio.marcar(f"dados carregados ({len(projetos)} projetos)")
+        if ao_concluir:
+            ao_concluir()
+    
+    def cancelar_carga(self):
+        """Descarta a carga em andamento (a thread termina, o resultado é ignorado)."""
+        self._geracao_carga += 1
+        if self._verificacao_carga is not None:
+            self.after_cancel(self._verificacao_carga)
+            self._verificacao_carga = None
+    
+    def atualizar_projeto_local(self, projeto_id):
+        """
+        Relê só o projeto alterado e atualiza o catálogo e o que estiver na
+        tela (a tabela ou o dashboard), sem recarregar os demais.
+        
+        Args:
+            projeto_id: ID do projeto criado, alterado ou excluído
+        
+        Returns:
+            O projeto atualizado ou None se ele não existe mais
+        """
+        if self._verificacao_carga is not None:
+            # Uma carga em andamento pode ter lido os dados antes desta
+            # alteração: refazê-la para que não sobrescreva o catálogo
+            self.carregar_dados(self._ao_concluir_carga)
+        # Idem para uma verificação de alterações: ela é descartada (sem
+        # avançar a posição) e os mesmos projetos são relidos na próxima
+        self.cancelar_verificacao_alteracoes()
+        
+        projeto = self.armazenamento.obter_projeto(projeto_id)
+        if projeto is None:
+            self.catalogo.remover(projeto_id)
+        else:
+            self.catalogo.atualizar(projeto)
+        self.reexibir_pagina()
+        return projeto
+    
+    def reexibir_pagina(self):
+        """
+        Atualiza a página visível depois de uma mudança no catálogo; as
+        guardadas são atualizadas quando voltarem à tela (a versão do
+        catálogo mudou).
+        """
+        reexibir = {
+            "dashboard": self.show_dashboard,
+            "projetos": self.show_projetos,
+            "relatorios": self.show_relatorios,
+        }.get(self._pagina_visivel)
+        if reexibir is not None:
+            reexibir()
+    
+    def _verificar_alteracoes(self):
+        """Inicia, em uma thread, a verificação das alterações de outras instâncias."""
+        self._verificacao_alteracoes = self.after(INTERVALO_ALTERACOES_MS, self._verificar_alteracoes)
+        # Uma carga em andamento pode ter lido o banco antes das alterações:
+        # elas ficam para a próxima verificação
+        if (not self.dados_carregados or self._verificacao_carga is not None
+                or self._recebimento_alteracoes is not None):
+            return
+        if self._recarregar_tudo:
+            self.carregar_dados(self.reexibir_pagina)
+            return
+        geracao = self._geracao_alteracoes
+        resultado = queue.Queue(maxsize=1)
+        threading.Thread(target=_ler_alteracoes, args=(self.observador, self.armazenamento, resultado),
+                         name="alteracoes-projetos", daemon=True).start()
+        self._recebimento_alteracoes = self.after(INTERVALO_CARGA_MS, self._receber_alteracoes,
+                                                  geracao, resultado)
+    
+    def _receber_alteracoes(self, geracao, resultado):
+        """
+        Aplica ao catálogo as alterações lidas pela thread e só então avança
+        a posição do observador: se algo falhar, a próxima verificação traz
+        os mesmos projetos.
+        """
+        if geracao != self._geracao_alteracoes:
+            return
+        try:
+            verificacao, projetos, erro = resultado.get_nowait()
+        except queue.Empty:
+            self._recebimento_alteracoes = self.after(INTERVALO_CARGA_MS, self._receber_alteracoes,
+                                                      geracao, resultado)
+            return
+        
+        self._recebimento_alteracoes = None
+        if erro is not None:
+            print(f"Erro ao verificar alterações do banco: {erro}")
+            return
+        if verificacao is None:
+            return
+        if verificacao.ids is None:
+            self._recarregar_tudo = True
+            self.carregar_dados(self.reexibir_pagina)
+            return
+        # As alterações desta janela também aparecem aqui; os projetos já em
+        # dia no catálogo não redesenham nada
+        mudou = False
+        try:
+            for projeto_id, projeto in projetos.items():
+                if projeto is None:
+                    mudou |= self.catalogo.remover(projeto_id) is not None
+                elif projeto != self.catalogo.obter(projeto_id):
+                    self.catalogo.atualizar(projeto)
+                    mudou = True
+            self.observador.confirmar(verificacao)
+        finally:
+            if mudou:
+                self.reexibir_pagina()
+    
+    def cancelar_verificacao_alteracoes(self):
+        """Descarta a verificação em andamento (a posição do observador não avança)."""
+        self._geracao_alteracoes += 1
+        if self._recebimento_alteracoes is not None:
+            self.after_cancel(self._recebimento_alteracoes)
+            self._recebimento_alteracoes = None
     
     def visualizar_projeto_detalhado(self, projeto):
         """Visualiza um projeto em detalhes com possibilidade de gerenciar etapas."""
@@ -1082,19 +1346,17 @@ class ModernDashboard(ttk.Window):
                 return
             
             try:
-                if USE_SQLITE:
-                    db.adicionar_etapa(
-                        projeto_id=projeto['id'],
-                        nome=nome,
-                        descricao=text_desc.get("1.0", "end-1c"),
-                        status=combo_status.get()
-                    )
-                    messagebox.showinfo("Sucesso", "Etapa adicionada com sucesso!", parent=dialog)
-                    dialog.destroy()
-                    self.carregar_dados()
-                    self.visualizar_projeto_detalhado(
-                        next(p for p in self.projetos if p['id'] == projeto['id'])
-                    )
+                self.armazenamento.adicionar_etapa(
+                    projeto['id'],
+                    nome=nome,
+                    descricao=text_desc.get("1.0", "end-1c"),
+                    status=combo_status.get()
+                )
+                messagebox.showinfo("Sucesso", "Etapa adicionada com sucesso!", parent=dialog)
+                dialog.destroy()
+                atualizado = self.atualizar_projeto_local(projeto['id'])
+                if atualizado:
+                    self.visualizar_projeto_detalhado(atualizado)
             except Exception as e:
                 messagebox.showerror("Erro", f"Erro ao adicionar etapa: {e}", parent=dialog)
         
@@ -1165,18 +1427,16 @@ class ModernDashboard(ttk.Window):
                 return
             
             try:
-                if USE_SQLITE:
-                    db.adicionar_participante(
-                        projeto_id=projeto['id'],
-                        nome=nome,
-                        cargo=entry_cargo.get().strip()
-                    )
-                    messagebox.showinfo("Sucesso", "Participante adicionado com sucesso!", parent=dialog)
-                    dialog.destroy()
-                    self.carregar_dados()
-                    self.visualizar_projeto_detalhado(
-                        next(p for p in self.projetos if p['id'] == projeto['id'])
-                    )
+                self.armazenamento.adicionar_participante(
+                    projeto['id'],
+                    nome=nome,
+                    cargo=entry_cargo.get().strip()
+                )
+                messagebox.showinfo("Sucesso", "Participante adicionado com sucesso!", parent=dialog)
+                dialog.destroy()
+                atualizado = self.atualizar_projeto_local(projeto['id'])
+                if atualizado:
+                    self.visualizar_projeto_detalhado(atualizado)
             except Exception as e:
                 messagebox.showerror("Erro", f"Erro ao adicionar participante: {e}", parent=dialog)
         
@@ -1202,10 +1462,10 @@ class ModernDashboard(ttk.Window):
     
     def abrir_editor_projeto(self, projeto):
         """Abre editor de projeto."""
-        self.clear_content()
+        pagina = self.pagina_temporaria("editar")
         
         title = ttk.Label(
-            self.content_area,
+            pagina,
             text=f"Editar: {projeto['nome']}",
             font=("Segoe UI", 28, "bold"),
             bootstyle="inverse"
@@ -1213,7 +1473,7 @@ class ModernDashboard(ttk.Window):
         title.pack(pady=(0, 30))
         
         # Formulário
-        form_frame = ttk.Frame(self.content_area)
+        form_frame = ttk.Frame(pagina)
         form_frame.pack(fill=BOTH, expand=YES, padx=100)
         
         ttk.Label(form_frame, text="Nome do Projeto *", font=("Segoe UI", 11)).pack(anchor=W, pady=(10, 5))
@@ -1256,18 +1516,17 @@ class ModernDashboard(ttk.Window):
                 return
             
             try:
-                if USE_SQLITE:
-                    db.atualizar_projeto(
-                        projeto_id=projeto['id'],
-                        nome=nome,
-                        cliente=cliente,
-                        prazo=prazo,
-                        orcamento=float(entry_orcamento.get()) if entry_orcamento.get() else 0.0,
-                        status=combo_status.get()
-                    )
-                    messagebox.showinfo("Sucesso", "Projeto atualizado!")
-                    self.carregar_dados()
-                    self.show_projetos()
+                self.armazenamento.atualizar_projeto(
+                    projeto['id'],
+                    nome=nome,
+                    cliente=cliente,
+                    prazo=prazo,
+                    orcamento=float(entry_orcamento.get()) if entry_orcamento.get() else 0.0,
+                    status=combo_status.get()
+                )
+                messagebox.showinfo("Sucesso", "Projeto atualizado!")
+                self.atualizar_projeto_local(projeto['id'])
+                self.show_projetos()
             except Exception as e:
                 messagebox.showerror("Erro", f"Erro ao atualizar: {e}")
         
@@ -1281,12 +1540,10 @@ class ModernDashboard(ttk.Window):
         """Confirma exclusão de projeto."""
         if messagebox.askyesno("Confirmar", f"Excluir '{projeto['nome']}'?\n\nEsta ação é irreversível.", parent=dialog_pai):
             try:
-                if USE_SQLITE:
-                    db.excluir_projeto(projeto['id'])
-                    messagebox.showinfo("Sucesso", "Projeto excluído!", parent=dialog_pai)
-                    dialog_pai.destroy()
-                    self.carregar_dados()
-                    self.show_projetos()
+                self.armazenamento.excluir_projeto(projeto['id'])
+                messagebox.showinfo("Sucesso", "Projeto excluído!", parent=dialog_pai)
+                dialog_pai.destroy()
+                self.atualizar_projeto_local(projeto['id'])
             except Exception as e:
                 messagebox.showerror("Erro", f"Erro: {e}", parent=dialog_pai)
     
@@ -1295,114 +1552,37 @@ class ModernDashboard(ttk.Window):
         chart_frame = ttk.Labelframe(parent, text="📊 Status dos Projetos", bootstyle="info")
         chart_frame.pack(side=LEFT, fill=BOTH, expand=YES, padx=(5, 5), pady=5)
         
-        # Contar status
-        status_count = {}
-        for p in self.projetos:
-            status = p.get('status', 'ativo')
-            status_count[status] = status_count.get(status, 0) + 1
-        
-        if not status_count:
+        dados = graficos.dados_status(self.catalogo.metricas())
+        if not dados:
             ttk.Label(chart_frame, text="Sem dados", bootstyle="secondary").pack(expand=YES)
             return
         
-        fig, ax = plt.subplots(figsize=(5, 4), facecolor='#222')
-        
-        colors = {'ativo': '#375a7f', 'concluído': '#00bc8c', 'pausado': '#f39c12', 'cancelado': '#e74c3c'}
-        pie_colors = [colors.get(status, '#95a5a6') for status in status_count.keys()]
-        
-        ax.pie(
-            status_count.values(),
-            labels=[s.capitalize() for s in status_count.keys()],
-            autopct='%1.1f%%',
-            colors=pie_colors,
-            textprops={'color': 'white', 'fontsize': 10}
-        )
-        
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=BOTH, expand=YES)
+        self.exibir_grafico(chart_frame, 'status', dados)
     
     def create_projects_timeline_chart(self, parent):
         """Cria gráfico de timeline de projetos."""
         chart_frame = ttk.Labelframe(parent, text="📅 Projetos por Período", bootstyle="success")
         chart_frame.pack(side=RIGHT, fill=BOTH, expand=YES, padx=(5, 5), pady=5)
         
-        if len(self.projetos) < 2:
+        # Simular dados por trimestre
+        dados = graficos.dados_trimestres(self.catalogo.metricas())
+        if not dados:
             ttk.Label(chart_frame, text="Dados insuficientes", bootstyle="secondary").pack(expand=YES)
             return
         
-        fig, ax = plt.subplots(figsize=(5, 4), facecolor='#222')
-        ax.set_facecolor('#222')
-        
-        # Simular dados por trimestre
-        trimestres = ['Q1', 'Q2', 'Q3', 'Q4']
-        valores = [len(self.projetos) // 4 + i for i in range(4)]
-        
-        ax.plot(trimestres, valores, marker='o', linewidth=2, markersize=8, color='#00bc8c')
-        ax.fill_between(range(len(trimestres)), valores, alpha=0.3, color='#00bc8c')
-        ax.set_ylabel('Projetos', color='white')
-        ax.tick_params(colors='white')
-        ax.spines['bottom'].set_color('white')
-        ax.spines['left'].set_color('white')
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.grid(True, alpha=0.2)
-        
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=BOTH, expand=YES)
+        self.exibir_grafico(chart_frame, 'trimestres', dados)
     
     def create_etapas_chart(self, parent):
         """Cria gráfico de etapas concluídas vs pendentes."""
         chart_frame = ttk.Labelframe(parent, text="📋 Etapas: Concluídas vs Pendentes", bootstyle="warning")
         chart_frame.pack(fill=BOTH, expand=YES, padx=5, pady=5)
         
-        total_etapas = 0
-        concluidas = 0
-        
-        for p in self.projetos:
-            etapas = p.get('etapas', [])
-            total_etapas += len(etapas)
-            concluidas += sum(1 for e in etapas if e.get('status') == 'concluído')
-        
-        pendentes = total_etapas - concluidas
-        
-        if total_etapas == 0:
+        dados = graficos.dados_etapas(self.catalogo.metricas())
+        if not dados:
             ttk.Label(chart_frame, text="Nenhuma etapa cadastrada", bootstyle="secondary").pack(expand=YES)
             return
         
-        fig, ax = plt.subplots(figsize=(10, 3), facecolor='#222')
-        ax.set_facecolor('#222')
-        
-        categorias = ['Concluídas', 'Pendentes']
-        valores = [concluidas, pendentes]
-        cores = ['#00bc8c', '#f39c12']
-        
-        bars = ax.barh(categorias, valores, color=cores)
-        
-        ax.set_xlabel('Quantidade', color='white')
-        ax.tick_params(colors='white')
-        ax.spines['bottom'].set_color('white')
-        ax.spines['left'].set_color('white')
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        
-        # Adicionar valores
-        for bar, valor in zip(bars, valores):
-            width = bar.get_width()
-            ax.text(width + 0.5, bar.get_y() + bar.get_height()/2,
-                   f'{valor} ({valor/total_etapas*100:.1f}%)',
-                   ha='left', va='center', color='white', fontweight='bold')
-        
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=BOTH, expand=YES)
+        self.exibir_grafico(chart_frame, 'etapas', dados)
     
     def exportar_csv(self):
         """Exporta projetos para CSV."""
@@ -1461,16 +1641,11 @@ class ModernDashboard(ttk.Window):
             pdf.ln(2)
             
             pdf.set_font("Arial", "", 11)
-            pdf.cell(0, 8, f"Total de Projetos: {len(self.projetos)}", ln=True)
-            
-            ativos = sum(1 for p in self.projetos if p.get('status') == 'ativo')
-            pdf.cell(0, 8, f"Projetos Ativos: {ativos}", ln=True)
-            
-            concluidos = sum(1 for p in self.projetos if p.get('status') == 'concluído')
-            pdf.cell(0, 8, f"Projetos Concluídos: {concluidos}", ln=True)
-            
-            total_etapas = sum(len(p.get('etapas', [])) for p in self.projetos)
-            pdf.cell(0, 8, f"Total de Etapas: {total_etapas}", ln=True)
+            metricas = self.catalogo.metricas()
+            pdf.cell(0, 8, f"Total de Projetos: {metricas.total_projetos}", ln=True)
+            pdf.cell(0, 8, f"Projetos Ativos: {metricas.projetos_com_status('ativo')}", ln=True)
+            pdf.cell(0, 8, f"Projetos Concluídos: {metricas.projetos_com_status('concluído')}", ln=True)
+            pdf.cell(0, 8, f"Total de Etapas: {metricas.total_etapas}", ln=True)
             pdf.ln(10)
             
             # Lista de projetos
@@ -1507,9 +1682,25 @@ class ModernDashboard(ttk.Window):
     def sair(self):
         """Fecha o aplicativo."""
         if messagebox.askyesno("Confirmar", "Deseja realmente sair?"):
-            self.destroy()
+            self.encerrar()
+    
+    def encerrar(self):
+        """Para as tarefas em segundo plano e fecha o aplicativo (a janela principal)."""
+        self.cancelar_carga()
+        if self._verificacao_graficos is not None:
+            self.after_cancel(self._verificacao_graficos)
+        self.renderizador.encerrar()
+        if self._verificacao_alteracoes is not None:
+            self.after_cancel(self._verificacao_alteracoes)
+        self.cancelar_verificacao_alteracoes()
+        if self.observador:
+            self.observador.parar()
+        if self.manutencao:
+            self.manutencao.parar()
+        self.master.destroy()
 
 
 if __name__ == "__main__":
-    app = ModernDashboard()
+    # A leitura dos projetos corre enquanto a janela é montada
+    app = ModernDashboard(pre_carga=nucleo.LeituraProjetos("pre-carga-projetos"))
     app.mainloop()